@@ -0,0 +1,118 @@
+"""
+행동 트리 런타임 비교 도구: 노드 객체 트리(기존 tick) vs compile_tree() 평면 런타임.
+
+    python bt_benchmark.py            # 둘 다 실행
+    python bt_benchmark.py bench      # 봇 100명 x 600프레임, 프레임당 tick 시간 (steady/random)
+    python bt_benchmark.py trace      # 시드 30개 x 봇 6명 x 300틱, 호출 순서/결과 비교
+
+트리 모양은 Dummy._build_behavior_tree()에서 그대로 가져오고 콜백만 가짜로 바꾼다.
+조건 값/액션 결과는 틱마다 시드로 미리 뽑아 두므로 두 런타임이 같은 입력을 본다.
+액션은 BTState만 반환한다 (기존 Sequence는 문자열 결과를 삼켰으므로 비교 대상이 아님).
+"""
+import sys
+import time
+import random
+
+from entities.npc import Dummy
+from systems.behavior_tree import BTState, Action, Composite, Condition, compile_tree
+
+ROLES = ("POLICE", "MAFIA", "CITIZEN")
+ACTION_RESULTS = (BTState.RUNNING, BTState.SUCCESS, BTState.FAILURE)
+ACTION_WEIGHTS = (80, 15, 5)
+FLIP_CHANCE = 0.05  # 틱마다 조건 값이 바뀔 확률
+
+class FakeBot:
+    """Dummy 대신 트리를 만드는 객체. 메서드 이름마다 values[이름]을 돌려주는 콜백을 만든다."""
+    def __init__(self, role, log=None):
+        self.role = role
+        self.values = {}
+        self.log = log  # trace 모드: [(이름, 값)] 호출 기록
+        self.conds, self.actions = [], []
+        self._callbacks = {}
+        self.tree = Dummy._build_behavior_tree(self)
+        self._collect(self.tree)
+
+    def __getattr__(self, name):
+        if name.startswith('_'): raise AttributeError(name)
+        cb = self._callbacks.get(name)
+        if cb is None:
+            values, log = self.values, self.log
+            if log is None:
+                def cb(entity, bb): return values[name]
+            else:
+                def cb(entity, bb):
+                    v = values[name]; log.append((name, v)); return v
+            self._callbacks[name] = cb
+        return cb
+
+    def _collect(self, node):
+        if isinstance(node, Composite):
+            for c in node.children: self._collect(c)
+            return
+        names = {cb: n for n, cb in self._callbacks.items()}
+        if isinstance(node, Condition): self.conds.append(names[node.condition_func])
+        elif isinstance(node, Action): self.actions.append(names[node.action_func])
+
+    def roll(self, rng):
+        """이번 틱의 조건 값(가끔 뒤집힘)과 액션 결과를 뽑는다"""
+        values = self.values
+        for name in self.conds:
+            if name not in values or rng.random() < FLIP_CHANCE: values[name] = rng.random() < 0.5
+        for name in self.actions:
+            values[name] = rng.choices(ACTION_RESULTS, ACTION_WEIGHTS)[0]
+
+def bench(bots=100, frames=600, seed=1):
+    """
+    steady: 조건 전부 거짓 + 액션 계속 RUNNING (no-op 콜백, 가장 흔한 '이동 중' 상태)
+    random: roll()로 조건이 가끔 뒤집히고 액션 결과가 섞이는 경우
+    """
+    results = {}
+    for scenario in ("steady", "random"):
+        for label in ("legacy", "compiled"):
+            rng = random.Random(seed)
+            fakes = [FakeBot(ROLES[i % len(ROLES)]) for i in range(bots)]
+            for f in fakes:
+                f.values.update(dict.fromkeys(f.conds, False)); f.values.update(dict.fromkeys(f.actions, BTState.RUNNING))
+            trees = [f.tree if label == "legacy" else compile_tree(f.tree) for f in fakes]
+            bb = {}
+            elapsed = 0.0
+            for _ in range(frames):
+                if scenario == "random":
+                    for f in fakes: f.roll(rng)
+                t0 = time.perf_counter()
+                for f, tree in zip(fakes, trees): tree.tick(f, bb)
+                elapsed += time.perf_counter() - t0
+            results[scenario, label] = ms = elapsed / frames * 1000
+            print(f"[BT bench] {scenario:6s} {label:8s} {bots} bots x {frames} frames: {ms:.3f} ms/frame")
+        print(f"[BT bench] {scenario:6s} speedup x{results[scenario, 'legacy'] / results[scenario, 'compiled']:.2f}")
+    return results
+
+def trace(seeds=30, bots=6, ticks=300):
+    mismatches = 0
+    for seed in range(seeds):
+        runs = []
+        for label in ("legacy", "compiled"):
+            rng = random.Random(seed)
+            log = []
+            fakes = [FakeBot(ROLES[i % len(ROLES)], log) for i in range(bots)]
+            trees = [f.tree if label == "legacy" else compile_tree(f.tree) for f in fakes]
+            bb = {}
+            for t in range(ticks):
+                for i, (f, tree) in enumerate(zip(fakes, trees)):
+                    f.roll(rng)
+                    log.append(("tick", t, i))
+                    log.append(("status", int(tree.tick(f, bb))))
+            runs.append(log)
+        if runs[0] != runs[1]:
+            mismatches += 1
+            first = next((k for k, (a, b) in enumerate(zip(*runs)) if a != b), min(map(len, runs)))
+            print(f"[BT trace] seed {seed}: diverged at log entry {first}: {runs[0][first:first + 1]} vs {runs[1][first:first + 1]}")
+    print(f"[BT trace] {seeds} seeds x {bots} bots x {ticks} ticks: {seeds - mismatches}/{seeds} identical call logs")
+    return mismatches == 0
+
+if __name__ == "__main__":
+    mode = sys.argv[1] if len(sys.argv) > 1 else "all"
+    ok = True
+    if mode in ("bench", "all"): bench()
+    if mode in ("trace", "all"): ok = trace()
+    sys.exit(0 if ok else 1)
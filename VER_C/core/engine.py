@@ -3,6 +3,7 @@ import sys
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 from core.state_machine import StateMachine
 from systems.logger import GameLogger
+from managers.asset_cache import AssetCache
 
 class GameEngine:
     def __init__(self):
@@ -61,5 +62,6 @@ class GameEngine:
 
     def quit(self):
         self.logger.info("SYSTEM", "Engine Shutting Down")
+        AssetCache.shutdown()
         pygame.quit()
         sys.exit()
@@ -0,0 +1,157 @@
+import math
+import pygame
+from settings import TILE_SIZE
+from colors import COLORS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BULLET_SPEED = 12    # px / 프레임
+BULLET_RADIUS = 4    # 그리기 반경
+BULLET_HALF = 2      # 판정 크기 (4x4)
+BULLET_DAMAGE = 70
+ENEMY_COLOR = (255, 100, 100)
+
+class ProjectileSystem:
+    """
+    [최적화] GameWorld가 소유하는 탄환 시스템 (구조체 배열: 위치/속도/적 탄환 여부).
+    - 이동/맵 밖 판정은 numpy로 일괄 처리 (numpy 없으면 리스트 루프)
+    - 벽 판정은 이번 프레임 이동 선분을 충돌 맵 위에서 DDA로 따라가므로 얇은 벽/저FPS에서도 관통 없음
+    - 엔티티 판정은 선분 범위만 공간 색인으로 조회해 선분-사각형 교차 (가장 먼저 닿는 대상)
+    - 플레이어 탄환은 NPC만, 적(NPC 경찰) 탄환은 플레이어만 맞힘
+    """
+    def __init__(self, world, capacity=32):
+        self.world = world
+        self.n = 0
+        self._alloc(capacity)
+        self.stats = {'fired': 0, 'wall_hits': 0, 'entity_hits': 0}
+
+    def _alloc(self, capacity):
+        if np is not None:
+            self.x = np.zeros(capacity); self.y = np.zeros(capacity)
+            self.vx = np.zeros(capacity); self.vy = np.zeros(capacity)
+            self.enemy = np.zeros(capacity, dtype=bool)
+        else:
+            self.x, self.y, self.vx, self.vy = [0.0] * capacity, [0.0] * capacity, [0.0] * capacity, [0.0] * capacity
+            self.enemy = [False] * capacity
+        self.capacity = capacity
+
+    def _grow(self):
+        old = (self.x, self.y, self.vx, self.vy, self.enemy); n = self.n
+        self._alloc(self.capacity * 2)
+        for dst, src in zip((self.x, self.y, self.vx, self.vy, self.enemy), old): dst[:n] = src[:n]
+
+    def fire(self, x, y, angle, is_enemy=False, speed=BULLET_SPEED):
+        if self.n >= self.capacity: self._grow()
+        i = self.n
+        self.x[i], self.y[i] = x, y
+        self.vx[i], self.vy[i] = math.cos(angle) * speed, math.sin(angle) * speed
+        self.enemy[i] = is_enemy
+        self.n += 1; self.stats['fired'] += 1
+
+    def clear(self): self.n = 0
+    def __len__(self): return self.n
+
+    def update(self):
+        n = self.n
+        if not n: return
+        mm = self.world.map_manager
+        map_w, map_h = mm.width * TILE_SIZE, mm.height * TILE_SIZE
+
+        # 1. 이동 전/후 좌표 (일괄)
+        if np is not None:
+            x0, y0 = self.x[:n].copy(), self.y[:n].copy()
+            self.x[:n] += self.vx[:n]; self.y[:n] += self.vy[:n]
+            x1, y1 = self.x[:n], self.y[:n]
+            inside = ((x1 >= 0) & (x1 <= map_w) & (y1 >= 0) & (y1 <= map_h)).tolist()
+            x0, y0, x1, y1 = x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()
+            enemy = self.enemy[:n].tolist()
+        else:
+            x0, y0 = self.x[:n], self.y[:n]
+            x1 = [a + b for a, b in zip(x0, self.vx[:n])]; y1 = [a + b for a, b in zip(y0, self.vy[:n])]
+            self.x[:n], self.y[:n] = x1, y1
+            inside = [0 <= a <= map_w and 0 <= b <= map_h for a, b in zip(x1, y1)]
+            enemy = self.enemy[:n]
+
+        # 2. 선분 단위 벽/엔티티 판정 (탄환 수는 적음)
+        keep = []
+        for i in range(n):
+            if not inside[i]: continue
+            sx, sy, dx, dy = x0[i], y0[i], x1[i] - x0[i], y1[i] - y0[i]
+            t_wall = self._sweep_walls(mm, sx, sy, dx, dy)
+            t_hit, target = self._sweep_entities(sx, sy, dx, dy, enemy[i], t_wall)
+            if target is not None:
+                target.take_damage(BULLET_DAMAGE); self.stats['entity_hits'] += 1
+                continue
+            if t_wall is not None: self.stats['wall_hits'] += 1; continue
+            keep.append(i)
+
+        # 3. 살아남은 탄환만 앞으로 모음
+        if len(keep) != n:
+            if np is not None:
+                idx = np.array(keep, dtype=np.intp)
+                for arr in (self.x, self.y, self.vx, self.vy, self.enemy): arr[:len(keep)] = arr[idx]
+            else:
+                for arr in (self.x, self.y, self.vx, self.vy, self.enemy): arr[:len(keep)] = [arr[j] for j in keep]
+            self.n = len(keep)
+
+    def _sweep_walls(self, mm, x0, y0, dx, dy):
+        """선분 (x0, y0) -> (x0+dx, y0+dy)가 처음 들어가는 막힌 칸의 t (0~1). 시작 칸은 제외. 없으면 None"""
+        grid = mm.collision_grid
+        blocked = grid.is_blocked if grid is not None else mm.check_any_collision
+        gx, gy = int(x0 // TILE_SIZE), int(y0 // TILE_SIZE)
+        ex, ey = int((x0 + dx) // TILE_SIZE), int((y0 + dy) // TILE_SIZE)
+        step_x = 1 if dx > 0 else -1; step_y = 1 if dy > 0 else -1
+        t_dx = TILE_SIZE / abs(dx) if dx else math.inf
+        t_dy = TILE_SIZE / abs(dy) if dy else math.inf
+        t_x = ((gx + (dx > 0)) * TILE_SIZE - x0) / dx if dx else math.inf
+        t_y = ((gy + (dy > 0)) * TILE_SIZE - y0) / dy if dy else math.inf
+        for _ in range(abs(ex - gx) + abs(ey - gy)):
+            if t_x < t_y: gx += step_x; t = t_x; t_x += t_dx
+            else: gy += step_y; t = t_y; t_y += t_dy
+            if t > 1.0: break
+            if blocked(gx, gy): return max(t, 0.0)
+        return None
+
+    def _sweep_entities(self, x0, y0, dx, dy, is_enemy, t_limit):
+        """선분이 t_limit(벽) 전에 가장 먼저 닿는 대상 (t, entity). 없으면 (None, None)"""
+        world = self.world
+        player = world.player
+        if is_enemy: candidates = [player] if player is not None and player.alive else []
+        elif world.spatial_grid:
+            area = pygame.Rect(min(x0, x0 + dx) - BULLET_HALF, min(y0, y0 + dy) - BULLET_HALF,
+                               abs(dx) + 2 * BULLET_HALF + 1, abs(dy) + 2 * BULLET_HALF + 1)
+            candidates = [e for e in world.spatial_grid.query_rect(area, alive_only=True) if e is not player]
+        else: candidates = [e for e in world.npcs if e.alive]
+
+        best_t = t_limit if t_limit is not None else math.inf
+        best = None
+        for e in candidates:
+            r = e.rect
+            t = _segment_box(x0, y0, dx, dy, r.left - BULLET_HALF, r.top - BULLET_HALF, r.right + BULLET_HALF, r.bottom + BULLET_HALF)
+            if t is not None and t < best_t: best_t, best = t, e
+        return (best_t, best) if best is not None else (None, None)
+
+    def draw(self, screen, camera_x, camera_y):
+        if not self.n: return
+        view = screen.get_rect()
+        for i in range(self.n):
+            pos = (int(self.x[i] - camera_x), int(self.y[i] - camera_y))
+            if not view.collidepoint(pos): continue
+            pygame.draw.circle(screen, ENEMY_COLOR if self.enemy[i] else COLORS['BULLET'], pos, BULLET_RADIUS)
+
+def _segment_box(x0, y0, dx, dy, left, top, right, bottom):
+    """선분-사각형(경계 미포함) 교차 시작 t (0~1), 없으면 None (슬랩 방식)"""
+    t0, t1 = 0.0, 1.0
+    for p, d, lo, hi in ((x0, dx, left, right), (y0, dy, top, bottom)):
+        if d == 0:
+            if not (lo < p < hi): return None
+            continue
+        a, b = (lo - p) / d, (hi - p) / d
+        if a > b: a, b = b, a
+        if a > t0: t0 = a
+        if b < t1: t1 = b
+        if t0 >= t1: return None
+    return t0
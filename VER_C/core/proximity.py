@@ -0,0 +1,97 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 엔티티가 적으면 numpy 호출 오버헤드가 더 커서 순수 파이썬 경로 사용
+VECTOR_MIN_ENTITIES = 32
+
+class ProximityTable:
+    """
+    [최적화] 틱마다 한 번 만드는 엔티티 간 거리 테이블.
+    AI 스캔/감정/불안 체크가 각자 전체 엔티티를 돌며 sqrt를 계산하던 것을 공유 조회로 대체.
+    numpy가 있으면 중심 좌표 배열에서 쌍별 거리 제곱 행렬을 (처음 조회될 때) 한 번에 계산한다.
+    """
+    def __init__(self):
+        self.entities = []
+        self.index = {}        # {id(entity): row}
+        self.xs, self.ys, self.roles = [], [], []
+        self._vec = False      # numpy 경로 사용 여부
+        self._d2 = None        # numpy 쌍별 거리 제곱 행렬 (지연 생성)
+        self._role_masks = {}  # {roles tuple: bool 배열}
+
+    def rebuild(self, entities):
+        ents = [e for e in entities if e is not None]
+        self.entities = ents
+        self.index = {id(e): i for i, e in enumerate(ents)}
+        self.xs = [e.rect.centerx for e in ents]
+        self.ys = [e.rect.centery for e in ents]
+        self.roles = [e.role for e in ents]
+        self._d2 = None
+        self._role_masks.clear()
+        self._vec = np is not None and len(ents) >= VECTOR_MIN_ENTITIES
+        if self._vec:
+            self._xa = np.array(self.xs, dtype=np.float64)
+            self._ya = np.array(self.ys, dtype=np.float64)
+
+    def _role_mask(self, roles, exclude):
+        key = (tuple(roles) if roles else None, exclude)
+        mask = self._role_masks.get(key)
+        if mask is None:
+            if roles: mask = np.array([(r in roles) != exclude for r in self.roles], dtype=bool)
+            else: mask = np.ones(len(self.roles), dtype=bool)
+            self._role_masks[key] = mask
+        return mask
+
+    def _row(self, entity):
+        """entity 기준 거리 제곱 배열 (테이블에 없는 엔티티는 즉석 계산)"""
+        i = self.index.get(id(entity), -1)
+        if i < 0:
+            return (self._xa - entity.rect.centerx) ** 2 + (self._ya - entity.rect.centery) ** 2, i
+        if self._d2 is None:
+            dx = self._xa[:, None] - self._xa[None, :]
+            dy = self._ya[:, None] - self._ya[None, :]
+            self._d2 = dx * dx + dy * dy
+        return self._d2[i], i
+
+    def within(self, entity, radius, roles=None, exclude_roles=None):
+        """radius(px) 안의 살아있는 다른 엔티티를 가까운 순으로 [(dist, entity)] 반환"""
+        if not self.entities: return []
+        r2 = radius * radius
+        if self._vec:
+            d2, i = self._row(entity)
+            mask = d2 <= r2
+            if roles: mask &= self._role_mask(roles, False)
+            if exclude_roles: mask &= self._role_mask(exclude_roles, True)
+            if i >= 0: mask[i] = False
+            idx = np.flatnonzero(mask)
+            idx = idx[np.argsort(d2[idx], kind='stable')]
+            ents = self.entities
+            return [(float(d), ents[j]) for d, j in zip(np.sqrt(d2[idx]), idx.tolist()) if ents[j].alive]
+
+        x, y = entity.rect.centerx, entity.rect.centery
+        out = []
+        for e, ex, ey, role in zip(self.entities, self.xs, self.ys, self.roles):
+            if e is entity or not e.alive: continue
+            if roles and role not in roles: continue
+            if exclude_roles and role in exclude_roles: continue
+            d2 = (ex - x) ** 2 + (ey - y) ** 2
+            if d2 <= r2: out.append((d2 ** 0.5, e))
+        out.sort(key=lambda t: t[0])
+        return out
+
+    def nearest(self, entity, roles=None, max_dist=float('inf')):
+        """가장 가까운 살아있는 엔티티 (dist, entity). 없으면 (inf, None)"""
+        if not self.entities: return float('inf'), None
+        if self._vec:
+            d2, i = self._row(entity)
+            mask = self._role_mask(roles, False).copy()
+            if i >= 0: mask[i] = False
+            for j in np.flatnonzero(mask)[np.argsort(d2[mask], kind='stable')].tolist():
+                d = float(d2[j]) ** 0.5
+                if d > max_dist: break
+                if self.entities[j].alive: return d, self.entities[j]
+            return float('inf'), None
+
+        found = self.within(entity, max_dist, roles)
+        return found[0] if found else (float('inf'), None)
@@ -0,0 +1,51 @@
+import heapq
+import itertools
+
+class TimerQueue:
+    """
+    [최적화] 만료 시각 순 힙으로 관리하는 타이머 스케줄러.
+    매 프레임 모든 문/쿨다운/이벤트를 검사하던 것을 '이번 프레임에 만료된 타이머'만 처리하도록 대체.
+    - key가 같은 타이머를 다시 예약하면 이전 것은 자동 취소 (힙에서는 꺼낼 때 지연 삭제)
+    - 콜백이 숫자(ms)를 반환하면 그만큼 뒤로 재예약 (예: 문 앞에 사람이 있으면 잠시 후 재시도)
+    """
+    def __init__(self):
+        self.heap = []     # [(due, seq, key, callback)]
+        self.active = {}   # {key: seq} 유효한 예약 (취소/재예약된 힙 항목 판별용)
+        self._seq = itertools.count()
+        self.fired = 0
+
+    def schedule(self, due, callback, key=None):
+        """due(ms, pygame ticks)에 callback(now) 호출. key를 주면 같은 key의 기존 예약을 대체"""
+        seq = next(self._seq)
+        if key is None: key = ('anon', seq)
+        self.active[key] = seq
+        heapq.heappush(self.heap, (due, seq, key, callback))
+        return key
+
+    def cancel(self, key):
+        return self.active.pop(key, None) is not None
+
+    def is_pending(self, key): return key in self.active
+
+    def clear(self):
+        self.heap = []; self.active.clear()
+
+    def run(self, now):
+        """now까지 만료된 타이머 실행. 실행한 개수 반환"""
+        heap, active = self.heap, self.active
+        count = 0
+        while heap and heap[0][0] <= now:
+            due, seq, key, callback = heapq.heappop(heap)
+            if active.get(key) != seq: continue  # 취소/재예약된 항목
+            del active[key]
+            retry = callback(now)
+            if retry and key not in active: self.schedule(now + retry, callback, key)
+            count += 1
+        self.fired += count
+        # 취소된 항목이 많이 쌓이면 힙 정리
+        if len(heap) > 64 and len(heap) > 4 * len(active):
+            self.heap = [t for t in heap if active.get(t[2]) == t[1]]
+            heapq.heapify(self.heap)
+        return count
+
+    def __len__(self): return len(self.active)
@@ -5,82 +5,92 @@ class SpatialGrid:
         self.map_width = map_width
         self.map_height = map_height
         self.cell_size = cell_size # in Tiles
-        
+        self.cell_px = cell_size * TILE_SIZE
+
         # Grid dimensions
         self.cols = (map_width // cell_size) + 1
         self.rows = (map_height // cell_size) + 1
-        
-        # The Grid: A dictionary or list of sets
-        # using dict for sparse efficiency {(gx, gy): {entity_uid, ...}}
-        self.cells = {}
-        
-        # Tracking where each entity is: {entity_uid: (gx, gy)}
+
+        # [최적화] 평면 리스트 버킷: cells[cy * cols + cx] = [entity, ...]
+        # (UUID 문자열 대신 엔티티 참조를 직접 저장 -> entities_by_id 재조회 불필요)
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+
+        # Tracking where each entity is: {entity: cell_index}
         self.entity_locations = {}
 
-    def _get_cell_coords(self, tx, ty):
-        return int(tx // self.cell_size), int(ty // self.cell_size)
+    def _cell_index(self, px, py):
+        cx = min(max(int(px // self.cell_px), 0), self.cols - 1)
+        cy = min(max(int(py // self.cell_px), 0), self.rows - 1)
+        return cy * self.cols + cx
 
     def add(self, entity):
-        if not hasattr(entity, 'uid'): return
-        
-        tx, ty = entity.rect.centerx // TILE_SIZE, entity.rect.centery // TILE_SIZE
-        gx, gy = self._get_cell_coords(tx, ty)
-        
-        if (gx, gy) not in self.cells:
-            self.cells[(gx, gy)] = set()
-            
-        self.cells[(gx, gy)].add(entity.uid)
-        self.entity_locations[entity.uid] = (gx, gy)
+        idx = self._cell_index(entity.rect.centerx, entity.rect.centery)
+        self.cells[idx].append(entity)
+        self.entity_locations[entity] = idx
 
     def remove(self, entity):
-        if not hasattr(entity, 'uid'): return
-        if entity.uid not in self.entity_locations: return
-        
-        gx, gy = self.entity_locations.pop(entity.uid)
-        if (gx, gy) in self.cells:
-            if entity.uid in self.cells[(gx, gy)]:
-                self.cells[(gx, gy)].remove(entity.uid)
-                # Cleanup empty cells to save memory (optional)
-                if not self.cells[(gx, gy)]:
-                    del self.cells[(gx, gy)]
+        idx = self.entity_locations.pop(entity, None)
+        if idx is None: return
+        bucket = self.cells[idx]
+        # 순서 무관 버킷: 마지막 원소와 교체 후 pop
+        i = bucket.index(entity)
+        bucket[i] = bucket[-1]; bucket.pop()
 
     def update_entity(self, entity):
         """Call this when entity moves"""
-        if not hasattr(entity, 'uid'): return
-        
-        tx, ty = entity.rect.centerx // TILE_SIZE, entity.rect.centery // TILE_SIZE
-        new_gx, new_gy = self._get_cell_coords(tx, ty)
-        
-        old_loc = self.entity_locations.get(entity.uid)
-        
+        old_idx = self.entity_locations.get(entity)
+        new_idx = self._cell_index(entity.rect.centerx, entity.rect.centery)
+
         # Only update if cell changed
-        if old_loc != (new_gx, new_gy):
+        if old_idx != new_idx:
             self.remove(entity) # Remove from old
             self.add(entity)    # Add to new
 
-    def get_nearby_entities(self, entity, radius_tiles=None):
-        """Returns a set of entity UIDs in adjacent cells"""
-        if not hasattr(entity, 'uid'): return set()
-        
-        tx, ty = entity.rect.centerx // TILE_SIZE, entity.rect.centery // TILE_SIZE
-        gx, gy = self._get_cell_coords(tx, ty)
-        
-        # Determine search range (default: 3x3 grid around entity)
-        # If radius is large, we might need to search more cells
-        search_radius = 1
-        if radius_tiles:
-            search_radius = int((radius_tiles / self.cell_size) + 1)
-            
-        nearby_uids = set()
-        
-        for dy in range(-search_radius, search_radius + 1):
-            for dx in range(-search_radius, search_radius + 1):
-                cell_key = (gx + dx, gy + dy)
-                if cell_key in self.cells:
-                    nearby_uids.update(self.cells[cell_key])
-                    
-        # Exclude self
-        if entity.uid in nearby_uids:
-            nearby_uids.remove(entity.uid)
-            
-        return nearby_uids
+    def rebuild_from(self, entities, xs, ys):
+        """
+        [최적화] 틱마다 전체 위치를 일괄 반영. 중심 좌표는 ProximityTable.rebuild가 모은 xs/ys를 그대로 쓴다.
+        등록된 엔티티 집합이 같으면 셀이 바뀐 엔티티만 옮기고, 다르면 버킷을 통째로 재생성한다.
+        """
+        cell_px, cols, rows = self.cell_px, self.cols, self.rows
+        locations = self.entity_locations
+
+        if len(entities) == len(locations) and all(e in locations for e in entities):
+            cells = self.cells
+            for e, x, y in zip(entities, xs, ys):
+                cx = x // cell_px; cy = y // cell_px
+                if not (0 <= cx < cols and 0 <= cy < rows): idx = self._cell_index(x, y)
+                else: idx = cy * cols + cx
+                old = locations[e]
+                if old != idx:
+                    bucket = cells[old]; i = bucket.index(e)
+                    bucket[i] = bucket[-1]; bucket.pop()
+                    cells[idx].append(e); locations[e] = idx
+            return
+
+        cells = [[] for _ in range(cols * rows)]
+        locations = {}
+        for e, x, y in zip(entities, xs, ys):
+            idx = self._cell_index(x, y)
+            cells[idx].append(e); locations[e] = idx
+        self.cells = cells
+        self.entity_locations = locations
+
+    def _cell_range(self, x0, y0, x1, y1):
+        cx0 = max(int(x0 // self.cell_px), 0); cx1 = min(int(x1 // self.cell_px), self.cols - 1)
+        cy0 = max(int(y0 // self.cell_px), 0); cy1 = min(int(y1 // self.cell_px), self.rows - 1)
+        return cx0, cy0, cx1, cy1
+
+    def query_rect(self, rect, alive_only=False):
+        """픽셀 사각형(뷰포트 등)과 겹치는 엔티티 목록"""
+        # 엔티티 rect가 셀 경계를 넘을 수 있으므로 한 셀 여유
+        cx0, cy0, cx1, cy1 = self._cell_range(rect.left - self.cell_px, rect.top - self.cell_px,
+                                              rect.right + self.cell_px, rect.bottom + self.cell_px)
+        cols, cells = self.cols, self.cells
+        out = []
+        for cy in range(cy0, cy1 + 1):
+            row = cy * cols
+            for cx in range(cx0, cx1 + 1):
+                for e in cells[row + cx]:
+                    if alive_only and not e.alive: continue
+                    if rect.colliderect(e.rect): out.append(e)
+        return out
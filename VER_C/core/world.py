@@ -5,6 +5,12 @@ from entities.player import Player
 from entities.npc import Dummy
 from settings import TILE_SIZE, ZONES
 from core.spatial_grid import SpatialGrid
+from core.proximity import ProximityTable
+from core.scheduler import TimerQueue
+from core.projectiles import ProjectileSystem
+from systems.fov import FOV
+from systems.visibility import VisibilityService
+from systems.effects import VisualSound
 
 class GameWorld:
     def __init__(self, game):
@@ -14,15 +20,29 @@ class GameWorld:
         # [Spatial Partitioning]
         # Map dimensions are loaded later, so init with defaults, resize later if needed
         self.spatial_grid = None
+
+        # [Visibility] FOV engine + cached per-NPC line of sight (created in load_map)
+        self.fov = None
+        self.visibility = None
+
+        # [Proximity] Per-tick distance table shared by AI scans / emotions
+        self.proximity = ProximityTable()
+
+        # [Timers] 문 자동 닫기/타일 쿨다운/정전·사이렌/발자국 만료를 만료 시각 순으로 처리
+        self.timers = TimerQueue()
+        self.map_manager.timers = self.timers
+        self.map_manager.occupied = self.is_area_occupied
         
         # [Entity Management]
         self.player = None
         self.npcs = []
-        self.bullets = []
+        self.projectiles = ProjectileSystem(self)  # 플레이어/NPC 경찰 탄환 공용
         
         # {uid: entity_obj} for fast lookup
         self.entities_by_id = {} 
         
+        self.pending_moves = []  # [(entity, dx, dy)] 이번 프레임 NPC 이동 (flush_moves에서 일괄 처리)
+
         self.effects = []
         self.indicators = []
         self.noise_list = []
@@ -36,13 +56,15 @@ class GameWorld:
         self.has_murder_occurred = False
 
     def load_map(self, filename="map.json"):
+        self.timers.clear()
         self.map_manager.load_map(filename)
         # Initialize Spatial Grid with correct map size
         self.spatial_grid = SpatialGrid(self.map_manager.width, self.map_manager.height, cell_size=10)
+        self.fov = FOV(self.map_manager.width, self.map_manager.height, self.map_manager)
+        self.visibility = VisibilityService(self.map_manager, self.fov)
 
     def find_safe_spawn(self):
-        c = self.map_manager.get_spawn_points(zone_id=1)
-        return random.choice(c) if c else (100, 100)
+        return self.map_manager.sample_spawn_point(zone_id=1) or (100, 100)
 
     def register_entity(self, entity):
         # Assign UUID if not present (simple integer ID for now for performance, or uuid4)
@@ -107,34 +129,69 @@ class GameWorld:
     def update(self, dt, current_phase, weather, day_count):
         # Update Event Timers
         now = pygame.time.get_ticks()
-        
-        if self.is_blackout and now > self.blackout_timer: self.is_blackout = False
-        if self.is_mafia_frozen and now > self.frozen_timer: self.is_mafia_frozen = False
 
-        self.map_manager.update_doors(dt, [self.player] + self.npcs)
-        
-        # Bloody Footsteps cleanup
-        self.bloody_footsteps = [bf for bf in self.bloody_footsteps if now < bf[2]]
+        # 거리/반경 질의는 ProximityTable, 사각형(뷰포트/문/총알) 질의는 SpatialGrid. 중심 좌표 수집은 한 번만
+        prox = self.proximity
+        prox.rebuild([self.player] + self.npcs)
+        if self.spatial_grid: self.spatial_grid.rebuild_from(prox.entities, prox.xs, prox.ys)
+
+        # [최적화] 만료된 타이머만 실행 (문 점유 확인은 해당 문 주변만 공간 색인으로)
+        self.timers.run(now)
+        self.projectiles.update()
 
         # Effects & Indicators cleanup
-        for e in self.effects[:]: e.update()
-        self.effects = [e for e in self.effects if e.alive]
+        for e in self.effects: e.update()
+        alive = []
+        for e in self.effects:
+            if e.alive: alive.append(e)
+            elif isinstance(e, VisualSound): VisualSound.release(e) # 풀로 반환
+        self.effects = alive
         
         for i in self.indicators[:]: 
             i.update()
             if not i.alive: self.indicators.remove(i)
 
-    def get_nearby_entities(self, entity, radius_tiles=None):
-        """Proxy to spatial grid"""
-        if not self.spatial_grid: return []
-        
-        uids = self.spatial_grid.get_nearby_entities(entity, radius_tiles)
-        entities = []
-        for uid in uids:
-            if uid in self.entities_by_id:
-                ent = self.entities_by_id[uid]
-                if ent.alive: # Only return alive entities
-                    entities.append(ent)
-        return entities
+    def queue_move(self, entity, dx, dy):
+        self.pending_moves.append((entity, dx, dy))
+
+    def flush_moves(self):
+        """[최적화] 모아 둔 NPC 이동을 비트 패킹 충돌 맵으로 한 번에 처리하고 공간 색인 갱신"""
+        moves = self.pending_moves
+        if not moves: return
+        self.pending_moves = []
+        grid = self.map_manager.collision_grid
+        if grid is not None: grid.move_batch(moves)
+        else:
+            for e, dx, dy in moves: e.move_single_axis(dx, 0); e.move_single_axis(0, dy)
+        if self.spatial_grid:
+            for e, _, _ in moves: self.spatial_grid.update_entity(e)
+
+    def start_blackout(self, duration_ms=10000):
+        self.is_blackout = True
+        self.blackout_timer = pygame.time.get_ticks() + duration_ms
+        self.timers.schedule(self.blackout_timer, self._end_blackout, key='blackout')
+
+    def _end_blackout(self, now):
+        self.is_blackout = False
+
+    def start_mafia_freeze(self, duration_ms=5000):
+        """살아있는 마피아 NPC를 얼리고 얼린 수 반환"""
+        self.is_mafia_frozen = True
+        self.frozen_timer = pygame.time.get_ticks() + duration_ms
+        frozen = [n for n in self.npcs if n.role == "MAFIA" and n.alive]
+        for n in frozen: n.is_frozen = True; n.frozen_timer = self.frozen_timer
+        self.timers.schedule(self.frozen_timer, self._end_mafia_freeze, key='mafia_freeze')
+        return frozen
+
+    def _end_mafia_freeze(self, now):
+        self.is_mafia_frozen = False
+        for n in self.npcs:
+            if getattr(n, 'is_frozen', False): n.is_frozen = False
+
+    def is_area_occupied(self, rect, shrink=15):
+        """rect(px)에 살아있는 엔티티가 (rect를 shrink만큼 줄여) 겹치는지. 문 자동 닫기 판정용"""
+        if self.spatial_grid: candidates = self.spatial_grid.query_rect(rect, alive_only=True)
+        else: candidates = [e for e in [self.player] + self.npcs if e is not None and e.alive]
+        return any(rect.colliderect(e.rect.inflate(-shrink, -shrink)) for e in candidates)
 
 import pygame
\ No newline at end of file
@@ -204,6 +204,12 @@ class Entity:
         if dy > 0: self.facing_dir = (0, 1)
         elif dy < 0: self.facing_dir = (0, -1)
 
+        # [최적화] 비트 패킹 충돌 맵이 있으면 겹친 칸 전체 순회 대신 한 번의 스윕 질의로 처리
+        grid = getattr(self.map_manager, 'collision_grid', None)
+        if grid is not None and not self.hidden_in_solid:
+            grid.move_axis(self, dx, dy)
+            return
+
         self.pos_x += dx; self.pos_y += dy
         self.rect.x, self.rect.y = round(self.pos_x), round(self.pos_y)
 
@@ -4,30 +4,28 @@ import math
 import heapq
 import threading
 from settings import *
-from world.tiles import check_collision, get_tile_function, BED_TILES, HIDEABLE_TILES, get_tile_interaction, get_tile_category, get_tile_name
+from world.tiles import check_collision, BED_TILES, HIDEABLE_TILES, get_tile_interaction, get_tile_category, get_tile_name
 from systems.logger import GameLogger
 from colors import *
 from .entity import Entity
 from systems.renderer import CharacterRenderer
-from systems.behavior_tree import BTNode, Composite, Selector, Sequence, Action, Condition, BTState
+from systems.behavior_tree import BTNode, Composite, Selector, Sequence, Action, Condition, BTState, BTEvent, BTEventChannel, compile_tree
+from core.proximity import ProximityTable
+from managers.resource_manager import ResourceManager
 
-FONT_POPUP = None
+FONT_POPUP = ("arial", 14, True)  # 말풍선 글꼴 (ResourceManager 텍스트 캐시)
+# 시야 판정 후보 거리 (타일 중심 기준 레이 반경 + 1타일 여유)
+SIGHT_RANGE_PX = (VISION_RADIUS['DAY'] + 1) * TILE_SIZE
 
 class Dummy(Entity):
-    def __init__(self, x, y, map_data, map_width, map_height, name="Dummy", role="CITIZEN", tile_cache=None, zone_map=None, map_manager=None, is_master=True):
+    def __init__(self, x, y, map_data, map_width, map_height, name="Dummy", role="CITIZEN", zone_map=None, map_manager=None, is_master=True):
         super().__init__(x, y, map_data, map_width=map_width, map_height=map_height, zone_map=zone_map, name=name, role=role, map_manager=map_manager)
 
-        self.tile_cache = tile_cache if tile_cache else {}
         self.logger = GameLogger.get_instance()
         
         # [Multiplayer Architecture]
         self.is_master = is_master # True: AI runs locally (Host), False: AI runs remotely (Client)
 
-        global FONT_POPUP
-        if FONT_POPUP is None:
-            try: FONT_POPUP = pygame.font.SysFont("arial", 14, bold=True)
-            except: FONT_POPUP = pygame.font.Font(None, 20)
-
         self.coins = 0
         self.sub_role = random.choice(["FARMER", "MINER", "FISHER"]) if role in ["CITIZEN", "MAFIA"] else None
 
@@ -70,8 +68,11 @@ class Dummy(Entity):
         self.device_battery = 100.0
 
         # AI Tree is only needed if we are the master
+        # [최적화] 트리는 평면 배열로 컴파일하고, 부수 효과는 이벤트 채널로 전달
+        self.events = BTEventChannel()
+        self._blackboard = {}
         if self.is_master:
-            self.tree = self._build_behavior_tree()
+            self.tree = compile_tree(self._build_behavior_tree(), self.events)
         else:
             self.tree = None
 
@@ -146,28 +147,24 @@ class Dummy(Entity):
             if self.has_line_of_sight(self.chase_target): return True
         
         # [핵심 수정] "마피아인가?"(신상조회) -> "빌런의 모습인가?"(외형관찰) 로 변경
-        for t in bb.get('targets', []):
-            if t != self and t.alive:
-                is_villain_look = t.is_visible_villain(current_phase)
-                
-                if (is_villain_look and self.has_line_of_sight(t)) or (self.suspicion_meter.get(t.name, 0) >= 100):
-                    if self.has_line_of_sight(t) and not t.is_hiding:
-                        self.chase_target = t; self.last_seen_pos = (t.rect.centerx, t.rect.centery)
-                        return True
+        # [최적화] 공용 거리 테이블로 시야 거리 안의 후보만 가까운 순으로 검사
+        for _, t in self._proximity(bb).within(self, SIGHT_RANGE_PX):
+            is_villain_look = t.is_visible_villain(current_phase)
+
+            if (is_villain_look and self.has_line_of_sight(t)) or (self.suspicion_meter.get(t.name, 0) >= 100):
+                if self.has_line_of_sight(t) and not t.is_hiding:
+                    self.chase_target = t; self.last_seen_pos = (t.rect.centerx, t.rect.centery)
+                    return True
         return False
 
     def mafia_scan_targets(self, entity, bb):
         if bb.get('phase') != 'NIGHT': return False
         if self.chase_target and self.chase_target.alive and self.has_line_of_sight(self.chase_target): return True
-        visible_victims = []
-        for t in bb.get('targets', []):
-            if t != self and t.alive and t.role not in ["MAFIA", "SPECTATOR"]:
-                if self.has_line_of_sight(t) and not t.is_hiding:
-                    dist = math.sqrt((self.rect.centerx - t.rect.centerx)**2 + (self.rect.centery - t.rect.centery)**2)
-                    visible_victims.append((dist, t))
-        if visible_victims:
-            visible_victims.sort(key=lambda x: x[0]); self.chase_target = visible_victims[0][1]
-            return True
+        # [최적화] 가까운 순으로 정렬된 후보 중 처음 보이는 대상이 가장 가까운 희생자
+        for _, t in self._proximity(bb).within(self, SIGHT_RANGE_PX, exclude_roles=("MAFIA", "SPECTATOR")):
+            if self.has_line_of_sight(t) and not t.is_hiding:
+                self.chase_target = t
+                return True
         return False
 
     def has_last_seen_pos(self, entity, bb): return self.last_seen_pos is not None
@@ -181,10 +178,9 @@ class Dummy(Entity):
 
     def check_danger(self, entity, bb):
         if self.role in ["CITIZEN", "DOCTOR"] and bb.get('phase') == 'NIGHT':
-            for n in bb.get('npcs', []):
-                if n != self and n.alive and self.has_line_of_sight(n):
-                    dist = math.sqrt((self.rect.centerx-n.rect.centerx)**2+(self.rect.centery-n.rect.centery)**2)
-                    if dist < TILE_SIZE * 2: return True
+            player = bb.get('player')
+            for dist, n in self._proximity(bb).within(self, TILE_SIZE * 2):
+                if n is not player and dist < TILE_SIZE * 2 and self.has_line_of_sight(n): return True
         return False
 
     def check_needs_shopping(self, entity, bb):
@@ -199,10 +195,10 @@ class Dummy(Entity):
         if not self.chase_target: return BTState.FAILURE
         dist = math.sqrt((self.rect.centerx - self.chase_target.rect.centerx)**2 + (self.rect.centery - self.chase_target.rect.centery)**2)
         if dist > 200 and not self.ability_used and self.ap >= 5:
-            self.ability_used = True; self.ap -= 5; return "USE_SIREN"
+            self.ability_used = True; self.ap -= 5; self.events.emit(BTEvent.USE_SIREN); return BTState.SUCCESS
         now = pygame.time.get_ticks()
         if dist < 400 and now > self.last_attack_time + 1000:
-            if self.try_spend_ap(1): self.last_attack_time = now; return "SHOOT_TARGET"
+            if self.try_spend_ap(1): self.last_attack_time = now; self.events.emit(BTEvent.SHOOT_TARGET); return BTState.SUCCESS
         self.set_destination(self.chase_target.rect.centerx, self.chase_target.rect.centery, "Chasing")
         return BTState.RUNNING
 
@@ -250,9 +246,9 @@ class Dummy(Entity):
         if not self.work_tile_pos:
             job_key = "DOCTOR" if self.role == "DOCTOR" else self.sub_role
             target_tid = WORK_SEQ[job_key][(bb.get('day_count', 1) - 1) % 3]
-            candidates = self.map_manager.tile_cache.get(target_tid, []) if self.map_manager else []
-            if candidates:
-                raw_px, raw_py = random.choice(candidates); valid_pos = self.get_valid_neighbor(raw_px // TILE_SIZE, raw_py // TILE_SIZE)
+            cell = self.map_manager.tile_index.sample(target_tid) if self.map_manager else None
+            if cell:
+                valid_pos = self.get_valid_neighbor(cell[0], cell[1])
                 if valid_pos: self.work_tile_pos = valid_pos; self.set_destination(valid_pos[0], valid_pos[1], "Work Start")
                 else: return BTState.FAILURE
             else: return BTState.FAILURE
@@ -282,13 +278,15 @@ class Dummy(Entity):
         if self.ap >= 1 and self.chase_target:
             dist = math.sqrt((self.rect.centerx - self.chase_target.rect.centerx)**2 + (self.rect.centery - self.chase_target.rect.centery)**2)
             if dist < TILE_SIZE * 1.5:
-                self.ap -= 1; self.chase_target.take_damage(10); self.action_cooldown = pygame.time.get_ticks() + 1000
-                return "MURDER_OCCURRED"
+                now = pygame.time.get_ticks()
+                if now < self.action_cooldown: return BTState.RUNNING
+                self.ap -= 1; self.chase_target.take_damage(10); self.action_cooldown = now + 1000
+                self.events.emit(BTEvent.MURDER_OCCURRED); return BTState.SUCCESS
             self.set_destination(self.chase_target.rect.centerx, self.chase_target.rect.centery, "Killing")
         return BTState.RUNNING
 
     def mafia_sabotage(self, entity, bb):
-        self.ability_used = True; self.ap -= 5; return "USE_SABOTAGE"
+        self.ability_used = True; self.ap -= 5; self.events.emit(BTEvent.USE_SABOTAGE); return BTState.SUCCESS
 
     def do_wander(self, entity, bb):
         if not self.path and not self.is_pathfinding: self.random_move()
@@ -332,9 +330,10 @@ class Dummy(Entity):
                 if not self.is_hiding: self.path = self.pending_path
                 self.pending_path = None; self.is_pathfinding = False
             
-            blackboard = {'phase': phase, 'player': player, 'npcs': npcs, 'targets': npcs + [player], 'noise_list': noise_list, 'bloody_footsteps': bloody_footsteps, 'day_count': day_count, 'is_mafia_frozen': is_mafia_frozen}
-            result = self.tree.tick(self, blackboard)
-            if isinstance(result, str): return result
+            blackboard = self._update_blackboard(phase, player, npcs, noise_list, bloody_footsteps, day_count, is_mafia_frozen)
+            self.tree.tick(self, blackboard)
+            event = self.events.pop()
+            if event is not None: return event
             return self.process_movement(phase, npcs, slow_down=is_mafia_frozen if self.role == "MAFIA" else False)
         
         else:
@@ -342,6 +341,16 @@ class Dummy(Entity):
             self._update_slave_movement()
             return None
 
+    def _update_blackboard(self, phase, player, npcs, noise_list, bloody_footsteps, day_count, is_mafia_frozen):
+        # [최적화] 매 틱 dict/리스트를 새로 만들지 않고 재사용 (targets는 참가자 목록이 바뀔 때만 재생성)
+        bb = self._blackboard
+        if bb.get('npcs') is not npcs or bb.get('player') is not player or len(bb['targets']) != len(npcs) + 1:
+            bb['targets'] = npcs + [player]
+        bb['phase'] = phase; bb['player'] = player; bb['npcs'] = npcs
+        bb['noise_list'] = noise_list; bb['bloody_footsteps'] = bloody_footsteps
+        bb['day_count'] = day_count; bb['is_mafia_frozen'] = is_mafia_frozen
+        return bb
+
     def _update_slave_movement(self):
         # Simple lerp to target position
         dx = self.target_pos[0] - self.pos_x
@@ -463,7 +472,7 @@ class Dummy(Entity):
                 if d_val == 1: self.map_manager.open_door(ngx, ngy); return None
                 elif d_val == 3:
                     if self.inventory.get('KEY', 0) > 0: self.inventory['KEY'] -= 1; self.map_manager.unlock_door(ngx, ngy); return None
-                    elif self.role == "MAFIA": self.map_manager.set_tile(ngx, ngy, 5310005); return "MURDER_OCCURRED"
+                    elif self.role == "MAFIA": self.map_manager.set_tile(ngx, ngy, 5310005); return BTEvent.MURDER_OCCURRED
                     elif not self.is_unlocking: self.is_unlocking = True; self.unlock_finish_timer = now + 5000; self.add_popup("Lockpicking..."); return None
                     return None
         target_px, target_py = ngx * TILE_SIZE + 16, ngy * TILE_SIZE + 16
@@ -473,11 +482,10 @@ class Dummy(Entity):
             if not self.path: self.is_moving = False
         else:
             self.is_moving = True; mx, my = (dx/dist)*self.speed, (dy/dist)*self.speed
-            self.move_single_axis(mx, 0, npcs); self.move_single_axis(0, my, npcs)
-            
-            # [Optimization] Update Spatial Grid
-            if hasattr(self, 'world') and self.world.spatial_grid:
-                self.world.spatial_grid.update_entity(self)
+            # [최적화] 월드에 속해 있으면 이동을 모아 프레임 끝에 일괄 충돌 처리 (GameWorld.flush_moves)
+            world = getattr(self, 'world', None)
+            if world is not None: world.queue_move(self, mx, my)
+            else: self.move_single_axis(mx, 0, npcs); self.move_single_axis(0, my, npcs)
         return True
 
 
@@ -486,13 +494,9 @@ class Dummy(Entity):
         target_pos = None
         
         if self.map_manager:
-            # 1. 캐시된 바닥 타일 중 하나를 랜덤 선택 (카테고리 1: 외부바닥, 2: 내부바닥)
-            valid_keys = [k for k in self.map_manager.tile_cache.keys() if get_tile_category(k) in [1, 2]]
-            if valid_keys:
-                rand_tid = random.choice(valid_keys)
-                if self.map_manager.tile_cache[rand_tid]:
-                    rx, ry = random.choice(self.map_manager.tile_cache[rand_tid])
-                    target_pos = (rx + 16, ry + 16)
+            # 1. 이동 가능한 바닥 칸 색인에서 랜덤 선택 (카테고리 1: 외부바닥, 2: 내부바닥)
+            cell = self.map_manager.floor_cells.sample()
+            if cell: target_pos = (cell[0] * TILE_SIZE + 16, cell[1] * TILE_SIZE + 16)
 
         # 2. 캐시가 없거나 실패하면 기존 방식대로 하되, 충돌 체크 반복
         if not target_pos:
@@ -506,17 +510,17 @@ class Dummy(Entity):
         if target_pos:
             self.set_destination(target_pos[0], target_pos[1], "Random Move")
     def find_tile(self, target_ids, sort_by_distance=True, npcs=None):
-        candidates = []; tile_cache = self.map_manager.tile_cache if self.map_manager else {}
-        for tid in target_ids:
-            if tid in tile_cache:
-                for px, py in tile_cache[tid]:
-                    dist_sq = (self.rect.centerx - px)**2 + (self.rect.centery - py)**2
-                    if dist_sq > (60 * TILE_SIZE)**2: continue
-                    neighbor = self.get_valid_neighbor(px//TILE_SIZE, py//TILE_SIZE)
-                    if neighbor: candidates.append((neighbor, dist_sq))
-        if candidates:
-            if sort_by_distance: candidates.sort(key=lambda c: c[1])
-            return candidates[0][0]
+        if not self.map_manager: return None
+        index = self.map_manager.tile_index
+        # [최적화] 색인에서 60타일 안의 칸을 가까운 순으로 받아, 이웃 칸이 비어 있는 첫 칸에서 중단
+        if sort_by_distance: cells = index.nearest(target_ids, self.rect.centerx, self.rect.centery, max_dist=60 * TILE_SIZE)
+        else:
+            limit = (60 * TILE_SIZE) ** 2
+            cells = [(gx, gy) for tid in target_ids for gx, gy in index.cells(tid)
+                     if (self.rect.centerx - gx * TILE_SIZE) ** 2 + (self.rect.centery - gy * TILE_SIZE) ** 2 <= limit]
+        for gx, gy in cells:
+            neighbor = self.get_valid_neighbor(gx, gy)
+            if neighbor: return neighbor
         return None
     def get_valid_neighbor(self, tx, ty):
         offsets = [(0, 1), (0, -1), (1, 0), (-1, 0)]; random.shuffle(offsets)
@@ -525,18 +529,24 @@ class Dummy(Entity):
             if 0 <= nx < self.map_width and 0 <= ny < self.map_height:
                 if self.map_manager and not self.map_manager.check_any_collision(nx, ny): return (nx * TILE_SIZE + 16, ny * TILE_SIZE + 16)
         return None
-    def has_line_of_sight(self, target): return math.sqrt((self.rect.centerx - target.rect.centerx)**2 + (self.rect.centery - target.rect.centery)**2) < VISION_RADIUS['DAY'] * TILE_SIZE
+    def _proximity(self, bb):
+        # 월드 공용 테이블 사용, 월드 밖(단독 사용)에서는 blackboard 대상으로 임시 생성
+        prox = getattr(getattr(self, 'world', None), 'proximity', None)
+        if prox is None or id(self) not in prox.index:
+            prox = ProximityTable(); prox.rebuild(bb.get('targets', []))
+        return prox
+    def has_line_of_sight(self, target):
+        # [최적화] 월드 시야 서비스가 있으면 벽/실내 차단을 반영한 캐시된 가시 타일 집합으로 판정
+        vis = getattr(getattr(self, 'world', None), 'visibility', None)
+        if vis: return vis.can_see(self, target)
+        return math.sqrt((self.rect.centerx - target.rect.centerx)**2 + (self.rect.centery - target.rect.centery)**2) < VISION_RADIUS['DAY'] * TILE_SIZE
     def check_stat_changes(self):
         if self.hp != self.last_stats['hp']: diff = self.hp-self.last_stats['hp']; self.add_popup(f"{diff} HP", (255, 50, 50) if diff < 0 else (50, 255, 50)); self.last_stats['hp'] = self.hp
         if self.coins != self.last_stats['coins']: diff = self.coins-self.last_stats['coins']; self.add_popup(f"+{diff} G", (255, 215, 0)); self.last_stats['coins'] = self.coins
     def find_house_door(self, npcs=None):
-        candidates = []
-        for y in range(self.map_height):
-            for x in range(self.map_width):
-                if self.zone_map[y][x] in INDOOR_ZONES:
-                    tid = self.map_manager.get_tile(x, y, 'object') if self.map_manager else 0
-                    if get_tile_function(tid) in [2, 3]: candidates.append((x*TILE_SIZE+16, y*TILE_SIZE+16))
-        return random.choice(candidates) if candidates else None
+        # [최적화] 맵 전체 스캔 대신 MapManager가 유지하는 실내 문/침대 칸 색인에서 선택
+        cell = self.map_manager.home_cells.sample() if self.map_manager else None
+        return (cell[0] * TILE_SIZE + 16, cell[1] * TILE_SIZE + 16) if cell else None
     def find_hiding_spot(self, npcs):
         found = self.find_tile(HIDEABLE_TILES, npcs=npcs)
         if found:
@@ -550,4 +560,4 @@ class Dummy(Entity):
             y_off = 0
             for p in reversed(self.popups):
                 if pygame.time.get_ticks() < p['timer']:
-                    txt = FONT_POPUP.render(p['text'], True, p['color']); screen.blit(txt, (rx + TILE_SIZE//2 - txt.get_width()//2, ry - 20 - y_off)); y_off += 15
+                    txt = ResourceManager.get_instance().render_text(p['text'], p['color'], *FONT_POPUP); screen.blit(txt, (rx + TILE_SIZE//2 - txt.get_width()//2, ry - 20 - y_off)); y_off += 15
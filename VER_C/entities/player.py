@@ -8,7 +8,6 @@ from systems.minigame import MiniGameManager
 from systems.renderer import CharacterRenderer
 from .entity import Entity
 from systems.logger import GameLogger
-from entities.bullet import Bullet
 
 # Logic Modules
 from entities.player_logic.movement import MovementLogic
@@ -29,7 +28,7 @@ class Player(Entity):
         self.sound_timers = {'HEARTBEAT': 0, 'COUGH': 0, 'SCREAM': 0, 'FOOTSTEP': 0}
         self.shiver_timer = 0; self.blink_timer = 0
         self.is_eyes_closed = False; self.vibration_offset = (0, 0)
-        self.bullets = []; self.last_attack_time = 0; self.attack_cooldown = 500
+        self.last_attack_time = 0; self.attack_cooldown = 500
         self.minigame = MiniGameManager()
         self.vote_count = 0; self.daily_work_count = 0; self.work_step = 0
         self.bullets_fired_today = 0; self.day_count = 0; self.exhausted = False; self.exhaust_timer = 0
@@ -55,7 +54,7 @@ class Player(Entity):
         self.rect.x = int(self.pos_x); self.rect.y = int(self.pos_y)
         self.hp, self.ap, self.coins = self.max_hp, self.max_ap, 0
         self.alive = True; self.is_hiding = False; self.hiding_type = 0
-        self.bullets.clear(); self.inventory = {k: 0 for k in ITEMS.keys()}; self.inventory['BATTERY'] = 1
+        self.inventory = {k: 0 for k in ITEMS.keys()}; self.inventory['BATTERY'] = 1
         for k in self.buffs: self.buffs[k] = False
         self.flashlight_on, self.device_on, self.minigame.active = False, False, False
         self.breath_gauge = 100; self.ability_used = False
@@ -195,9 +194,6 @@ class Player(Entity):
     def use_active_skill(self):
         return self.logic_action.use_active_skill()
 
-    def update_bullets(self, npcs):
-        self.logic_action.update_bullets(npcs)
-
     def use_item(self, item_key):
         return self.logic_inventory.use_item(item_key)
 
@@ -229,5 +225,4 @@ class Player(Entity):
             return
         if self.is_dead:
             draw_rect = self.rect.move(-camera_x, -camera_y); pygame.draw.rect(screen, (50, 50, 50), draw_rect)
-        else: CharacterRenderer.draw_entity(screen, self, camera_x, camera_y, self.role, self.current_phase_ref, self.device_on) # Added device_on
-        for b in self.bullets: b.draw(screen, camera_x, camera_y)
\ No newline at end of file
+        else: CharacterRenderer.draw_entity(screen, self, camera_x, camera_y, self.role, self.current_phase_ref, self.device_on) # Added device_on
\ No newline at end of file
@@ -2,8 +2,7 @@ import pygame
 import math
 import random
 from settings import TILE_SIZE, VENDING_MACHINE_TID, TREASURE_CHEST_RATES, ITEMS, WORK_SEQ, MINIGAME_MAP, INDOOR_ZONES, ZONES
-from world.tiles import get_tile_category, get_tile_interaction, get_tile_function, get_tile_name, check_collision
-from entities.bullet import Bullet
+from world.tiles import get_tile_category, get_tile_interaction, get_tile_function, get_tile_name
 from systems.logger import GameLogger
 
 class ActionLogic:
@@ -149,7 +148,8 @@ class ActionLogic:
             if self.p.current_phase_ref in ['MORNING', 'DAY', 'VOTE', 'NOON', 'AFTERNOON'] or self.p.bullets_fired_today >= 1: return None
             self.p.bullets_fired_today += 1
             dx = target.rect.centerx - self.p.rect.centerx; dy = target.rect.centery - self.p.rect.centery; angle = math.atan2(dy, dx)
-            self.p.bullets.append(Bullet(self.p.rect.centerx, self.p.rect.centery, angle, is_enemy=False))
+            world = getattr(self.p, 'world', None)
+            if world: world.projectiles.fire(self.p.rect.centerx, self.p.rect.centery, angle, is_enemy=False)
             self.logger.info("PLAYER", "Fired Gun")
             return ("GUNSHOT", (self.p.rect.centerx, self.p.rect.centery)), ("GUNSHOT", self.p.rect.centerx, self.p.rect.centery, 25*TILE_SIZE, self.p.role)
         return None
@@ -177,21 +177,3 @@ class ActionLogic:
             if not self.p.try_spend_ap(cost, allow_health_cost=False): return f"Not enough AP (Need {cost})!"
             self.p.ability_used = True; return "USE_SIREN"
         return "No Active Skill for this role."
-
-    def update_bullets(self, npcs):
-        for b in self.p.bullets[:]:
-            b.update()
-            if b.x < 0 or b.x > self.p.map_width * TILE_SIZE or b.y < 0 or b.y > self.p.map_height * TILE_SIZE: self.p.bullets.remove(b); continue
-            gx = int(b.x // TILE_SIZE); gy = int(b.y // TILE_SIZE)
-            if 0 <= gx < self.p.map_width and 0 <= gy < self.p.map_height:
-                hit_wall = False
-                if self.p.map_manager:
-                    if self.p.map_manager.check_any_collision(gx, gy): hit_wall = True
-                else:
-                    tid = self.p.map_data[gy][gx]; tid = tid[0] if isinstance(tid, (tuple, list)) else tid
-                    if check_collision(tid): hit_wall = True
-                if hit_wall: b.alive = False; self.p.bullets.remove(b); continue
-            bullet_rect = pygame.Rect(b.x-2, b.y-2, 4, 4)
-            targets = [self.p] if b.is_enemy else npcs
-            for t in targets:
-                if t.alive and bullet_rect.colliderect(t.rect): t.take_damage(70); b.alive = False; self.p.bullets.remove(b); break
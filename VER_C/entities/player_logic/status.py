@@ -9,7 +9,7 @@ class StatusLogic:
         self.p = player
 
     def calculate_emotions(self, phase, npcs, is_blackout):
-        self.p.emotions = {}
+        self.p.emotions.clear()  # 매 프레임 새 dict를 만들지 않고 재사용
         if not self.p.alive or self.p.role == "SPECTATOR": return
 
         # 1. 행복 (HAPPINESS)
@@ -55,17 +55,17 @@ class StatusLogic:
         if my_emotion and target_role:
             min_dist_tile = 999
             
-            # [Optimization] Use Spatial Grid instead of iterating all NPCs
-            search_targets = npcs
-            if hasattr(self.p, 'world'):
-                # Search within 30 tiles radius (max emotion range)
-                search_targets = self.p.world.get_nearby_entities(self.p, radius_tiles=30)
-            
-            for n in search_targets:
-                if n.role in target_role and n.alive:
-                    d_px = math.hypot(self.p.rect.centerx - n.rect.centerx, self.p.rect.centery - n.rect.centery)
-                    d_tile = d_px / TILE_SIZE
-                    if d_tile < min_dist_tile: min_dist_tile = d_tile
+            # [Optimization] 월드 공용 거리 테이블에서 역할별 최근접 조회 (최대 감정 범위 30타일)
+            prox = getattr(getattr(self.p, 'world', None), 'proximity', None)
+            if prox is not None and id(self.p) in prox.index:
+                d_px, _ = prox.nearest(self.p, roles=target_role, max_dist=30 * TILE_SIZE)
+                if d_px != float('inf'): min_dist_tile = d_px / TILE_SIZE
+            else:
+                for n in npcs:
+                    if n.role in target_role and n.alive:
+                        d_px = math.hypot(self.p.rect.centerx - n.rect.centerx, self.p.rect.centery - n.rect.centery)
+                        d_tile = d_px / TILE_SIZE
+                        if d_tile < min_dist_tile: min_dist_tile = d_tile
             
             level = 0
             if min_dist_tile <= 5: level = 5
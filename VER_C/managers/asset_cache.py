@@ -0,0 +1,182 @@
+import os
+import glob
+import json
+import time
+import threading
+from collections import OrderedDict
+from systems.logger import GameLogger
+
+class LRUCache(OrderedDict):
+    """최대 개수를 넘으면 가장 오래 안 쓴 항목부터 버리는 메모리 캐시 (hits/misses/evictions 집계)"""
+    def __init__(self, max_items=1024):
+        super().__init__()
+        self.max_items = max_items
+        self.hits = self.misses = self.evictions = 0
+
+    def lookup(self, key):
+        val = self.get(key)
+        if val is None:
+            self.misses += 1
+            return None
+        self.move_to_end(key); self.hits += 1
+        return val
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.max_items:
+            self.popitem(last=False); self.evictions += 1
+
+class AssetCache:
+    """
+    [최적화] 디스크 에셋 캐시 관리자.
+    - index.json에 파일별 (size, mtime, version)을 기록해 시작 시 glob/stat 없이 인덱스 한 번만 읽음
+    - 존재 여부는 인덱스로 판단 (캐시 미스마다 os.path.exists 호출 없음)
+    - 용량 초과 시 오래된 파일 삭제는 백그라운드 쓰레드에서 지연 수행
+    """
+    _instance = None
+    INDEX_NAME = "index.json"
+
+    @classmethod
+    def get_instance(cls, cache_dir="cache_tiles", max_disk_mb=50):
+        if cls._instance is None:
+            cls._instance = AssetCache(cache_dir, max_disk_mb)
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls):
+        """종료 시 인덱스 저장 (생성된 적 없으면 무시)"""
+        if cls._instance is not None: cls._instance.flush()
+
+    def __init__(self, cache_dir="cache_tiles", max_disk_mb=50):
+        if AssetCache._instance is not None:
+            raise Exception("This class is a singleton!")
+        AssetCache._instance = self
+
+        self.logger = GameLogger.get_instance()
+        self.cache_dir = cache_dir
+        self.limit_bytes = max_disk_mb * 1024 * 1024
+        self.index_path = os.path.join(cache_dir, self.INDEX_NAME)
+        self.entries = {}  # {name: {'size', 'mtime', 'version', 'pinned'}}
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()  # 인덱스 파일 쓰기 직렬화 (워커/종료 시 flush 경합 방지)
+        self.dirty = False
+        self.worker = None
+        self.metrics = {'index_load_ms': 0.0, 'entries': 0, 'disk_bytes': 0, 'evicted': 0, 'freed_bytes': 0, 'reconciled': False}
+
+        t0 = time.perf_counter()
+        if not os.path.exists(cache_dir): os.makedirs(cache_dir)
+        needs_scan = not self._load_index()
+        self.metrics['index_load_ms'] = (time.perf_counter() - t0) * 1000
+        self.metrics['entries'] = len(self.entries)
+        self.metrics['disk_bytes'] = self.total_bytes()
+
+        self.logger.info("CACHE", f"Asset cache ready: {self.metrics['entries']} entries, "
+                         f"{self.metrics['disk_bytes'] / (1024*1024):.2f} MB, index load {self.metrics['index_load_ms']:.2f} ms"
+                         + (" (index missing, scan deferred)" if needs_scan else ""))
+
+        # 인덱스가 없으면(첫 실행/구버전) 디렉터리 스캔을, 용량 초과면 정리를 백그라운드로
+        if needs_scan or self.metrics['disk_bytes'] > self.limit_bytes:
+            self.schedule_maintenance(scan=needs_scan)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+            return True
+        except (OSError, ValueError):
+            self.entries = {}
+            return False
+
+    def total_bytes(self):
+        with self.lock:
+            return sum(e['size'] for e in self.entries.values())
+
+    def path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def lookup(self, name, version=None):
+        """인덱스에 있고 버전이 맞으면 경로 반환 (디스크 stat 없음)"""
+        with self.lock:
+            e = self.entries.get(name)
+            if e is None: return None
+            if version is not None and e.get('version') != version: return None
+            e['mtime'] = time.time(); self.dirty = True
+        return self.path(name)
+
+    def record(self, name, version=None, pinned=False):
+        """새로 저장한 파일을 인덱스에 등록"""
+        try: size = os.path.getsize(self.path(name))
+        except OSError: return
+        with self.lock:
+            self.entries[name] = {'size': size, 'mtime': time.time(), 'version': version, 'pinned': pinned}
+            self.dirty = True
+        # 인덱스 기록/용량 정리는 백그라운드에서
+        self.schedule_maintenance()
+
+    def names(self, prefix=""):
+        with self.lock:
+            return [n for n in self.entries if n.startswith(prefix)]
+
+    def forget(self, name, delete=True):
+        with self.lock:
+            self.entries.pop(name, None); self.dirty = True
+        if delete:
+            try: os.remove(self.path(name))
+            except OSError: pass
+
+    def schedule_maintenance(self, scan=False):
+        if self.worker and self.worker.is_alive(): return
+        self.worker = threading.Thread(target=self._maintain, args=(scan,), daemon=True)
+        self.worker.start()
+
+    def _maintain(self, scan):
+        try:
+            if scan: self._reconcile()
+            self._evict()
+            self.flush()
+        except Exception as e:
+            self.logger.error("CACHE", f"Asset cache maintenance failed: {e}")
+
+    def _reconcile(self):
+        """인덱스가 없을 때 한 번만 디렉터리를 스캔해 인덱스 재구성 (버전 미상 항목)"""
+        found = {}
+        for f in glob.glob(os.path.join(self.cache_dir, "*.png")):
+            try: found[os.path.basename(f)] = {'size': os.path.getsize(f), 'mtime': os.path.getmtime(f), 'version': None, 'pinned': False}
+            except OSError: pass
+        with self.lock:
+            for name, e in found.items(): self.entries.setdefault(name, e)
+            self.dirty = True
+        self.metrics['reconciled'] = True
+
+    def _evict(self):
+        with self.lock:
+            total = sum(e['size'] for e in self.entries.values())
+            if total <= self.limit_bytes: return
+            victims = sorted((e['mtime'], name) for name, e in self.entries.items() if not e.get('pinned'))
+        freed = 0
+        for _, name in victims:
+            # 여유분 10% 확보 시 중단
+            if total - freed < self.limit_bytes * 0.9: break
+            with self.lock: e = self.entries.pop(name, None)
+            if e is None: continue
+            try: os.remove(self.path(name))
+            except OSError: pass
+            freed += e['size']; self.metrics['evicted'] += 1
+        with self.lock: self.dirty = True
+        self.metrics['freed_bytes'] += freed
+        if freed: self.logger.info("CACHE", f"Asset cache eviction freed {freed / (1024*1024):.2f} MB")
+
+    def flush(self):
+        # 스냅샷~파일 교체를 flush_lock으로 묶음 (.tmp 동시 쓰기, 옛 스냅샷이 나중에 덮어쓰기 방지)
+        with self.flush_lock:
+            with self.lock:
+                if not self.dirty: return
+                data = json.dumps({'entries': self.entries})
+                self.dirty = False
+            try:
+                tmp = self.index_path + ".tmp"
+                with open(tmp, 'w', encoding='utf-8') as f: f.write(data)
+                os.replace(tmp, self.index_path)
+            except OSError as e:
+                self.logger.error("CACHE", f"Failed to write cache index: {e}")
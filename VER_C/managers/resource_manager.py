@@ -1,6 +1,20 @@
 import pygame
 import os
 from systems.logger import GameLogger
+from managers.asset_cache import LRUCache
+
+TEXT_CACHE_SIZE = 1024
+
+def render_text_with_outline(text, font, inner_color, outline_color, thickness):
+    text_surf = font.render(text, True, inner_color)
+    outline_surf = font.render(text, True, outline_color)
+    w, h = text_surf.get_size()
+    final_surf = pygame.Surface((w + thickness*2, h + thickness*2), pygame.SRCALPHA)
+
+    for dx, dy in [(-thickness,0), (thickness,0), (0,-thickness), (0,thickness)]:
+        final_surf.blit(outline_surf, (dx + thickness, dy + thickness))
+    final_surf.blit(text_surf, (thickness, thickness))
+    return final_surf
 
 class ResourceManager:
     _instance = None
@@ -20,6 +34,9 @@ class ResourceManager:
         self.fonts = {}
         self.sounds = {}
         self.images = {} # [추가] 이미지 캐시
+        # [최적화] 이름/크기별 시스템 폰트와 렌더링된 텍스트 공용 캐시 (UI/팝업/이펙트/콘솔)
+        self.sys_fonts = {}  # {(name, size, bold): Font}
+        self.text_cache = LRUCache(TEXT_CACHE_SIZE)  # {(name, size, bold, text, color, outline): Surface}
 
         self._load_system_fonts()
 
@@ -45,6 +62,39 @@ class ResourceManager:
     def get_font(self, name):
         return self.fonts.get(name, self.fonts['default'])
 
+    def get_sysfont(self, name, size, bold=False):
+        """(name, size, bold)별로 한 번만 만드는 시스템 폰트 (실패 시 기본 폰트)"""
+        key = (name, size, bold)
+        font = self.sys_fonts.get(key)
+        if font is None:
+            try: font = pygame.font.SysFont(name, size, bold=bold)
+            except Exception:
+                self.logger.warning("RESOURCE", f"Failed to load font {name}, using default")
+                font = pygame.font.Font(None, size + 6)
+            self.sys_fonts[key] = font
+        return font
+
+    def render_text(self, text, color, name="arial", size=14, bold=False, outline=None):
+        """
+        [최적화] 렌더링한 텍스트 Surface를 LRU 캐시에서 재사용 (같은 글자를 매 프레임 다시 그리지 않음).
+        outline=(외곽선 색, 두께)면 4방향 외곽선을 입힌 라벨. 반환 Surface는 공유되므로 수정하지 말 것.
+        """
+        key = (name, size, bold, text, tuple(color), (tuple(outline[0]), outline[1]) if outline else None)
+        surf = self.text_cache.lookup(key)
+        if surf is None:
+            font = self.get_sysfont(name, size, bold)
+            if outline: surf = render_text_with_outline(text, font, color, outline[0], outline[1])
+            else: surf = font.render(text, True, color)
+            self.text_cache[key] = surf
+        return surf
+
+    def text_stats(self):
+        """텍스트 캐시 크기와 적중률 (디버그 콘솔 stats 명령용)"""
+        cache = self.text_cache
+        total = cache.hits + cache.misses
+        return {'size': len(cache), 'hits': cache.hits, 'misses': cache.misses, 'evictions': cache.evictions,
+                'hit_rate': cache.hits / total if total else 0.0}
+
     # [최적화] 이미지 로드 및 캐싱 메서드 추가
     def get_image(self, path, use_alpha=True):
         """이미지를 로드하고 디스플레이 포맷에 맞춰 최적화(convert)하여 반환"""
@@ -71,4 +121,5 @@ class ResourceManager:
             
     def clear_cache(self):
         self.images.clear()
+        self.text_cache.clear()
         # 폰트는 유지하거나 필요시 재생성
\ No newline at end of file
@@ -7,6 +7,8 @@ from tkinter import messagebox, filedialog
 from settings import TILE_SIZE, FPS, ZONES
 from colors import COLORS
 from world.tiles import TILE_DATA, create_texture, get_tile_category, check_collision, get_tile_function, NEW_ID_MAP, get_tile_type, get_tile_interaction, get_tile_hiding
+from world.texture_atlas import TextureAtlas
+from managers.asset_cache import AssetCache
 
 UI_WIDTH = 340
 MINIMAP_SIZE_BASE = 250
@@ -38,8 +40,13 @@ class MapEditor:
             self.title_font = pygame.font.Font(None, 50)
 
 
-        self.textures = {tid: create_texture(tid) for tid in TILE_DATA}
+        # [최적화] 시작 시 타일 전체를 새로 그리지 않고 디스크 캐시된 텍스처 아틀라스 사용
+        self.atlas = TextureAtlas.get_instance()
+        self.textures = {tid: self.atlas.get(tid, 0) for tid in TILE_DATA}
         self.ui_textures = {tid: pygame.transform.scale(surf, (24, 24)) for tid, surf in self.textures.items()}
+        # [최적화] 현재 줌 크기로 미리 스케일한 텍스처 캐시 {(tid, rot, size, alpha): Surface} (줌 변경 시 비움)
+        self.scaled_cache = {}
+        self.scaled_zoom = None
 
 
         self.state = 'MENU'
@@ -407,6 +414,25 @@ class MapEditor:
             elif self.is_dragging: self.draw_preview()
         self.draw_ui_panel(); self.draw_minimap()
 
+    def _get_texture(self, tid, rot=0):
+        # 아틀라스의 회전된 텍스처 우선, 아틀라스에 없는 타일만 직접 생성
+        tex = self.atlas.get(tid, rot)
+        if tex is not None: return tex
+        if tid not in self.textures: self.textures[tid] = create_texture(tid)
+        tex = self.textures[tid]
+        return pygame.transform.rotate(tex, rot) if rot != 0 else tex
+
+    def _get_scaled(self, tid, rot, size, alpha=255):
+        # 타일마다 매 프레임 transform.scale 하지 않고 줌 크기별로 한 번만 스케일 (아틀라스 subsurface는 건드리지 않음)
+        if self.zoom != self.scaled_zoom: self.scaled_cache.clear(); self.scaled_zoom = self.zoom
+        key = (tid, rot, size, alpha)
+        surf = self.scaled_cache.get(key)
+        if surf is None:
+            surf = pygame.transform.scale(self._get_texture(tid, rot), (size, size))
+            if alpha < 255: surf.set_alpha(alpha)
+            self.scaled_cache[key] = surf
+        return surf
+
     def draw_map_view(self):
         tp = TILE_SIZE * self.zoom; sc, ec = int(max(0, self.camera_x // tp)), int(min(self.map_width, (self.camera_x + self.map_view_width) // tp + 1))
         sr, er = int(max(0, self.camera_y // tp)), int(min(self.map_height, (self.screen_height // tp) + 1 + (self.camera_y // tp)))
@@ -418,12 +444,7 @@ class MapEditor:
                 for x in range(max(0, sc-1), min(self.map_width, ec+1)):
                     sx, sy = self.grid_to_screen(x, y); tid, rot = grid[y][x]
                     if tid != 0:
-                        if tid not in self.textures: self.textures[tid] = create_texture(tid)
-                        surf = self.textures[tid]
-                        if rot != 0: surf = pygame.transform.rotate(surf, rot)
-                        surf = pygame.transform.scale(surf, (int(tp) + 1, int(tp) + 1))
-                        if alpha < 255: surf.set_alpha(alpha)
-                        self.screen.blit(surf, (sx, sy))
+                        self.screen.blit(self._get_scaled(tid, rot, int(tp) + 1, alpha), (sx, sy))
                     if layer == 'floor':
                         zid = self.zone_map[y][x]
                         if zid != 0:
@@ -455,9 +476,7 @@ class MapEditor:
         if self.mode == 'TILE' and not self.is_erasing:
             tid = self.get_selected_tile_id()
             if tid in self.textures:
-                tex = self.textures[tid]
-                if self.current_rotation != 0: tex = pygame.transform.rotate(tex, self.current_rotation)
-                preview_surf = pygame.transform.scale(tex, (int(tp), int(tp))); preview_surf.set_alpha(150)
+                preview_surf = self._get_scaled(tid, self.current_rotation, int(tp), 150)
         for y in range(sy, ey + 1):
             for x in range(sx, ex + 1):
                 px, py = self.grid_to_screen(x, y); r = (px, py, tp, tp)
@@ -484,10 +503,7 @@ class MapEditor:
                         tid, rot = val; break
 
                 if tid != 0:
-                    if tid not in self.textures: self.textures[tid] = create_texture(tid)
-                    t = self.textures[tid]
-                    if rot != 0: t = pygame.transform.rotate(t, rot)
-                    t = t.copy(); t.set_alpha(150); self.screen.blit(pygame.transform.scale(t, (int(tp), int(tp))), (sx, sy))
+                    self.screen.blit(self._get_scaled(tid, rot, int(tp), 150), (sx, sy))
                 pygame.draw.rect(self.screen, (255, 255, 255), (sx, sy, tp, tp), 1)
 
     def draw_ui_panel(self):
@@ -562,6 +578,7 @@ class MapEditor:
             elif self.state == 'INPUT_SIZE': self.draw_input_size()
             elif self.state == 'EDITOR': self.draw_editor()
             pygame.display.flip(); self.clock.tick(FPS)
+        AssetCache.shutdown()
         pygame.quit(); sys.exit()
 
 if __name__ == "__main__": MapEditor().run()
@@ -0,0 +1,80 @@
+"""
+공간 색인 마이크로벤치마크: ProximityTable(거리/반경) + SpatialGrid(사각형) vs 단순 전체 순회.
+
+    python proximity_benchmark.py [n ...]     # 기본 20 200 2000
+
+160x120 타일 맵에 엔티티를 무작위로 뿌리고, 틱 단위 비용을 잰다.
+- rebuild: ProximityTable.rebuild + SpatialGrid.rebuild_from (GameWorld.update와 같은 순서)
+- within:  엔티티마다 within(2타일) 한 번씩 (AI 스캔이 틱마다 하는 일), 전체 합
+- nearest: 엔티티마다 nearest(MAFIA) 한 번씩, 전체 합
+- rect:    1280x720 뷰포트 query_rect 한 번
+- brute:   within과 같은 질의를 전체 순회 + sqrt로 (기존 방식), 전체 합
+"""
+import sys
+import time
+import random
+
+import pygame
+
+from settings import TILE_SIZE
+from core.proximity import ProximityTable
+from core.spatial_grid import SpatialGrid
+
+MAP_W, MAP_H = 160, 120
+ROLES = ("CITIZEN", "CITIZEN", "CITIZEN", "POLICE", "MAFIA")
+
+class FakeEntity:
+    def __init__(self, rng):
+        self.rect = pygame.Rect(rng.randrange(MAP_W * TILE_SIZE), rng.randrange(MAP_H * TILE_SIZE), 24, 24)
+        self.role = rng.choice(ROLES)
+        self.alive = True
+
+def timed(fn, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat): fn()
+    return (time.perf_counter() - t0) / repeat * 1000
+
+def brute_within(entities, radius):
+    r2 = radius * radius
+    for e in entities:
+        x, y = e.rect.center
+        out = []
+        for o in entities:
+            if o is e or not o.alive: continue
+            d2 = (o.rect.centerx - x) ** 2 + (o.rect.centery - y) ** 2
+            if d2 <= r2: out.append((d2 ** 0.5, o))
+        out.sort(key=lambda t: t[0])
+
+def run(n, seed=1):
+    rng = random.Random(seed)
+    ents = [FakeEntity(rng) for _ in range(n)]
+    prox = ProximityTable()
+    grid = SpatialGrid(MAP_W, MAP_H, cell_size=10)
+    view = pygame.Rect(MAP_W * TILE_SIZE // 2 - 640, MAP_H * TILE_SIZE // 2 - 360, 1280, 720)
+    radius = 2 * TILE_SIZE
+    repeat = max(1, 2000 // n)
+
+    def rebuild():
+        prox.rebuild(ents); grid.rebuild_from(prox.entities, prox.xs, prox.ys)
+
+    def within():
+        prox.rebuild(ents)  # 거리 행렬은 틱마다 새로 만들어지므로 재생성 비용 포함
+        for e in ents: prox.within(e, radius)
+
+    def nearest():
+        prox.rebuild(ents)
+        for e in ents: prox.nearest(e, roles=("MAFIA",))
+
+    rebuild()
+    t_rebuild = timed(rebuild, repeat)
+    t_within = timed(within, repeat) - timed(lambda: prox.rebuild(ents), repeat)
+    t_nearest = timed(nearest, repeat) - timed(lambda: prox.rebuild(ents), repeat)
+    rebuild()
+    t_rect = timed(lambda: grid.query_rect(view), repeat * 20)
+    t_brute = timed(lambda: brute_within(ents, radius), max(1, repeat // 10))
+    print(f"{n:6d}  {t_rebuild:8.3f}  {t_within:9.3f}  {t_nearest:9.3f}  {t_rect * 1000:8.1f}us  {t_brute:9.3f}")
+
+if __name__ == "__main__":
+    sizes = [int(a) for a in sys.argv[1:]] or [20, 200, 2000]
+    print("     n   rebuild   within/t  nearest/t      rect    brute/t   (ms unless noted)")
+    for n in sizes: run(n)
@@ -5,9 +5,6 @@ SCREEN_HEIGHT = 720
 TILE_SIZE = 32
 FPS = 60
 
-# [최적화] 전역 폰트 캐시 저장소 추가
-SHARED_FONTS = {}
-
 MAX_PLAYERS = 15
 MAX_SPECTATORS = 5
 MAX_TOTAL_USERS = 20
@@ -110,6 +107,11 @@ VISION_RADIUS = {
     'SPECTATOR': 40
 }
 
+# [최적화] 조명/시야 합성 해상도
+# 'FULL': 픽셀 단위 시야 폴리곤 + 헤일로, 'TILE': 타일(또는 타일의 1/SUBDIV) 단위 버퍼를 계산해 한 번 smoothscale
+LIGHTING_MODE = 'FULL'
+LIGHTING_TILE_SUBDIV = 2
+
 MAFIA_DETECT_RANGE = 200
 
 TREASURE_CHEST_RATES = [
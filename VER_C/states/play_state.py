@@ -4,18 +4,18 @@ import math
 from core.base_state import BaseState
 from settings import *
 from systems.camera import Camera
-from systems.fov import FOV
-from systems.effects import VisualSound, SoundDirectionIndicator
+from systems.effects import VisualSound, SoundDirectionIndicator, draw_effects
 from systems.renderer import CharacterRenderer, MapRenderer
 from systems.lighting import LightingManager
+from systems.visibility import TileFade
 from systems.time_system import TimeSystem
 from core.world import GameWorld
 from colors import COLORS
 from managers.resource_manager import ResourceManager
 from ui import UI
-from entities.bullet import Bullet
 from systems.debug_console import DebugConsole
 from entities.npc import Dummy
+from systems.behavior_tree import BTEvent
 
 class PlayState(BaseState):
     def __init__(self, game):
@@ -35,7 +35,7 @@ class PlayState(BaseState):
 
         # [Rendering Caches]
         self.visible_tiles = set()
-        self.tile_alphas = {}
+        self.tile_alphas = TileFade(speed=15)
         self.zoom_level = 1.5
         self.effect_surf = pygame.Surface((self.game.screen_width, self.game.screen_height), pygame.SRCALPHA)
 
@@ -92,7 +92,7 @@ class PlayState(BaseState):
         self.camera = Camera(self.game.screen_width, self.game.screen_height, self.world.map_manager.width, self.world.map_manager.height)
         self.camera.set_bounds(self.world.map_manager.width * TILE_SIZE, self.world.map_manager.height * TILE_SIZE)
         self.camera.set_zoom(self.zoom_level)
-        self.fov = FOV(self.world.map_manager.width, self.world.map_manager.height, self.world.map_manager)
+        self.fov = self.world.fov
 
         self.world.init_entities()
         self.time_system.init_timer() 
@@ -190,16 +190,10 @@ class PlayState(BaseState):
                             self.ui.toggle_vending_machine()
                             self.player.popups.remove(p); break
 
-                self.player.update_bullets(self.npcs)
-
         # [Original Logic Restored] Emotion System
         if self.player.role in ["CITIZEN", "DOCTOR", "FARMER", "MINER", "FISHER"]:
             if self.current_phase == "NIGHT":
-                nearest_dist = float('inf')
-                for n in self.npcs:
-                    if n.role == "MAFIA" and n.alive:
-                        d = math.hypot(n.rect.centerx - self.player.rect.centerx, n.rect.centery - self.player.rect.centery)
-                        if d < nearest_dist: nearest_dist = d
+                nearest_dist, _ = self.world.proximity.nearest(self.player, roles=("MAFIA",))
                 
                 if nearest_dist < 640:
                     intensity = int((640 - nearest_dist) / 60)
@@ -207,7 +201,7 @@ class PlayState(BaseState):
                     beat_interval = max(300, int(nearest_dist * 2))
                     if now - self.heartbeat_timer > beat_interval:
                         self.heartbeat_timer = now
-                        self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery, "THUMP", (100, 0, 0), size_scale=0.5))
+                        self.world.effects.append(VisualSound.spawn(self.player.rect.centerx, self.player.rect.centery, "THUMP", (100, 0, 0), size_scale=0.5))
                 else: self.player.emotions['ANXIETY'] = 0
             else: self.player.emotions['ANXIETY'] = 0
 
@@ -217,7 +211,7 @@ class PlayState(BaseState):
                 self.player.emotions['PAIN'] = 5 
                 self.player.is_hiding = False
                 if random.random() < 0.02:
-                    self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery, "GROAN...", (200, 200, 200), 1.0))
+                    self.world.effects.append(VisualSound.spawn(self.player.rect.centerx, self.player.rect.centery, "GROAN...", (200, 200, 200), 1.0))
             else: self.player.emotions['PAIN'] = 0
 
         # [Original Logic Restored] Mafia Sighting
@@ -235,6 +229,9 @@ class PlayState(BaseState):
             if n.is_stunned(): continue
             action = n.update(self.current_phase, self.player, self.npcs, self.world.is_mafia_frozen, self.world.noise_list, self.day_count, self.world.bloody_footsteps)
             self._handle_npc_action(action, n, now)
+            # 같은 틱에 쌓인 나머지 AI 이벤트도 지금 처리 (다음 틱으로 넘기면 대상이 바뀐 뒤 실행될 수 있음)
+            for event in n.events.drain(): self._handle_npc_action(event, n, now)
+        self.world.flush_moves()
 
         if self.player.role == "SPECTATOR":
             self._update_spectator_camera()
@@ -250,17 +247,10 @@ class PlayState(BaseState):
             
         self.visible_tiles = self.fov.cast_rays(self.player.rect.centerx, self.player.rect.centery, rad, direction, angle)
 
-        fade_speed = 15 
-        for tile in self.visible_tiles:
-            current_alpha = self.tile_alphas.get(tile, 0)
-            if current_alpha < 255:
-                self.tile_alphas[tile] = min(255, current_alpha + fade_speed)
-        
-        for tile in list(self.tile_alphas.keys()):
-            if tile not in self.visible_tiles:
-                self.tile_alphas[tile] -= fade_speed
-                if self.tile_alphas[tile] <= 0:
-                    del self.tile_alphas[tile]
+        # [최적화] 타일 페이드는 맵 크기 배열로 한 번에 갱신 (조명 타일 모드만 읽으므로 그때만)
+        if self.lighting.tile_active:
+            mm = self.world.map_manager
+            self.tile_alphas.update(self.visible_tiles, mm.width, mm.height)
 
     def _update_spectator_camera(self):
         keys = pygame.key.get_pressed()
@@ -281,16 +271,10 @@ class PlayState(BaseState):
             else: self.ui.spectator_follow_target = None
 
     def execute_siren(self):
-        count = 0
-        for n in self.npcs:
-            if n.role == "MAFIA" and n.alive:
-                n.is_frozen = True
-                n.frozen_timer = pygame.time.get_ticks() + 5000
-                count += 1
-                self.world.effects.append(VisualSound(n.rect.centerx, n.rect.centery, "SIREN", (0, 0, 255), 2.0))
-        
-        self.world.is_mafia_frozen = True
-        self.world.frozen_timer = pygame.time.get_ticks() + 5000
+        frozen = self.world.start_mafia_freeze(5000)
+        for n in frozen:
+            self.world.effects.append(VisualSound.spawn(n.rect.centerx, n.rect.centery, "SIREN", (0, 0, 255), 2.0))
+        count = len(frozen)
 
         if self.player.role == "MAFIA" and self.player.alive:
              self.player.add_popup("FROZEN BY SIREN!", (0, 0, 255))
@@ -300,10 +284,9 @@ class PlayState(BaseState):
         self.ui.show_alert("!!! SIREN !!!", (100, 100, 255))
 
     def execute_sabotage(self):
-        self.world.is_blackout = True
-        self.world.blackout_timer = pygame.time.get_ticks() + 10000
+        self.world.start_blackout(10000)
         self.logger.info("GAME", "Sabotage Triggered! Blackout started.")
-        self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery, "BOOM", (50, 50, 50), 3.0))
+        self.world.effects.append(VisualSound.spawn(self.player.rect.centerx, self.player.rect.centery, "BOOM", (50, 50, 50), 3.0))
         self.time_system.daily_news_log.append("마피아, 사회에 공포 조성!!")
         self.ui.show_alert("!!! SABOTAGE !!!", (255, 0, 0))
         
@@ -328,8 +311,9 @@ class PlayState(BaseState):
             angle = math.atan2(shooter.facing_dir[1], shooter.facing_dir[0])
             
         is_enemy = (shooter.role != "PLAYER")
-        self.player.bullets.append(Bullet(start_x, start_y, angle, is_enemy=is_enemy))
-        self.world.effects.append(VisualSound(start_x, start_y, "BANG!", (255, 200, 50), 2.0))
+        self.world.projectiles.fire(start_x, start_y, angle, is_enemy=is_enemy)
+        self.world.effects.append(VisualSound.spawn(start_x, start_y, "BANG!", (255, 200, 50), 2.0))
+        self.lighting.flash(start_x, start_y) # 총구 섬광
         if shooter.role == "POLICE":
              self.time_system.daily_news_log.append(f"Gunshots fired by Police near {shooter.name}.")
 
@@ -337,16 +321,17 @@ class PlayState(BaseState):
     def trigger_siren(self): self.execute_siren()
 
     def _handle_npc_action(self, action, n, now):
-        if action == "USE_SIREN":
+        if action == BTEvent.USE_SIREN:
             self.execute_siren()
-        elif action == "USE_SABOTAGE":
+        elif action == BTEvent.USE_SABOTAGE:
             self.execute_sabotage()
-        elif action == "SHOOT_TARGET" and n.chase_target:
+        elif action == BTEvent.SHOOT_TARGET and n.chase_target:
             self.execute_gunshot(n, (n.chase_target.rect.centerx, n.chase_target.rect.centery))
-        elif action == "MURDER_OCCURRED":
+        elif action == BTEvent.MURDER_OCCURRED:
+            if not self.world.has_murder_occurred:
+                self.time_system.daily_news_log.append("A tragic murder occurred last night.")
             self.world.has_murder_occurred = True
-            self.time_system.daily_news_log.append("A tragic murder occurred last night.")
-        elif action == "FOOTSTEP":
+        elif action == BTEvent.FOOTSTEP:
             from settings import TILE_SIZE
             radius = 6 * TILE_SIZE
             if hasattr(self, 'weather') and self.weather == 'RAIN':
@@ -414,7 +399,7 @@ class PlayState(BaseState):
             final_scale = base_scale * importance * dist_factor
             final_scale = max(0.5, min(2.5, final_scale))
 
-            self.world.effects.append(VisualSound(fx_x, fx_y, s_type, final_color, size_scale=final_scale, shake=shake, blink=blink))
+            self.world.effects.append(VisualSound.spawn(fx_x, fx_y, s_type, final_color, size_scale=final_scale, shake=shake, blink=blink))
             self.world.indicators.append(SoundDirectionIndicator(fx_x, fx_y))
 
     def _handle_v_action(self):
@@ -476,13 +461,28 @@ class PlayState(BaseState):
                 news_msg = f"BREAKING NEWS: {top.name} was EXECUTED! And he was a [{role_reveal}]."
                 self.time_system.daily_news_log.append(news_msg) 
                 self.player.add_popup("EXECUTION!", (255, 0, 0))
-                self.world.effects.append(VisualSound(self.player.rect.centerx, self.player.rect.centery - 50, "EXECUTION!", (255, 0, 0), 5.0))
-                self.world.effects.append(VisualSound(top.rect.centerx, top.rect.centery, "DEAD", (150, 0, 0), 3.0))
+                self.world.effects.append(VisualSound.spawn(self.player.rect.centerx, self.player.rect.centery - 50, "EXECUTION!", (255, 0, 0), 5.0))
+                self.world.effects.append(VisualSound.spawn(top.rect.centerx, top.rect.centery, "DEAD", (150, 0, 0), 3.0))
             else:
                 self.player.add_popup("Vote Failed", (200, 200, 200))
 
         for c in candidates: c.vote_count = 0
 
+    def _get_drawable_npcs(self, vw, vh):
+        """[최적화] 뷰포트 사각형을 공간 인덱스로 조회한 뒤 시야 타일에 있는 NPC만 반환 (화면 밖 개체는 순회하지 않음)"""
+        grid = self.world.spatial_grid
+        margin = TILE_SIZE * 3 # 팝업 텍스트 여유
+        if grid:
+            view = pygame.Rect(int(self.camera.x) - margin, int(self.camera.y) - margin, vw + margin * 2, vh + margin * 2)
+            candidates = [e for e in grid.query_rect(view) if e is not self.player]
+            candidates.sort(key=lambda e: e.rect.bottom) # 아래쪽 개체가 위에 그려지도록 정렬
+        else:
+            candidates = self.npcs
+
+        if self.player.role == "SPECTATOR": return candidates
+        visible = self.visible_tiles
+        return [n for n in candidates if (int(n.rect.centerx//TILE_SIZE), int(n.rect.centery//TILE_SIZE)) in visible]
+
     def draw(self, screen):
         screen.fill(COLORS['BG'])
 
@@ -500,10 +500,11 @@ class PlayState(BaseState):
             job_k = "DOCTOR" if self.player.role == "DOCTOR" else self.player.sub_role
             if job_k in WORK_SEQ:
                 target_tid = WORK_SEQ[job_k][self.player.work_step % 3]
-                if target_tid in self.world.map_manager.tile_cache:
-                    target_pixels = self.world.map_manager.tile_cache[target_tid]
+                target_cells = self.world.map_manager.tile_index.cells(target_tid)
+                if target_cells:
                     sum_x, sum_y, count, off_screen_exists = 0, 0, 0, False
-                    for (px, py) in target_pixels:
+                    for (gx, gy) in target_cells:
+                        px, py = gx * TILE_SIZE, gy * TILE_SIZE
                         if self.camera.x - TILE_SIZE <= px <= self.camera.x + vw + TILE_SIZE and \
                            self.camera.y - TILE_SIZE <= py <= self.camera.y + vh + TILE_SIZE:
                             pygame.draw.rect(canvas, (255, 255, 0), (px - self.camera.x, py - self.camera.y, TILE_SIZE, TILE_SIZE), 2)
@@ -521,14 +522,14 @@ class PlayState(BaseState):
                             pin_x = self.game.screen_width / 2 + dx * scale; pin_y = self.game.screen_height / 2 + dy * scale
                             offscreen_pins.append((int(pin_x), int(pin_y)))
 
-        for n in self.npcs:
-            if (int(n.rect.centerx//TILE_SIZE), int(n.rect.centery//TILE_SIZE)) in self.visible_tiles or self.player.role == "SPECTATOR":
-                n.draw(canvas, self.camera.x, self.camera.y, self.player.role, self.current_phase, self.player.device_on)
+        for n in self._get_drawable_npcs(vw, vh):
+            n.draw(canvas, self.camera.x, self.camera.y, self.player.role, self.current_phase, self.player.device_on)
 
         if not self.player.is_dead:
             CharacterRenderer.draw_entity(canvas, self.player, self.camera.x, self.camera.y, self.player.role, self.current_phase, self.player.device_on)
 
-        for fx in self.world.effects: fx.draw(canvas, self.camera.x, self.camera.y)
+        self.world.projectiles.draw(canvas, self.camera.x, self.camera.y)
+        draw_effects(canvas, self.world.effects, self.camera.x, self.camera.y)
         for i in self.world.indicators: i.draw(canvas, self.player.rect, self.camera.x, self.camera.y)
 
         if self.player.role != "SPECTATOR":
@@ -537,7 +538,11 @@ class PlayState(BaseState):
         if self.player.minigame.active:
             self.player.minigame.draw(canvas, self.player.rect.centerx - self.camera.x, self.player.rect.top - self.camera.y - 60)
 
-        screen.blit(pygame.transform.scale(canvas, (self.game.screen_width, self.game.screen_height)), (0, 0))
+        # [최적화] 줌 1.0이면 스케일 생략, 그 외에는 새 Surface 할당 없이 화면에 직접 스케일
+        target_size = (self.game.screen_width, self.game.screen_height)
+        if canvas.get_size() == target_size: screen.blit(canvas, (0, 0))
+        elif screen.get_size() == target_size: pygame.transform.scale(canvas, target_size, screen)
+        else: screen.blit(pygame.transform.scale(canvas, target_size), (0, 0))
 
         sw, sh = screen.get_width(), screen.get_height()
         for (px, py) in offscreen_pins:
@@ -577,8 +582,7 @@ class PlayState(BaseState):
             chat_bg = pygame.Surface((self.game.screen_width, 40))
             chat_bg.fill((0, 0, 0)); chat_bg.set_alpha(200)
             screen.blit(chat_bg, (0, self.game.screen_height - 40))
-            font = pygame.font.SysFont("arial", 24)
-            txt_surf = font.render(f"Chat: {self.chat_text}", True, (255, 255, 255))
+            txt_surf = self.resource_manager.render_text(f"Chat: {self.chat_text}", (255, 255, 255), "arial", 24)
             screen.blit(txt_surf, (10, self.game.screen_height - 35))
             if (pygame.time.get_ticks() // 500) % 2 == 0:
                 cursor_x = 10 + txt_surf.get_width()
@@ -1,9 +1,41 @@
-from enum import Enum, auto
+from enum import Enum, IntEnum
 
-class BTState(Enum):
-    SUCCESS = auto()
-    FAILURE = auto()
-    RUNNING = auto()
+class BTState(IntEnum):
+    # [최적화] 정수 상태 코드 (컴파일된 런타임은 int 비교만 수행)
+    SUCCESS = 1
+    FAILURE = 2
+    RUNNING = 3
+
+SUCCESS, FAILURE, RUNNING = int(BTState.SUCCESS), int(BTState.FAILURE), int(BTState.RUNNING)
+
+class BTEvent(str, Enum):
+    """AI가 게임 월드에 요청하는 부수 효과 (기존 문자열 값과 호환)"""
+    USE_SIREN = "USE_SIREN"
+    USE_SABOTAGE = "USE_SABOTAGE"
+    SHOOT_TARGET = "SHOOT_TARGET"
+    MURDER_OCCURRED = "MURDER_OCCURRED"
+    FOOTSTEP = "FOOTSTEP"
+
+class BTEventChannel:
+    """틱 동안 발생한 BTEvent를 모아두는 큐 (엔티티별 1개)"""
+    __slots__ = ('queue',)
+
+    def __init__(self):
+        self.queue = []
+
+    def emit(self, event):
+        self.queue.append(BTEvent(event))
+
+    def pop(self):
+        return self.queue.pop(0) if self.queue else None
+
+    def drain(self):
+        """남은 이벤트를 모두 꺼내고 큐를 비운다"""
+        events, self.queue = self.queue, []
+        return events
+
+    def clear(self):
+        self.queue.clear()
 
 class BTNode:
     def tick(self, entity, blackboard): return BTState.FAILURE
@@ -33,3 +65,138 @@ class Action(BTNode):
 class Condition(BTNode):
     def __init__(self, condition_func): self.condition_func = condition_func
     def tick(self, entity, blackboard): return BTState.SUCCESS if self.condition_func(entity, blackboard) else BTState.FAILURE
+
+# --- Compiled Runtime ---
+OP_SELECTOR, OP_SEQUENCE, OP_ACTION, OP_CONDITION = 0, 1, 2, 3
+
+class CompiledTree:
+    """
+    [최적화] 노드 객체 트리를 전위 순회 순서의 평면 배열로 변환한 실행기.
+    - 상태는 int 코드로만 비교 (Enum 생성/비교 없음)
+    - Condition 결과는 틱 단위로 메모이즈 (같은 함수는 한 틱에 한 번만 호출)
+    - RUNNING 액션이 있으면 다음 틱에 상위 분기의 가드 Condition만 재확인하고 바로 재개
+    - 액션이 반환한 문자열/BTEvent는 events 채널로 전달하고 SUCCESS로 취급
+    """
+    __slots__ = ('ops', 'funcs', 'children', 'parent', 'slots', 'guards',
+                 'memo_tick', 'memo_val', 'tick_id', 'running', 'events')
+
+    def __init__(self, root, events=None):
+        self.ops, self.funcs, self.children, self.parent, self.slots = [], [], [], [], []
+        slot_of = {}
+        self._emit(root, -1, slot_of)
+
+        n_slots = len(slot_of)
+        self.memo_tick = [0] * n_slots
+        self.memo_val = [False] * n_slots
+        self.tick_id = 0
+        self.running = -1
+        self.events = events if events is not None else BTEventChannel()
+        self.guards = [self._build_guards(i) if op == OP_ACTION else None for i, op in enumerate(self.ops)]
+
+    def _emit(self, node, parent, slot_of):
+        idx = len(self.ops)
+        self.parent.append(parent)
+        self.slots.append(-1)
+        self.children.append(())
+        if isinstance(node, (Selector, Sequence)):
+            self.ops.append(OP_SELECTOR if isinstance(node, Selector) else OP_SEQUENCE)
+            self.funcs.append(None)
+            self.children[idx] = tuple(self._emit(c, idx, slot_of) for c in node.children)
+        elif isinstance(node, Condition):
+            self.ops.append(OP_CONDITION)
+            self.funcs.append(node.condition_func)
+            # 동일한 조건 함수는 하나의 메모 슬롯을 공유
+            self.slots[idx] = slot_of.setdefault(node.condition_func, len(slot_of))
+        elif isinstance(node, Action):
+            self.ops.append(OP_ACTION)
+            self.funcs.append(node.action_func)
+        else:
+            raise TypeError(f"Cannot compile behavior node: {node!r}")
+        return idx
+
+    def _build_guards(self, idx):
+        """액션 idx를 재개하기 전에 다시 확인할 (조건 노드, 기대값) 목록. 재개 불가능하면 None"""
+        levels = []
+        child = idx
+        p = self.parent[idx]
+        while p != -1:
+            guards = []
+            levels.append(guards)
+            for sib in self.children[p]:
+                if sib == child: break
+                if self.ops[p] == OP_SEQUENCE:
+                    # 시퀀스 앞쪽 형제는 SUCCESS였어야 함 -> 조건만 재확인 가능
+                    if self.ops[sib] != OP_CONDITION: return None
+                    guards.append((sib, True))
+                else:
+                    # 셀렉터 앞쪽 형제는 FAILURE였어야 함 -> 선두 조건이 계속 거짓이어야 함
+                    lead = sib
+                    while self.ops[lead] == OP_SEQUENCE and self.children[lead]: lead = self.children[lead][0]
+                    if self.ops[lead] != OP_CONDITION: return None
+                    guards.append((lead, False))
+            child, p = p, self.parent[p]
+        # 실제 틱과 같은 순서(루트 쪽 형제부터)로 평가
+        return tuple(g for guards in reversed(levels) for g in guards)
+
+    def _cond(self, i, entity, bb):
+        s = self.slots[i]
+        if self.memo_tick[s] != self.tick_id:
+            self.memo_val[s] = bool(self.funcs[i](entity, bb))
+            self.memo_tick[s] = self.tick_id
+        return self.memo_val[s]
+
+    def _exec(self, i, entity, bb):
+        op = self.ops[i]
+        if op == OP_CONDITION:
+            return SUCCESS if self._cond(i, entity, bb) else FAILURE
+        if op == OP_ACTION:
+            status = self.funcs[i](entity, bb)
+            if status is None: status = SUCCESS
+            if isinstance(status, str):
+                self.events.emit(status); status = SUCCESS
+            if status == RUNNING: self.running = i
+            return status
+        return self._run_children(i, 0, entity, bb)
+
+    def _run_children(self, i, start, entity, bb):
+        kids = self.children[i]
+        if self.ops[i] == OP_SELECTOR:
+            for k in range(start, len(kids)):
+                status = self._exec(kids[k], entity, bb)
+                if status != FAILURE: return status
+            return FAILURE
+        for k in range(start, len(kids)):
+            status = self._exec(kids[k], entity, bb)
+            if status != SUCCESS: return status
+        return SUCCESS
+
+    def _resume(self, entity, bb):
+        r = self.running
+        for node, expected in self.guards[r]:
+            if self._cond(node, entity, bb) != expected: return None
+
+        self.running = -1
+        status = self._exec(r, entity, bb)
+        # 재개한 액션의 결과를 조상 합성 노드로 전파 (남은 형제 이어서 실행)
+        child, p = r, self.parent[r]
+        while p != -1:
+            op = self.ops[p]
+            if (op == OP_SELECTOR and status == FAILURE) or (op == OP_SEQUENCE and status == SUCCESS):
+                status = self._run_children(p, self.children[p].index(child) + 1, entity, bb)
+            child, p = p, self.parent[p]
+        return status
+
+    def reset(self):
+        self.running = -1
+        self.events.clear()
+
+    def tick(self, entity, blackboard):
+        self.tick_id += 1
+        if self.running != -1 and self.guards[self.running] is not None:
+            status = self._resume(entity, blackboard)
+            if status is not None: return status
+        self.running = -1
+        return self._exec(0, entity, blackboard)
+
+def compile_tree(root, events=None):
+    return CompiledTree(root, events)
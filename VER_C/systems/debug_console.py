@@ -1,6 +1,9 @@
 import pygame
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ITEMS
 from entities.npc import Dummy
+from systems.renderer import CharacterRenderer
+from managers.resource_manager import ResourceManager
+from ui.widgets.minimap import MinimapWidget
 from core.world import TILE_SIZE
 
 class DebugConsole:
@@ -10,7 +13,8 @@ class DebugConsole:
         self.active = False
         self.input_text = ""
         self.history = []
-        self.font = pygame.font.SysFont("consolas", 14)
+        self.resources = ResourceManager.get_instance()
+        self.font = ("consolas", 14)  # 텍스트 캐시 글꼴 (이름, 크기)
         self.height = 200
         self.bg_surf = pygame.Surface((SCREEN_WIDTH, self.height))
         self.bg_surf.fill((0, 0, 0))
@@ -25,7 +29,8 @@ class DebugConsole:
             'time': self.cmd_time,
             'god': self.cmd_god,
             'kill': self.cmd_kill,
-            'money': self.cmd_money
+            'money': self.cmd_money,
+            'stats': self.cmd_stats
         }
 
     def toggle(self):
@@ -84,13 +89,13 @@ class DebugConsole:
         # Draw History
         y = 10
         for line in self.history:
-            txt = self.font.render(line, True, (200, 200, 200))
+            txt = self.resources.render_text(line, (200, 200, 200), *self.font)
             screen.blit(txt, (10, y))
             y += 18
             
         # Draw Input Line
         pygame.draw.line(screen, (100, 100, 100), (0, self.height-25), (SCREEN_WIDTH, self.height-25))
-        input_surf = self.font.render(f"$ {self.input_text}", True, (255, 255, 0))
+        input_surf = self.resources.render_text(f"$ {self.input_text}", (255, 255, 0), *self.font)
         screen.blit(input_surf, (10, self.height - 20))
         
         # Cursor
@@ -101,7 +106,7 @@ class DebugConsole:
     # --- Commands ---
 
     def cmd_help(self, args):
-        return "Commands: spawn, give, tp, time, god, kill, money"
+        return "Commands: spawn, give, tp, time, god, kill, money, stats"
 
     def cmd_spawn(self, args):
         if not args: return "Usage: /spawn [role]"
@@ -166,3 +171,24 @@ class DebugConsole:
         amount = int(args[0]) if args else 100
         self.play_state.player.coins += amount
         return f"Added {amount} coins"
+
+    def cmd_stats(self, args):
+        # 렌더 캐시 적중률 (프로파일링용)
+        stats = CharacterRenderer.cache_stats()
+        stats['text'] = self.resources.text_stats()
+        for name, st in stats.items():
+            self.log(f"{name}: {st['size']} cached, hit {st['hit_rate'] * 100:.1f}% ({st['hits']}/{st['hits'] + st['misses']}), evicted {st['evictions']}")
+        renderer = self.play_state.map_renderer
+        if renderer: self.log(f"map chunks: {len(renderer.chunks)} cached, {renderer.stats}")
+        # 콘솔 기록은 10줄이므로 관련 카운터는 한 줄로 묶음
+        lighting = self.play_state.lighting
+        lightmap = f", lightmap {lighting.static_lights.stats}" if lighting.static_lights else ""
+        self.log(f"lighting: {lighting.stats}{lightmap}")
+        world = self.play_state.world
+        visibility = world.visibility.stats if world.visibility else None
+        self.log(f"visibility: {visibility}, projectiles: {world.projectiles.stats}")
+        hud = self.play_state.ui.hud if self.play_state.ui else None
+        if hud:
+            renders = {type(w).__name__: w.renders for w in hud.cached}
+            minimap = [w.stats for w in hud.live if isinstance(w, MinimapWidget)]
+            self.log(f"hud: {hud.stats}, renders {renders}, minimap {minimap[0] if minimap else None}")
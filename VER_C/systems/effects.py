@@ -1,10 +1,62 @@
 import pygame
 import math
 import random
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SHARED_FONTS
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.asset_cache import LRUCache
+from managers.resource_manager import ResourceManager, render_text_with_outline
+
+# 알파 단계별 복사본 캐시 {(원본 키, alpha 단계): Surface} - 매 프레임 copy()/set_alpha 대신 재사용
+ALPHA_CACHE = LRUCache(512)
+ALPHA_STEP = 16
+LABEL_FONT = "arial black"
+
+def _resources():
+    if not pygame.font.get_init():
+        pygame.font.init()
+    return ResourceManager.get_instance()
+
+def get_font(size):
+    # [최적화] 폰트 객체는 ResourceManager가 (이름, 크기)별로 공유
+    return _resources().get_sysfont(LABEL_FONT, size, True)
+
+def get_label(text, color, size, outline_color=(0, 0, 0), thickness=2):
+    """(text, color, size)별로 한 번만 렌더링한 외곽선 라벨 (ResourceManager 텍스트 캐시 공유)"""
+    key = (text, tuple(color), size, tuple(outline_color), thickness)
+    return key, _resources().render_text(text, color, LABEL_FONT, size, True, (outline_color, thickness))
+
+def get_alpha_variant(key, surf, alpha):
+    """surf를 ALPHA_STEP 단위로 양자화한 알파로 보여주는 복사본 (캐시, 원본은 건드리지 않음)"""
+    if alpha >= 255: return surf
+    step = max(0, alpha) // ALPHA_STEP
+    akey = (key, step)
+    out = ALPHA_CACHE.lookup(akey)
+    if out is None:
+        out = surf.copy(); out.set_alpha(step * ALPHA_STEP)
+        ALPHA_CACHE[akey] = out
+    return out
 
 class VisualSound:
+    # [최적화] 수명이 끝난 인스턴스를 재사용하는 풀
+    _pool = []
+    MAX_POOL = 64
+
+    @classmethod
+    def spawn(cls, x, y, text, color, size_scale=1.0, duration=1500, shake=False, blink=False):
+        """풀에서 꺼내 재초기화 (없으면 새로 생성)"""
+        if cls._pool:
+            fx = cls._pool.pop()
+            fx._init(x, y, text, color, size_scale, duration, shake, blink)
+            return fx
+        return cls(x, y, text, color, size_scale, duration, shake, blink)
+
+    @classmethod
+    def release(cls, fx):
+        if len(cls._pool) < cls.MAX_POOL: cls._pool.append(fx)
+
     def __init__(self, x, y, text, color, size_scale=1.0, duration=1500, shake=False, blink=False):
+        self._init(x, y, text, color, size_scale, duration, shake, blink)
+
+    def _init(self, x, y, text, color, size_scale, duration, shake, blink):
         self.x = x
         self.y = y
         self.text = str(text)
@@ -22,41 +74,22 @@ class VisualSound:
         self.speed = 1.2 * size_scale
 
         base_size = int(max(16, (52 * size_scale) * 0.5))
+        self.font = get_font(base_size)
 
-        # [최적화] 폰트 객체 캐싱 및 재사용
-        font_key = (base_size, 'arial black')
-        if font_key not in SHARED_FONTS:
-            if not pygame.font.get_init():
-                pygame.font.init()
-            try:
-                SHARED_FONTS[font_key] = pygame.font.SysFont("arial black", base_size, bold=True)
-            except:
-                SHARED_FONTS[font_key] = pygame.font.SysFont("arial", base_size, bold=True)
-        
-        self.font = SHARED_FONTS[font_key]
-
-        # [최적화] 깜빡임 효과용 이미지를 미리 생성 (매 프레임 렌더링 방지)
-        self.normal_image = self.render_text_with_outline(self.text, self.font, color, (0, 0, 0), 2)
-        self.blink_image = None
+        # [최적화] 라벨은 (text, color, size)별 캐시에서 공유 (깜빡임용 흰색 라벨 포함)
+        self.normal_key, self.normal_image = get_label(self.text, color, base_size)
+        self.blink_key, self.blink_image = None, None
         if self.blink:
-            self.blink_image = self.render_text_with_outline(self.text, self.font, (255, 255, 255), (0, 0, 0), 2)
-            
-        self.image = self.normal_image
+            self.blink_key, self.blink_image = get_label(self.text, (255, 255, 255), base_size)
+
+        self.image, self.image_key = self.normal_image, self.normal_key
 
         self.offset_x = 0
         self.offset_y = 0
         self.alpha = 255
 
     def render_text_with_outline(self, text, font, inner_color, outline_color, thickness):
-        text_surf = font.render(text, True, inner_color)
-        outline_surf = font.render(text, True, outline_color)
-        w, h = text_surf.get_size()
-        final_surf = pygame.Surface((w + thickness*2, h + thickness*2), pygame.SRCALPHA)
-
-        for dx, dy in [(-thickness,0), (thickness,0), (0,-thickness), (0,thickness)]:
-            final_surf.blit(outline_surf, (dx + thickness, dy + thickness))
-        final_surf.blit(text_surf, (thickness, thickness))
-        return final_surf
+        return render_text_with_outline(text, font, inner_color, outline_color, thickness)
 
     def update(self):
         now = pygame.time.get_ticks()
@@ -81,23 +114,35 @@ class VisualSound:
         # [Added] Blink Effect (최적화됨: 이미지 교체만 수행)
         if self.blink and self.blink_image:
             if (now // 200) % 2 == 0:
-                self.image = self.blink_image
+                self.image, self.image_key = self.blink_image, self.blink_key
             else:
-                self.image = self.normal_image
+                self.image, self.image_key = self.normal_image, self.normal_key
 
         if progress > 0.6:
             self.alpha = int(255 * (1 - (progress - 0.6) / 0.4))
         else:
             self.alpha = 255
 
-    def draw(self, screen, camera_x, camera_y):
-        if not self.alive: return
+    def blit_args(self, camera_x, camera_y):
+        """(Surface, 위치) - 알파는 캐시된 단계별 복사본 사용"""
         draw_x = self.x - camera_x - (self.image.get_width() // 2) + self.offset_x
         draw_y = self.y - camera_y - (self.image.get_height() // 2) + self.offset_y
+        return get_alpha_variant(self.image_key, self.image, self.alpha), (draw_x, draw_y)
 
-        draw_surf = self.image.copy()
-        draw_surf.set_alpha(self.alpha)
-        screen.blit(draw_surf, (draw_x, draw_y))
+    def draw(self, screen, camera_x, camera_y):
+        if not self.alive: return
+        screen.blit(*self.blit_args(camera_x, camera_y))
+
+def draw_effects(screen, effects, camera_x, camera_y):
+    """[최적화] 화면 안의 효과만 모아 blits 한 번으로 그림"""
+    sw, sh = screen.get_size()
+    batch = []
+    for fx in effects:
+        if not fx.alive: continue
+        surf, (x, y) = fx.blit_args(camera_x, camera_y)
+        if x > sw or y > sh or x + surf.get_width() < 0 or y + surf.get_height() < 0: continue
+        batch.append((surf, (x, y)))
+    if batch: screen.blits(batch, doreturn=False)
 
 class SoundDirectionIndicator:
     """[New] Indicates direction of sound if off-screen"""
@@ -147,6 +192,5 @@ class SoundDirectionIndicator:
         elapsed = pygame.time.get_ticks() - self.start_time
         alpha = 255 - int(255 * (elapsed / self.duration))
         
-        final_surf = self.glow_img.copy()
-        final_surf.set_alpha(alpha)
+        final_surf = get_alpha_variant('SOUND_GLOW', self.glow_img, alpha)
         screen.blit(final_surf, (edge_x - 100, edge_y - 100), special_flags=pygame.BLEND_ADD)
\ No newline at end of file
@@ -1,7 +1,6 @@
 import math
 import pygame
 from settings import TILE_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, INDOOR_ZONES
-from world.tiles import check_collision
 
 class FOV:
     def __init__(self, map_width, map_height, map_manager):
@@ -9,6 +8,9 @@ class FOV:
         self.map_height = map_height
         self.map_manager = map_manager
         
+        # 반경별 타일 단위 레이 트리 캐시 {radius: (dx, dy, skip)}
+        self._ray_trees = {}
+
         # [최적화] 삼각함수 Lookup Table 생성 (0도 ~ 360도)
         self.sin_table = {}
         self.cos_table = {}
@@ -46,9 +48,8 @@ class FOV:
             end_angle = 360
             angle_step = 3 
 
-        # [최적화] 지역 변수 캐싱
-        wall_data = self.map_manager.map_data['wall']
-        obj_data = self.map_manager.map_data['object']
+        # [최적화] 지역 변수 캐싱 (시야 차단은 MapManager의 공용 그리드 사용)
+        sight = self.map_manager.sight_cache
         zone_data = self.map_manager.zone_map
         width, height = self.map_width, self.map_height
         
@@ -76,24 +77,8 @@ class FOV:
                 
                 visible_tiles.add((gx, gy))
 
-                # [최적화] 직접 배열 접근 및 인라인 충돌 검사
-                # get_tile 함수 호출 제거
-                
-                # 1. 벽 충돌 검사
-                w_val = wall_data[gy][gx]
-                tid_wall = w_val[0] if isinstance(w_val, (tuple, list)) else w_val
-                
-                is_blocking = False
-                if tid_wall != 0 and check_collision(tid_wall):
-                    is_blocking = True
-                
-                # 2. 오브젝트(문 등) 충돌 검사
-                if not is_blocking:
-                    o_val = obj_data[gy][gx]
-                    tid_obj = o_val[0] if isinstance(o_val, (tuple, list)) else o_val
-                    
-                    if tid_obj != 0 and check_collision(tid_obj):
-                        is_blocking = True
+                # [최적화] 벽/오브젝트 충돌 검사를 캐시된 시야 차단 그리드 조회로 대체
+                is_blocking = sight[gy][gx]
 
                 # 3. 실내/실외 시야 차단 로직
                 target_zone = zone_data[gy][gx]
@@ -109,6 +94,66 @@ class FOV:
                     break
         return visible_tiles
 
+    def _get_ray_tree(self, radius):
+        """
+        타일 중심에서 쏜 레이들이 지나가는 타일 오프셋을 접두사 트리로 합쳐 전위 순서 배열로 저장.
+        skip[i]는 i번 노드의 하위 트리가 끝나는 다음 인덱스 (막힌 타일 뒤는 통째로 건너뜀).
+        """
+        if radius in self._ray_trees: return self._ray_trees[radius]
+
+        root = {}
+        max_dist_px = radius * TILE_SIZE
+        step_size = TILE_SIZE / 2.0
+        for deg in range(0, 360, 3):
+            # 첫 스텝이 원점 타일에 머무는 레이는 원점도 노드로 포함 (cast_rays와 동일한 차단 판정)
+            node, last = root, None
+            current_dist = 0
+            while current_dist < max_dist_px:
+                current_dist += step_size
+                off = (int((TILE_SIZE / 2 + self.cos_table[deg] * current_dist) // TILE_SIZE),
+                       int((TILE_SIZE / 2 + self.sin_table[deg] * current_dist) // TILE_SIZE))
+                if off == last: continue
+                node = node.setdefault(off, {}); last = off
+
+        dxs, dys, skip = [], [], []
+        def flatten(node):
+            for (dx, dy), child in node.items():
+                i = len(dxs)
+                dxs.append(dx); dys.append(dy); skip.append(0)
+                flatten(child)
+                skip[i] = len(dxs)
+        flatten(root)
+
+        tree = (tuple(dxs), tuple(dys), tuple(skip))
+        self._ray_trees[radius] = tree
+        return tree
+
+    def cast_tile_rays(self, gx, gy, radius):
+        """
+        [최적화] AI용 시야 계산: 타일 중심 기준 레이 트리를 순회하여 보이는 타일을 y * width + x 정수 집합으로 반환.
+        cast_rays와 같은 차단 규칙(시야 차단 그리드, 실외->실내 차단)을 사용한다.
+        """
+        width, height = self.map_width, self.map_height
+        visible = {gy * width + gx}
+        if radius <= 0 or not (0 <= gx < width and 0 <= gy < height): return visible
+
+        sight = self.map_manager.sight_cache
+        zone_data = self.map_manager.zone_map
+        is_viewer_indoors = zone_data[gy][gx] in INDOOR_ZONES
+        dxs, dys, skip = self._get_ray_tree(radius)
+
+        i, n = 0, len(dxs)
+        while i < n:
+            x, y = gx + dxs[i], gy + dys[i]
+            if not (0 <= x < width and 0 <= y < height):
+                i = skip[i]; continue
+            visible.add(y * width + x)
+            if sight[y][x] or (not is_viewer_indoors and zone_data[y][x] in INDOOR_ZONES):
+                i = skip[i]
+            else:
+                i += 1
+        return visible
+
     # [추가] 렌더링용 고해상도 다각형 계산 메서드
     def get_poly_points(self, px, py, radius, direction=None, angle_width=60):
         points = []
@@ -139,8 +184,7 @@ class FOV:
 
         # 최적화를 위한 지역 변수
         width, height = self.map_width, self.map_height
-        wall_data = self.map_manager.map_data['wall']
-        obj_data = self.map_manager.map_data['object']
+        sight = self.map_manager.sight_cache
         zone_data = self.map_manager.zone_map
         
         # Lookup table 캐싱
@@ -169,21 +213,10 @@ class FOV:
                     hit_x, hit_y = nx, ny
                     break
                 
-                # 충돌 검사
-                is_blocking = False
-                
-                # 1. Wall
-                w_val = wall_data[gy][gx]
-                tid_wall = w_val[0] if isinstance(w_val, (tuple, list)) else w_val
-                if tid_wall != 0 and check_collision(tid_wall): is_blocking = True
-                
-                # 2. Object
-                if not is_blocking:
-                    o_val = obj_data[gy][gx]
-                    tid_obj = o_val[0] if isinstance(o_val, (tuple, list)) else o_val
-                    if tid_obj != 0 and check_collision(tid_obj): is_blocking = True
+                # 충돌 검사 (Wall/Object -> 시야 차단 그리드)
+                is_blocking = sight[gy][gx]
 
-                # 3. Zone
+                # Zone
                 target_zone = zone_data[gy][gx]
                 is_target_indoors = (target_zone in INDOOR_ZONES)
                 if not is_player_indoors and is_target_indoors:
@@ -0,0 +1,156 @@
+import pygame
+from settings import TILE_SIZE
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 빛을 내는 타일: {tid: (반경(타일), 밝기 0~255)}
+LIGHT_TILES = {
+    7310010: (6, 170),  # Street Light (가로등)
+    8310016: (4, 150),  # Lamp (램프)
+    8320017: (3, 140),  # Fireplace (벽난로)
+}
+
+class StaticLightMap:
+    """
+    [최적화] 가로등/램프 같은 고정 광원을 타일 해상도 라이트맵(맵 크기 Surface, 알파 = 밝기)에 한 번 구워 둠.
+    - 빛은 광원 타일에서 보이는 타일(FOV 레이 트리)에만 닿고, 거리 제곱으로 감쇠
+    - 광원 타일이 바뀌거나 광원 근처 시야 차단이 바뀌면(문 열림 등) 다시 굽는다
+    - 화면에는 뷰포트에 걸친 부분만 잘라 타일 크기로 smoothscale한 결과를 캐시해 사용
+    """
+    def __init__(self, map_manager, fov):
+        self.map_manager = map_manager
+        self.fov = fov
+        self.lights = {}       # {(gx, gy): (radius, intensity)}
+        self.contrib = {}      # {(gx, gy): (타일 키 목록, 밝기 목록)} 광원별 기여 (바뀐 광원만 다시 계산)
+        self.surface = None    # map_w x map_h SRCALPHA, 흰색 + 알파
+        self.alpha = None      # numpy (h, w) uint8 밝기 (타일 단위 조명 모드용, numpy 없으면 None)
+        self.lit_rect = None   # 빛이 닿는 타일 범위 (없으면 None)
+        self.revision = 0      # 라이트맵이 다시 구워질 때마다 증가
+        self.seen_revision = map_manager.revision
+        self.seen_sight_revision = map_manager.sight_revision
+        self.view = None       # (key, 스케일된 Surface)
+        self.stats = {'bakes': 0, 'view_scales': 0}
+        self._scan()
+        self._bake()
+
+    def _scan(self):
+        mm = self.map_manager
+        self.lights = {}
+        for layer in ('wall', 'object'):
+            grid = mm.map_data[layer]
+            for y in range(mm.height):
+                row = grid[y]
+                for x in range(mm.width):
+                    t = row[x]
+                    tid = t[0] if isinstance(t, (tuple, list)) else t
+                    if tid in LIGHT_TILES: self.lights[(x, y)] = LIGHT_TILES[tid]
+
+    def _light_contrib(self, gx, gy, radius, intensity):
+        """광원에서 보이는 타일에 (1 - (d/(r+1))^2) 감쇠 밝기"""
+        w = self.map_manager.width
+        r2 = float((radius + 1) ** 2)
+        keys = self.fov.cast_tile_rays(gx, gy, radius)
+        if np is not None:
+            keys = np.fromiter(keys, dtype=np.int64)
+            dx = keys % w - gx; dy = keys // w - gy
+            return keys, intensity * np.clip(1.0 - (dx * dx + dy * dy) / r2, 0.0, 1.0)
+        keys = list(keys)
+        return keys, [intensity * max(0.0, 1.0 - ((k % w - gx) ** 2 + (k // w - gy) ** 2) / r2) for k in keys]
+
+    def _bake(self, dirty=None):
+        """dirty: 기여를 다시 계산할 광원 좌표 목록 (None이면 전체)"""
+        mm = self.map_manager
+        w, h = mm.width, mm.height
+        if dirty is None: self.contrib = {}
+        else:
+            for pos in dirty: self.contrib.pop(pos, None)
+        for pos, (radius, intensity) in self.lights.items():
+            if pos not in self.contrib: self.contrib[pos] = self._light_contrib(pos[0], pos[1], radius, intensity)
+        for pos in [p for p in self.contrib if p not in self.lights]: del self.contrib[pos]
+
+        # 광원별 기여를 누적 (겹치면 더해지고 255에서 포화)
+        if np is not None:
+            acc = np.zeros(w * h, dtype=np.float32)
+            if self.contrib:
+                np.add.at(acc, np.concatenate([k for k, _ in self.contrib.values()]),
+                          np.concatenate([v for _, v in self.contrib.values()]))
+            alpha = self.alpha = np.clip(acc, 0, 255).astype(np.uint8).reshape(h, w)
+            lit = np.argwhere(alpha > 0)
+        else:
+            acc = [0.0] * (w * h)
+            for keys, vals in self.contrib.values():
+                for k, v in zip(keys, vals): acc[k] += v
+
+        surf = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+        surf.fill((255, 255, 255, 0))
+        if np is not None:
+            pixels = pygame.surfarray.pixels_alpha(surf)
+            pixels[:w, :h] = alpha.T
+            del pixels
+            self.lit_rect = None
+            if len(lit):
+                (y0, x0), (y1, x1) = lit.min(0), lit.max(0)
+                self.lit_rect = pygame.Rect(int(x0), int(y0), int(x1 - x0 + 1), int(y1 - y0 + 1))
+        else:
+            self.lit_rect = None
+            for k, v in enumerate(acc):
+                if v <= 0: continue
+                x, y = k % w, k // w
+                surf.set_at((x, y), (255, 255, 255, min(255, int(v))))
+                r = pygame.Rect(x, y, 1, 1)
+                self.lit_rect = self.lit_rect.union(r) if self.lit_rect else r
+
+        self.surface = surf
+        self.revision += 1
+        self.view = None
+        self.stats['bakes'] += 1
+
+    def sync(self):
+        """맵 변경을 반영. 광원/광원 주변 시야가 바뀌었으면 다시 굽고 True"""
+        mm = self.map_manager
+        rescan = False
+        if mm.revision != self.seen_revision:
+            changed = mm.tiles_changed_since(self.seen_revision)
+            if changed is None: rescan = True
+            else:
+                for x, y in changed:
+                    t = mm.map_data['object'][y][x]; w = mm.map_data['wall'][y][x]
+                    now_lit = (t[0] if isinstance(t, (tuple, list)) else t) in LIGHT_TILES or \
+                              (w[0] if isinstance(w, (tuple, list)) else w) in LIGHT_TILES
+                    if now_lit or (x, y) in self.lights: rescan = True; break
+            self.seen_revision = mm.revision
+        if rescan:
+            # 광원이 생기거나 없어짐: 목록 갱신 후 전체 재계산 (드묾)
+            self._scan(); self._bake()
+            self.seen_sight_revision = mm.sight_revision
+            return True
+        if mm.sight_revision != self.seen_sight_revision:
+            # 시야 차단이 바뀐 곳 근처 광원만 다시 계산
+            dirty = [(gx, gy) for (gx, gy), (r, _) in self.lights.items()
+                     if mm.sight_changed_near(self.seen_sight_revision, gx, gy, r)]
+            self.seen_sight_revision = mm.sight_revision
+            if dirty:
+                self._bake(dirty)
+                return True
+        return False
+
+    def get_view(self, cam_x, cam_y, vw, vh):
+        """
+        뷰포트(월드 픽셀)에 걸친 라이트맵을 타일 크기로 확대한 (Surface, 화면 위치).
+        화면 안에 빛이 없으면 None. 카메라가 같은 타일 범위에 있으면 확대 결과 재사용.
+        """
+        if self.lit_rect is None: return None
+        tx0, ty0 = int(cam_x // TILE_SIZE) - 1, int(cam_y // TILE_SIZE) - 1
+        tx1, ty1 = int((cam_x + vw) // TILE_SIZE) + 2, int((cam_y + vh) // TILE_SIZE) + 2
+        area = pygame.Rect(tx0, ty0, tx1 - tx0, ty1 - ty0).clip(self.surface.get_rect())
+        if not area.colliderect(self.lit_rect): return None
+
+        key = (area.x, area.y, area.w, area.h, self.revision)
+        if self.view is None or self.view[0] != key:
+            scaled = pygame.transform.smoothscale(self.surface.subsurface(area), (area.w * TILE_SIZE, area.h * TILE_SIZE))
+            self.view = (key, scaled)
+            self.stats['view_scales'] += 1
+        return self.view[1], (int(area.x * TILE_SIZE - cam_x), int(area.y * TILE_SIZE - cam_y))
@@ -1,8 +1,18 @@
 import pygame
 import math
-from settings import PHASE_SETTINGS, DEFAULT_PHASE_DURATIONS, TILE_SIZE, VISION_RADIUS
+from settings import PHASE_SETTINGS, DEFAULT_PHASE_DURATIONS, TILE_SIZE, VISION_RADIUS, LIGHTING_MODE, LIGHTING_TILE_SUBDIV
+from systems.light_map import StaticLightMap
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class LightingManager:
+    # [최적화] 헤일로는 반경을 HALO_BUCKET_PX 단위로 묶어 스케일 결과를 캐시
+    HALO_BUCKET_PX = 8
+    MAX_HALOS = 16
+
     def __init__(self, game):
         self.game = game
         self.canvas = None
@@ -19,6 +29,29 @@ class LightingManager:
         # 그라데이션 미리 생성
         self.gradient_halo = self._create_smooth_gradient(1000)
 
+        # [최적화] 캐시: 반경별 헤일로, 마지막 빛 패치(시야 폴리곤 x 헤일로), 어둠 레이어 상태
+        self.halo_cache = {}        # {radius_px: Surface}
+        self.light_patch = None     # 플레이어 주변 (2r x 2r) 빛 Surface
+        self.light_key = None       # 패치를 만든 조건 (위치/반경/선명도/방향/맵 리비전)
+        self.dark_base = None       # 어둠 - 가로등 라이트맵 (라이트맵 뷰 크기)
+        self.dark_base_key = None   # (알파, 라이트맵 뷰 키)
+        self.dark_rects = []        # dark_surface에서 헤일로/시야 패치로 빛이 빠진 영역 (다음 프레임 복원용)
+        self.dark_state = None      # (알파, 기반 키/위치, 빛 조건/위치) 같으면 어둠 레이어 재사용
+        self.overlays = {}          # {(종류, ..., 캔버스 크기): Surface}
+        self.stats = {'halo_scales': 0, 'patch_builds': 0, 'dark_rebuilds': 0, 'dark_patches': 0, 'base_builds': 0}
+
+        # [New] 추가 광원: 고정 광원은 타일 해상도 라이트맵, 총구 섬광은 헤일로로 프레임마다 누적
+        self.static_lights = None   # StaticLightMap (맵 로드 후 첫 apply_lighting에서 생성)
+        self.flashes = []           # 짧은 섬광 [(x, y, radius_tiles, intensity, end_ms)]
+
+        # [최적화] 타일 단위 조명 모드 (numpy 필요): 작은 어둠 버퍼 -> 한 번 smoothscale
+        self.mode = LIGHTING_MODE
+        self.tile_subdiv = LIGHTING_TILE_SUBDIV
+        self.tile_dark = None       # 마지막 어둠 버퍼 (같으면 스케일 결과 재사용)
+        self.tile_small = None      # 버퍼 업로드용 작은 Surface
+        self.tile_scaled = None     # 확대된 어둠 Surface
+        self.tile_origin = None     # 버퍼 좌상단 타일 좌표
+
     def _create_smooth_gradient(self, radius):
         surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
         for r in range(radius, 0, -2):
@@ -27,6 +60,53 @@ class LightingManager:
             pygame.draw.circle(surf, (255, 255, 255, alpha), (radius, radius), r)
         return surf
 
+    def _get_halo(self, radius_px, intensity=255):
+        key = (radius_px, intensity)
+        halo = self.halo_cache.get(key)
+        if halo is None:
+            if len(self.halo_cache) >= self.MAX_HALOS: self.halo_cache.pop(next(iter(self.halo_cache)))
+            halo = pygame.transform.scale(self.gradient_halo, (radius_px * 2, radius_px * 2))
+            if intensity < 255: halo.fill((255, 255, 255, intensity), special_flags=pygame.BLEND_RGBA_MULT)
+            self.halo_cache[key] = halo
+            self.stats['halo_scales'] += 1
+        return halo
+
+    def flash(self, x, y, radius_tiles=3, duration_ms=120, intensity=230):
+        """총구 화염 같은 짧은 섬광"""
+        self.flashes.append((x, y, radius_tiles, intensity, pygame.time.get_ticks() + duration_ms))
+
+    def _collect_lights(self, camera):
+        """
+        화면에 걸친 추가 광원: (라이트맵 뷰 (Surface, 화면 위치, 뷰 키) 또는 None, 섬광 헤일로 [(Surface, 화면 위치)])
+        """
+        out = []
+        static = None
+        vw, vh = self.last_canvas_size
+        if self.static_lights and not getattr(self.game, 'is_blackout', False):
+            view = self.static_lights.get_view(camera.x, camera.y, vw, vh)
+            if view: static = (view[0], view[1], self.static_lights.view[0])
+
+        now = pygame.time.get_ticks()
+        if self.flashes: self.flashes = [f for f in self.flashes if f[4] > now]
+        bucket = self.HALO_BUCKET_PX
+        for x, y, radius_tiles, intensity, _ in self.flashes:
+            radius_px = max(bucket, int(radius_tiles * TILE_SIZE) // bucket * bucket)
+            sx, sy = int(x - camera.x) - radius_px, int(y - camera.y) - radius_px
+            if sx > vw or sy > vh or sx + radius_px * 2 < 0 or sy + radius_px * 2 < 0: continue
+            out.append((self._get_halo(radius_px, int(intensity)), (sx, sy)))
+        return static, out
+
+    def _build_light_patch(self, cx, cy, radius_tiles, radius_px, direction, angle_width, clarity):
+        """시야 폴리곤 x 헤일로를 빛의 바운딩 박스 크기 Surface 하나로 합성 (월드 좌표 (cx, cy) 중심)"""
+        patch = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
+        ox, oy = cx - radius_px, cy - radius_px
+        poly = self.game.fov.get_poly_points(cx, cy, radius_tiles, direction, angle_width)
+        if len(poly) > 2:
+            pygame.draw.polygon(patch, (255, 255, 255, clarity), [(px - ox, py - oy) for px, py in poly])
+        patch.blit(self._get_halo(radius_px), (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        self.stats['patch_builds'] += 1
+        return patch
+
     def update(self, dt):
         current_phase_key = self.game.current_phase
         phases = self.game.phases
@@ -54,40 +134,27 @@ class LightingManager:
             self.dark_surface = pygame.Surface((vw, vh), pygame.SRCALPHA)
             self.light_mask = pygame.Surface((vw, vh), pygame.SRCALPHA)
             self.last_canvas_size = (vw, vh)
+            self.dark_state = None; self.dark_rects = []
             
         return self.canvas # 캔버스 반환 (PlayState에서 여기에 맵을 그림)
 
     def apply_lighting(self, camera):
-        # 1. 어둠 적용
+        # 1. 어둠 알파
         final_alpha = 250 if getattr(self.game, 'is_blackout', False) else int(self.current_ambient_alpha)
         final_alpha = max(0, min(255, final_alpha))
-        self.dark_surface.fill((5, 5, 10, final_alpha))
 
-        # 2. 시야 처리 (새벽+비마피아 제외)
+        # 2. 시야(빛) 조건 계산 (새벽+비마피아 제외)
         player = self.game.player
+        tile_mode = self.tile_active
+        light_key = tile_light = None
         if not (self.game.current_phase == 'DAWN' and player.role != "MAFIA"):
-            self.light_mask.fill((0, 0, 0, 0))
-
             radius_tiles = player.get_vision_radius(self.current_vision_factor, getattr(self.game, 'is_blackout', False), getattr(self.game, 'weather', 'CLEAR'))
-            
+
             direction = None
             angle_width = 60
             if player.role == "POLICE" and player.flashlight_on and self.game.current_phase in ['EVENING', 'NIGHT', 'DAWN']:
                 direction = player.facing_dir
 
-            poly_points_abs = self.game.fov.get_poly_points(
-                player.rect.centerx, 
-                player.rect.centery, 
-                radius_tiles, 
-                direction, 
-                angle_width
-            )
-            
-            poly_points_rel = []
-            cam_x, cam_y = camera.x, camera.y
-            for px, py in poly_points_abs:
-                poly_points_rel.append((px - cam_x, py - cam_y))
-            
             draw_clarity = self.current_clarity
             if player.role == "POLICE" and player.flashlight_on:
                 draw_clarity = 240
@@ -96,35 +163,175 @@ class LightingManager:
 
             if getattr(self.game, 'is_blackout', False) and player.role != "MAFIA":
                 draw_clarity = min(draw_clarity, 50)
-            
-            if len(poly_points_rel) > 2:
-                pygame.draw.polygon(self.light_mask, (255, 255, 255, int(draw_clarity)), poly_points_rel)
 
-            radius_px = int(radius_tiles * TILE_SIZE * 1.2)
-            halo = pygame.transform.scale(self.gradient_halo, (radius_px * 2, radius_px * 2))
-            
-            px = player.rect.centerx - camera.x
-            py = player.rect.centery - camera.y
-            
-            self.light_mask.blit(halo, (px - radius_px, py - radius_px), special_flags=pygame.BLEND_RGBA_MULT)
-            self.dark_surface.blit(self.light_mask, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+            # [최적화] 페이즈 전환 중 연속으로 변하는 반경은 버킷 단위로 양자화 -> 헤일로/패치 재사용
+            bucket = self.HALO_BUCKET_PX
+            radius_px = max(bucket, int(radius_tiles * TILE_SIZE * 1.2) // bucket * bucket)
+            radius_tiles = radius_px / (TILE_SIZE * 1.2)
+            cx, cy = player.rect.centerx, player.rect.centery
+            light_key = (cx, cy, radius_px, int(draw_clarity), tuple(direction) if direction else None,
+                         self.game.world.map_manager.sight_revision)
+
+            if tile_mode:
+                tile_light = (cx, cy, radius_px, int(draw_clarity))
+            elif light_key != self.light_key:
+                self.light_patch = self._build_light_patch(cx, cy, radius_tiles, radius_px, direction, angle_width, int(draw_clarity))
+                self.light_key = light_key
+
+        # 추가 광원 (가로등 라이트맵은 광원/주변 시야가 바뀐 경우에만 다시 구움)
+        mm = self.game.world.map_manager
+        if self.static_lights is None or self.static_lights.map_manager is not mm:
+            self.static_lights = StaticLightMap(mm, self.game.fov)
+        else:
+            self.static_lights.sync()
+
+        if final_alpha == 0 and not self._has_overlay():
+            return # 낮: 어둠도 효과도 없으므로 합성 생략
+
+        if tile_mode:
+            if final_alpha > 0: self._apply_tile_lighting(camera, final_alpha, tile_light)
+            self._draw_overlays()
+            return
+
+        static, halos = self._collect_lights(camera) if final_alpha > 0 else (None, [])
+
+        # 3. 어둠 레이어 갱신
+        # - 가로등 라이트맵을 뺀 어둠은 (알파, 뷰 키)별로 한 번만 만들어 둔 기반(dark_base)에서 복사
+        # - 기반/위치가 같으면 지난 프레임 헤일로·시야 패치 영역만 복원하고 새 위치에 다시 뺌 (SUB는 0에서 포화 -> 순서 무관)
+        pos = None
+        if light_key is not None:
+            pos = (int(light_key[0] - camera.x) - light_key[2], int(light_key[1] - camera.y) - light_key[2])
+        base_pos = None
+        if static is not None:
+            base_key = (final_alpha, static[2])
+            if base_key != self.dark_base_key:
+                self.dark_base = pygame.Surface(static[0].get_size(), pygame.SRCALPHA)
+                self.dark_base.fill((5, 5, 10, final_alpha))
+                self.dark_base.blit(static[0], (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+                self.dark_base_key = base_key
+                self.stats['base_builds'] += 1
+            base_pos = static[1]
+        base = (final_alpha, self.dark_base_key if static is not None else None, base_pos)
+        state = (base, light_key, pos, tuple((id(surf), spos) for surf, spos in halos))
+        if state != self.dark_state:
+            dark_color = (5, 5, 10, final_alpha)
+            if self.dark_state is None or base != self.dark_state[0]:
+                self._restore_dark(self.dark_surface.get_rect(), dark_color, static is not None, base_pos)
+                self.stats['dark_rebuilds'] += 1
+            else:
+                for r in self.dark_rects: self._restore_dark(r, dark_color, static is not None, base_pos)
+                self.stats['dark_patches'] += 1
+            rects = [self.dark_surface.blit(surf, spos, special_flags=pygame.BLEND_RGBA_SUB) for surf, spos in halos]
+            if pos is not None: rects.append(self.dark_surface.blit(self.light_patch, pos, special_flags=pygame.BLEND_RGBA_SUB))
+            self.dark_rects = rects
+            self.dark_state = state
 
         self.canvas.blit(self.dark_surface, (0, 0))
-        
+        self._draw_overlays()
+
+    def _restore_dark(self, rect, dark_color, use_base, base_pos):
+        """dark_surface의 rect를 빛이 빠지기 전(어둠 또는 어둠 - 라이트맵 기반)으로 되돌림"""
+        ds = self.dark_surface
+        ds.fill(dark_color, rect)
+        if not use_base: return
+        r = rect.clip(pygame.Rect(base_pos, self.dark_base.get_size()))
+        if r.w and r.h:
+            # 빈 영역에 MAX 블렌드 = 그대로 복사 (알파 블렌딩 없이)
+            ds.fill((0, 0, 0, 0), r)
+            ds.blit(self.dark_base, r.topleft, r.move(-base_pos[0], -base_pos[1]), special_flags=pygame.BLEND_RGBA_MAX)
+
+    def _draw_overlays(self):
         # 효과 (얼음, 정전 등)
         now = pygame.time.get_ticks()
-        vw, vh = self.last_canvas_size
         
-        if getattr(self.game, 'is_mafia_frozen', False): 
+        if getattr(self.game, 'is_mafia_frozen', False):
             cycle = (now // 200) % 2
             flash_color = (255, 0, 0, 50) if cycle == 0 else (0, 0, 255, 50)
-            overlay = pygame.Surface((vw, vh), pygame.SRCALPHA)
-            overlay.fill(flash_color)
-            self.canvas.blit(overlay, (0, 0))
+            self.canvas.blit(self._get_overlay(('FROZEN', cycle), flash_color, 0), (0, 0))
 
         if getattr(self.game, 'is_blackout', False):
             cycle = (now // 500) % 2
             if cycle == 0:
-                overlay = pygame.Surface((vw, vh), pygame.SRCALPHA)
-                pygame.draw.rect(overlay, (255, 0, 0, 100), (0, 0, vw, vh), 20)
-                self.canvas.blit(overlay, (0, 0))
+                self.canvas.blit(self._get_overlay(('BLACKOUT',), (255, 0, 0, 100), 20), (0, 0))
+
+    @property
+    def tile_active(self):
+        """타일 조명이 실제로 쓰이는지 (시야 페이드 tile_alphas를 읽는 유일한 경로)"""
+        return self.mode == 'TILE' and np is not None
+
+    def set_mode(self, mode):
+        """'FULL' 또는 'TILE' (numpy가 없으면 TILE은 FULL로 동작)"""
+        self.mode = mode
+        self.dark_state = None; self.dark_rects = []
+        self.tile_dark = self.tile_small = self.tile_scaled = None
+
+    def _apply_tile_lighting(self, camera, final_alpha, light):
+        """
+        타일 해상도 조명: 어둠 = 주변 알파 - (시야 페이드 x 선명도 x 헤일로 감쇠 + 라이트맵 + 섬광).
+        (타일 x SUBDIV) 크기 버퍼를 numpy로 계산해 작은 Surface로 올리고 화면 크기로 한 번만 smoothscale.
+        """
+        sub = max(1, int(self.tile_subdiv)); cell = TILE_SIZE / sub
+        vw, vh = self.last_canvas_size
+        tx0, ty0 = int(camera.x // TILE_SIZE) - 1, int(camera.y // TILE_SIZE) - 1
+        tw, th = vw // TILE_SIZE + 3, vh // TILE_SIZE + 3
+        xs = tx0 * TILE_SIZE + (np.arange(tw * sub, dtype=np.float32) + 0.5) * cell
+        ys = ty0 * TILE_SIZE + (np.arange(th * sub, dtype=np.float32) + 0.5) * cell
+        acc = np.zeros((th * sub, tw * sub), dtype=np.float32)
+
+        def add_radial(x, y, radius_px, weight):
+            d2 = (xs[None, :] - x) ** 2 + (ys[:, None] - y) ** 2
+            np.add(acc, weight * np.clip(1.0 - d2 / float(radius_px * radius_px), 0.0, 1.0), out=acc)
+
+        if light is not None:
+            # 시야: tile_alphas(페이드 0~255) x 선명도, 플레이어 헤일로와 같은 (1 - (d/R)^2) 감쇠
+            cx, cy, radius_px, clarity = light
+            vis = self.game.tile_alphas.window(tx0, ty0, tw, th).astype(np.float32)
+            if sub > 1: vis = vis.repeat(sub, 0).repeat(sub, 1)
+            add_radial(cx, cy, radius_px, vis * (clarity / 255.0))
+
+        sl = self.static_lights
+        if sl is not None and sl.alpha is not None and not getattr(self.game, 'is_blackout', False):
+            h, w = sl.alpha.shape
+            x0, y0, x1, y1 = max(tx0, 0), max(ty0, 0), min(tx0 + tw, w), min(ty0 + th, h)
+            if x0 < x1 and y0 < y1:
+                part = sl.alpha[y0:y1, x0:x1].astype(np.float32)
+                if sub > 1: part = part.repeat(sub, 0).repeat(sub, 1)
+                acc[(y0 - ty0) * sub:(y1 - ty0) * sub, (x0 - tx0) * sub:(x1 - tx0) * sub] += part
+
+        now = pygame.time.get_ticks()
+        if self.flashes: self.flashes = [f for f in self.flashes if f[4] > now]
+        for x, y, radius_tiles, intensity, _ in self.flashes:
+            add_radial(x, y, max(1.0, radius_tiles * TILE_SIZE), float(intensity))
+
+        dark = np.clip(final_alpha - acc, 0, 255).astype(np.uint8)
+        origin = (tx0, ty0)
+        if self.tile_dark is None or origin != self.tile_origin or dark.shape != self.tile_dark.shape \
+                or not np.array_equal(dark, self.tile_dark):
+            size = (tw * sub, th * sub)
+            if self.tile_small is None or self.tile_small.get_size() != size:
+                self.tile_small = pygame.Surface(size, pygame.SRCALPHA)
+                self.tile_small.fill((5, 5, 10, 0))
+                self.tile_scaled = pygame.Surface((tw * TILE_SIZE, th * TILE_SIZE), pygame.SRCALPHA)
+            pixels = pygame.surfarray.pixels_alpha(self.tile_small)
+            pixels[:] = dark.T
+            del pixels
+            pygame.transform.smoothscale(self.tile_small, self.tile_scaled.get_size(), self.tile_scaled)
+            self.tile_dark, self.tile_origin = dark, origin
+            self.stats['dark_rebuilds'] += 1
+        self.canvas.blit(self.tile_scaled, (int(tx0 * TILE_SIZE - camera.x), int(ty0 * TILE_SIZE - camera.y)))
+
+    def _get_overlay(self, key, color, border):
+        """전체 화면 오버레이 Surface 재사용 (캔버스 크기 변경 시 새로 생성)"""
+        key = key + (self.last_canvas_size,)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            if len(self.overlays) > 8: self.overlays.clear()
+            vw, vh = self.last_canvas_size
+            overlay = pygame.Surface((vw, vh), pygame.SRCALPHA)
+            if border: pygame.draw.rect(overlay, color, (0, 0, vw, vh), border)
+            else: overlay.fill(color)
+            self.overlays[key] = overlay
+        return overlay
+
+    def _has_overlay(self):
+        return getattr(self.game, 'is_mafia_frozen', False) or getattr(self.game, 'is_blackout', False)
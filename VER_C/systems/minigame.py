@@ -3,6 +3,7 @@ import random
 import math
 from settings import *
 from colors import *
+from managers.resource_manager import ResourceManager
 
 class MiniGameManager:
     def __init__(self):
@@ -17,15 +18,11 @@ class MiniGameManager:
         self.bg_color = (25, 25, 35)
         self.border_color = (180, 180, 190)
 
-        # 폰트 로드 (시스템 폰트 -> 기본 폰트 순)
-        try:
-            self.font_title = pygame.font.SysFont("arial", 20, bold=True)
-            self.font_ui = pygame.font.SysFont("arial", 14) # UI 폰트 크기 조정
-            self.font_big = pygame.font.SysFont("arial", 30, bold=True)
-        except:
-            self.font_title = pygame.font.Font(None, 26)
-            self.font_ui = pygame.font.Font(None, 20)
-            self.font_big = pygame.font.Font(None, 34)
+        # 글꼴 (이름, 크기, bold) - 렌더링 결과는 ResourceManager 텍스트 캐시에서 공유
+        self.resources = ResourceManager.get_instance()
+        self.font_title = ("arial", 20, True)
+        self.font_ui = ("arial", 14, False) # UI 폰트 크기 조정
+        self.font_big = ("arial", 30, True)
 
         self.start_time = 0
         self.duration = 10000
@@ -226,14 +223,14 @@ class MiniGameManager:
         ratio = max(0, 1.0 - (now - self.start_time) / self.duration)
         pygame.draw.rect(screen, (0, 200, 0), (rect.x + 10, rect.y + 10, (self.width-20)*ratio, 4))
 
-        title = self.font_title.render(self.game_type, True, (255, 255, 255))
+        title = self.resources.render_text(self.game_type, (255, 255, 255), *self.font_title)
         screen.blit(title, (rect.centerx - title.get_width()//2, rect.y + 20))
         cx, cy = rect.centerx, rect.centery + 10
 
         if self.game_type == 'MASHING':
             pygame.draw.rect(screen, (40, 40, 40), (cx-80, cy, 160, 25))
             pygame.draw.rect(screen, (0, 255, 100), (cx-80, cy, 160*(self.mash_progress/100), 25))
-            t = self.font_ui.render("Mash SPACE!", True, (200, 200, 200))
+            t = self.resources.render_text("Mash SPACE!", (200, 200, 200), *self.font_ui)
             screen.blit(t, (cx - t.get_width()//2, cy + 30))
             
         elif self.game_type == 'TIMING':
@@ -247,7 +244,7 @@ class MiniGameManager:
             for i, c in enumerate(self.cmd_seq):
                 col = (0, 255, 0) if i < self.cmd_idx else (80, 80, 80)
                 if i == self.cmd_idx: col = (255, 255, 0)
-                txt = self.font_big.render({'UP':'▲','DOWN':'▼','LEFT':'◀','RIGHT':'▶'}[c], True, col)
+                txt = self.resources.render_text({'UP':'▲','DOWN':'▼','LEFT':'◀','RIGHT':'▶'}[c], col, *self.font_big)
                 screen.blit(txt, (start_x + i*35, cy-15))
                 
         elif self.game_type == 'CIRCLE':
@@ -287,7 +284,7 @@ class MiniGameManager:
                     
             # 하단 도움말
             msg = "Connect Matching Colors!"
-            help_txt = self.font_ui.render(msg, True, (180, 180, 180))
+            help_txt = self.resources.render_text(msg, (180, 180, 180), *self.font_ui)
             screen.blit(help_txt, (rect.centerx - help_txt.get_width()//2, rect.bottom - 16))
 
         elif self.game_type == 'MEMORY':
@@ -299,7 +296,7 @@ class MiniGameManager:
                     if item:
                         pygame.draw.rect(screen, (0, 150, 0) if item['clicked'] else (50, 50, 60), (bx, by, 30, 30))
                         if not item['clicked']:
-                            t = self.font_ui.render(str(item['num']), True, (255, 255, 255))
+                            t = self.resources.render_text(str(item['num']), (255, 255, 255), *self.font_ui)
                             screen.blit(t, (bx + 15 - t.get_width()//2, by + 15 - t.get_height()//2))
                             
         elif self.game_type == 'LOCKPICK':
@@ -344,5 +341,5 @@ class MiniGameManager:
                 pygame.draw.rect(screen, pin_col, pin_rect, border_radius=2)
                 
             # 안내 문구
-            t = self.font_ui.render("Press SPACE in Green Zone", True, (150, 150, 150))
+            t = self.resources.render_text("Press SPACE in Green Zone", (150, 150, 150), *self.font_ui)
             screen.blit(t, (cx - t.get_width()//2, rect.bottom - 25))
\ No newline at end of file
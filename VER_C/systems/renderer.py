@@ -1,15 +1,67 @@
 import pygame
+from collections import OrderedDict
 from settings import *
 from colors import *
+from managers.asset_cache import LRUCache
+from managers.resource_manager import ResourceManager
+
+# ResourceManager.render_text 글꼴 인자 (이름, 크기, bold)
+NAME_FONT = ("arial", 11, True)
+POPUP_FONT = ("arial", 12, True)
+
+class SpriteSheet:
+    """
+    [최적화] 같은 크기 스프라이트를 한 장의 Surface(시트)에 모아 굽는 캐시.
+    변형(key)마다 셀 하나를 할당하고 subsurface를 돌려준다. 셀이 다 차면 가장 오래 안 쓴 셀을 재사용(LRU).
+    """
+    def __init__(self, cell_w, cell_h, capacity=512, cols=16):
+        self.cell_w, self.cell_h, self.cols = cell_w, cell_h, cols
+        self.capacity = capacity
+        rows = (capacity + cols - 1) // cols
+        self.surface = pygame.Surface((cols * cell_w, rows * cell_h), pygame.SRCALPHA)
+        self.slots = OrderedDict()  # {key: (index, subsurface)}
+        self.free = list(range(capacity - 1, -1, -1))
+        self.hits = self.misses = self.evictions = 0
+
+    def lookup(self, key):
+        slot = self.slots.get(key)
+        if slot is None:
+            self.misses += 1
+            return None
+        self.slots.move_to_end(key); self.hits += 1
+        return slot[1]
+
+    def bake(self, key, draw_fn):
+        """빈 셀(없으면 LRU 셀)을 비우고 draw_fn(subsurface)로 그린 뒤 subsurface 반환"""
+        if not self.free:
+            _, (idx, _) = self.slots.popitem(last=False); self.evictions += 1
+        else:
+            idx = self.free.pop()
+        rect = pygame.Rect((idx % self.cols) * self.cell_w, (idx // self.cols) * self.cell_h, self.cell_w, self.cell_h)
+        self.surface.fill((0, 0, 0, 0), rect)
+        sub = self.surface.subsurface(rect)
+        draw_fn(sub)
+        self.slots[key] = (idx, sub)
+        return sub
+
+    def clear(self):
+        self.slots.clear()
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def __len__(self):
+        return len(self.slots)
+
+def _cache_stats(cache):
+    total = cache.hits + cache.misses
+    return {'size': len(cache), 'hits': cache.hits, 'misses': cache.misses, 'evictions': cache.evictions,
+            'hit_rate': cache.hits / total if total else 0.0}
 
 class CharacterRenderer:
-    _sprite_cache = {}
+    # [최적화] 역할/직업/방향/강조/커스터마이즈 변형을 스프라이트 시트에 지연 굽기 (LRU 제한)
+    _sprite_cache = SpriteSheet(TILE_SIZE, TILE_SIZE, capacity=512)
+    # 숨은 캐릭터 등 반투명 변형 {(sprite key, alpha): Surface}
+    _alpha_cache = LRUCache(128)
     
-    # [추가] 폰트 객체 미리 생성 (클래스 변수)
-    pygame.font.init()
-    NAME_FONT = pygame.font.SysFont("arial", 11, bold=True)
-    POPUP_FONT = pygame.font.SysFont("arial", 12, bold=True)
-
     # [최적화] 반복 사용되는 Rect 객체 상수화
     RECT_BODY = pygame.Rect(4, 4, 24, 24)
     RECT_CLOTH = pygame.Rect(4, 14, 24, 14)
@@ -18,27 +70,85 @@ class CharacterRenderer:
     RECT_HAT_TOP = pygame.Rect(2, 2, 28, 5)
     RECT_HAT_RIM = pygame.Rect(6, 0, 20, 7)
 
-    # [최적화] 텍스트 서피스 캐시 저장소
-    _name_surface_cache = {}
-
     @classmethod
     def clear_cache(cls):
         cls._sprite_cache.clear()
-        cls._name_surface_cache.clear()
+        cls._alpha_cache.clear()
 
     @classmethod
-    def _get_cache_key(cls, entity, is_highlighted):
+    def cache_stats(cls):
+        """스프라이트/알파 캐시 크기와 적중률 (디버그 콘솔 stats 명령용)"""
+        return {'sprites': _cache_stats(cls._sprite_cache), 'alpha': _cache_stats(cls._alpha_cache)}
+
+    @classmethod
+    def _get_cache_key(cls, entity, is_highlighted, current_phase="DAY"):
         skin_idx = entity.custom.get('skin', 0)
         cloth_idx = entity.custom.get('clothes', 0)
         hat_idx = entity.custom.get('hat', 0)
-        facing = getattr(entity, 'facing_dir', (0, 1))
-        
+        facing = tuple(getattr(entity, 'facing_dir', (0, 1)))
+        # 마피아는 밤에 다른 옷을 그리므로 키에 포함
+        night_outfit = entity.role == "MAFIA" and current_phase == "NIGHT"
+
         return (
             skin_idx, cloth_idx, hat_idx,
             entity.role, entity.sub_role,
-            facing, is_highlighted
+            facing, is_highlighted, night_outfit
         )
 
+    @staticmethod
+    def _draw_sprite(base_surf, entity, is_highlighted, current_phase):
+        skin_idx = entity.custom.get('skin', 0) % len(CUSTOM_COLORS['SKIN'])
+        cloth_idx = entity.custom.get('clothes', 0) % len(CUSTOM_COLORS['CLOTHES'])
+        body_color = CUSTOM_COLORS['SKIN'][skin_idx]
+        clothes_color = CUSTOM_COLORS['CLOTHES'][cloth_idx]
+
+        if is_highlighted:
+            body_color = (255, 50, 50)
+            clothes_color = (150, 0, 0)
+
+        pygame.draw.ellipse(base_surf, (0, 0, 0, 80), (4, TILE_SIZE - 8, TILE_SIZE - 8, 6))
+        pygame.draw.rect(base_surf, body_color, CharacterRenderer.RECT_BODY, border_radius=6)
+
+        if entity.role == "MAFIA":
+            if current_phase == "NIGHT":
+                pygame.draw.rect(base_surf, (30, 30, 35), CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
+                pygame.draw.polygon(base_surf, (180, 0, 0), [(16, 14), (13, 22), (19, 22)])
+            else:
+                fake_color = clothes_color
+                if entity.sub_role == "POLICE": fake_color = (20, 40, 120)
+                elif entity.sub_role == "DOCTOR": fake_color = (240, 240, 250)
+
+                pygame.draw.rect(base_surf, fake_color, CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
+                if entity.sub_role == "FARMER":
+                    pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_L)
+                    pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_R)
+
+        elif entity.role == "DOCTOR":
+            pygame.draw.rect(base_surf, (240, 240, 250), CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
+            pygame.draw.rect(base_surf, (255, 50, 50), (14, 16, 4, 10))
+            pygame.draw.rect(base_surf, (255, 50, 50), (11, 19, 10, 4))
+        elif entity.role == "POLICE":
+            pygame.draw.rect(base_surf, (20, 40, 120), CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
+            pygame.draw.circle(base_surf, (255, 215, 0), (10, 18), 3)
+        else:
+            pygame.draw.rect(base_surf, clothes_color, CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
+            if entity.sub_role == "FARMER":
+                pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_L)
+                pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_R)
+
+        f_dir = getattr(entity, 'facing_dir', (0, 1))
+        ox, oy = f_dir[0] * 3, f_dir[1] * 2
+        pygame.draw.circle(base_surf, (255, 255, 255), (16 - 5 + ox, 12 + oy), 3)
+        pygame.draw.circle(base_surf, (0, 0, 0), (16 - 5 + ox + f_dir[0], 12 + oy + f_dir[1]), 1)
+        pygame.draw.circle(base_surf, (255, 255, 255), (16 + 5 + ox, 12 + oy), 3)
+        pygame.draw.circle(base_surf, (0, 0, 0), (16 + 5 + ox + f_dir[0], 12 + oy + f_dir[1]), 1)
+
+        hat_idx = entity.custom.get('hat', 0) % len(CUSTOM_COLORS['HAT'])
+        if hat_idx > 0:
+            hat_color = CUSTOM_COLORS['HAT'][hat_idx]
+            pygame.draw.rect(base_surf, hat_color, CharacterRenderer.RECT_HAT_TOP)
+            pygame.draw.rect(base_surf, hat_color, CharacterRenderer.RECT_HAT_RIM)
+
     @staticmethod
     def draw_entity(screen, entity, camera_x, camera_y, viewer_role="PLAYER", current_phase="DAY", viewer_device_on=False):
         if not entity.alive: return
@@ -62,71 +172,20 @@ class CharacterRenderer:
             elif viewer_role == "SPECTATOR": is_visible, alpha = True, 120
             if not is_visible: return
 
-        cache_key = CharacterRenderer._get_cache_key(entity, is_highlighted)
-        
-        if cache_key in CharacterRenderer._sprite_cache:
-            base_surf = CharacterRenderer._sprite_cache[cache_key]
-        else:
-            base_surf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-            
-            skin_idx = entity.custom.get('skin', 0) % len(CUSTOM_COLORS['SKIN'])
-            cloth_idx = entity.custom.get('clothes', 0) % len(CUSTOM_COLORS['CLOTHES'])
-            body_color = CUSTOM_COLORS['SKIN'][skin_idx]
-            clothes_color = CUSTOM_COLORS['CLOTHES'][cloth_idx]
-
-            if is_highlighted:
-                body_color = (255, 50, 50)
-                clothes_color = (150, 0, 0)
-
-            pygame.draw.ellipse(base_surf, (0, 0, 0, 80), (4, TILE_SIZE - 8, TILE_SIZE - 8, 6))
-            pygame.draw.rect(base_surf, body_color, CharacterRenderer.RECT_BODY, border_radius=6)
-
-            if entity.role == "MAFIA":
-                if current_phase == "NIGHT":
-                    pygame.draw.rect(base_surf, (30, 30, 35), CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
-                    pygame.draw.polygon(base_surf, (180, 0, 0), [(16, 14), (13, 22), (19, 22)])
-                else:
-                    fake_color = clothes_color
-                    if entity.sub_role == "POLICE": fake_color = (20, 40, 120)
-                    elif entity.sub_role == "DOCTOR": fake_color = (240, 240, 250)
-
-                    pygame.draw.rect(base_surf, fake_color, CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
-                    if entity.sub_role == "FARMER":
-                        pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_L)
-                        pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_R)
-
-            elif entity.role == "DOCTOR":
-                pygame.draw.rect(base_surf, (240, 240, 250), CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
-                pygame.draw.rect(base_surf, (255, 50, 50), (14, 16, 4, 10))
-                pygame.draw.rect(base_surf, (255, 50, 50), (11, 19, 10, 4))
-            elif entity.role == "POLICE":
-                pygame.draw.rect(base_surf, (20, 40, 120), CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
-                pygame.draw.circle(base_surf, (255, 215, 0), (10, 18), 3)
-            else:
-                pygame.draw.rect(base_surf, clothes_color, CharacterRenderer.RECT_CLOTH, border_bottom_left_radius=6, border_bottom_right_radius=6)
-                if entity.sub_role == "FARMER":
-                    pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_L)
-                    pygame.draw.rect(base_surf, (120, 80, 40), CharacterRenderer.RECT_ARM_R)
-
-            f_dir = getattr(entity, 'facing_dir', (0, 1))
-            ox, oy = f_dir[0] * 3, f_dir[1] * 2
-            pygame.draw.circle(base_surf, (255, 255, 255), (16 - 5 + ox, 12 + oy), 3)
-            pygame.draw.circle(base_surf, (0, 0, 0), (16 - 5 + ox + f_dir[0], 12 + oy + f_dir[1]), 1)
-            pygame.draw.circle(base_surf, (255, 255, 255), (16 + 5 + ox, 12 + oy), 3)
-            pygame.draw.circle(base_surf, (0, 0, 0), (16 + 5 + ox + f_dir[0], 12 + oy + f_dir[1]), 1)
-
-            hat_idx = entity.custom.get('hat', 0) % len(CUSTOM_COLORS['HAT'])
-            if hat_idx > 0:
-                hat_color = CUSTOM_COLORS['HAT'][hat_idx]
-                pygame.draw.rect(base_surf, hat_color, CharacterRenderer.RECT_HAT_TOP)
-                pygame.draw.rect(base_surf, hat_color, CharacterRenderer.RECT_HAT_RIM)
-            
-            CharacterRenderer._sprite_cache[cache_key] = base_surf
+        cache_key = CharacterRenderer._get_cache_key(entity, is_highlighted, current_phase)
+        sheet = CharacterRenderer._sprite_cache
+        base_surf = sheet.lookup(cache_key)
+        if base_surf is None:
+            base_surf = sheet.bake(cache_key, lambda surf: CharacterRenderer._draw_sprite(surf, entity, is_highlighted, current_phase))
 
         final_surf = base_surf
         if alpha < 255:
-            final_surf = base_surf.copy()
-            final_surf.set_alpha(alpha)
+            # 반투명 변형도 캐시 (매 프레임 copy()/set_alpha 하지 않음)
+            akey = (cache_key, alpha)
+            final_surf = CharacterRenderer._alpha_cache.lookup(akey)
+            if final_surf is None:
+                final_surf = base_surf.copy(); final_surf.set_alpha(alpha)
+                CharacterRenderer._alpha_cache[akey] = final_surf
 
         screen.blit(final_surf, (draw_x, draw_y))
 
@@ -136,14 +195,8 @@ class CharacterRenderer:
         if entity.role == "POLICE" and viewer_role in ["POLICE", "SPECTATOR"]: name_color = (100, 180, 255)
         elif entity.role == "MAFIA" and viewer_role in ["MAFIA", "SPECTATOR"]: name_color = (255, 100, 100)
         
-        # 캐시 키: (엔티티ID 혹은 이름, 색상)
-        text_cache_key = (id(entity), entity.name, name_color)
-        
-        if text_cache_key in CharacterRenderer._name_surface_cache:
-            name_surf = CharacterRenderer._name_surface_cache[text_cache_key]
-        else:
-            name_surf = CharacterRenderer.NAME_FONT.render(entity.name, True, name_color)
-            CharacterRenderer._name_surface_cache[text_cache_key] = name_surf
+        # 공용 텍스트 캐시 (이름, 색상 기준 -> 판이 바뀌어도 누수 없음)
+        name_surf = ResourceManager.get_instance().render_text(entity.name, name_color, *NAME_FONT)
 
         # 캐릭터 가로 중심(TILE_SIZE/2)에서 텍스트 절반 너비만큼 빼서 중앙 정렬
         text_x = draw_x + (TILE_SIZE // 2) - (name_surf.get_width() // 2)
@@ -157,7 +210,7 @@ class CharacterRenderer:
                     continue
                 
                 if 'surface' not in p:
-                    p['surface'] = CharacterRenderer.POPUP_FONT.render(p['text'], True, p.get('color', (255, 255, 0)))
+                    p['surface'] = ResourceManager.get_instance().render_text(p['text'], p.get('color', (255, 255, 0)), *POPUP_FONT)
                 
                 p_surf = p['surface']
                 
@@ -171,58 +224,91 @@ class CharacterRenderer:
                 screen.blit(p_surf, (popup_x, popup_y))
 
 from world.tiles import get_texture
+from world.texture_atlas import TextureAtlas
 
 class MapRenderer:
     """
     [New] 화면에 보이는 타일만 렌더링하는 최적화된 맵 렌더러 (Culling 적용)
+    [최적화] 타일을 CHUNK_TILES x CHUNK_TILES 청크 Surface로 미리 구워 두고 청크 단위로 blit.
+    타일이 바뀌면(문 열림 등) 해당 청크만 다시 굽는다.
     """
+    CHUNK_TILES = 8
+    MIN_CACHED_CHUNKS = 32
+
     def __init__(self, map_manager):
         self.map_manager = map_manager
+        # [최적화] 시작 시 로드한 텍스처 아틀라스 사용 (게임 중 개별 PNG 로드 없음)
+        self.atlas = TextureAtlas.get_instance()
+        self.chunks = OrderedDict() # {(cx, cy): Surface} LRU
+        self.seen_revision = map_manager.revision
+        self.stats = {'baked': 0, 'invalidated': 0}
+
+    def _sync_revision(self):
+        mm = self.map_manager
+        if mm.revision == self.seen_revision: return
+        changed = mm.tiles_changed_since(self.seen_revision)
+        if changed is None:
+            self.stats['invalidated'] += len(self.chunks); self.chunks.clear()
+        else:
+            n = self.CHUNK_TILES
+            for gx, gy in changed:
+                if self.chunks.pop((gx // n, gy // n), None) is not None: self.stats['invalidated'] += 1
+        self.seen_revision = mm.revision
+
+    def _bake_chunk(self, cx, cy):
+        mm, n = self.map_manager, self.CHUNK_TILES
+        x0, y0 = cx * n, cy * n
+        x1, y1 = min(mm.width, x0 + n), min(mm.height, y0 + n)
+        surf = pygame.Surface(((x1 - x0) * TILE_SIZE, (y1 - y0) * TILE_SIZE))
+        surf.fill(COLORS['BG']) # 캔버스 배경과 동일 (빈 타일 영역)
+        if pygame.display.get_surface() is not None: surf = surf.convert()
+
+        textures = self.atlas.textures
+        for layer in (mm.map_data['floor'], mm.map_data['wall'], mm.map_data['object']):
+            for r in range(y0, y1):
+                row = layer[r]
+                dy = (r - y0) * TILE_SIZE
+                for c in range(x0, x1):
+                    tile_data = row[c]
+                    if isinstance(tile_data, (tuple, list)): tid, rot = tile_data[0], tile_data[1]
+                    else: tid, rot = tile_data, 0
+                    if tid != 0:
+                        img = textures.get((tid, rot))
+                        if img is None: img = get_texture(tid, rot)
+                        if img: surf.blit(img, ((c - x0) * TILE_SIZE, dy))
+        self.stats['baked'] += 1
+        return surf
 
     def draw(self, screen, camera, dt):
-        # 1. 카메라가 비추는 영역(Viewport) 계산
-        # 화면보다 여유 있게(-1 ~ +1 타일) 그려서 끊김 방지
+        self._sync_revision()
+
+        # 1. 카메라가 비추는 영역(Viewport)의 청크 범위 계산
         vw, vh = camera.width / camera.zoom_level, camera.height / camera.zoom_level
-        
-        start_col = int(max(0, camera.x // TILE_SIZE))
-        start_row = int(max(0, camera.y // TILE_SIZE))
-        end_col = int(min(self.map_manager.width, (camera.x + vw) // TILE_SIZE + 2))
-        end_row = int(min(self.map_manager.height, (camera.y + vh) // TILE_SIZE + 2))
+        chunk_px = self.CHUNK_TILES * TILE_SIZE
+        cols = (self.map_manager.width + self.CHUNK_TILES - 1) // self.CHUNK_TILES
+        rows = (self.map_manager.height + self.CHUNK_TILES - 1) // self.CHUNK_TILES
+
+        start_cx = int(max(0, camera.x // chunk_px))
+        start_cy = int(max(0, camera.y // chunk_px))
+        end_cx = int(min(cols, (camera.x + vw) // chunk_px + 1))
+        end_cy = int(min(rows, (camera.y + vh) // chunk_px + 1))
 
         # 2. 오프셋 미리 계산
         cam_x, cam_y = camera.x, camera.y
-        
-        # 3. 최적화된 지역 변수 참조
-        floors = self.map_manager.map_data['floor']
-        walls = self.map_manager.map_data['wall']
-        objects = self.map_manager.map_data['object']
-
-        # 4. 보이는 범위(Viewport)만 이중 반복문 순회
-        for r in range(start_row, end_row):
-            for c in range(start_col, end_col):
-                draw_x = c * TILE_SIZE - cam_x
-                draw_y = r * TILE_SIZE - cam_y
-
-                # (1) 바닥 (Floor)
-                tile_data = floors[r][c]
-                tid = tile_data[0] if isinstance(tile_data, (tuple, list)) else tile_data
-                rot = tile_data[1] if isinstance(tile_data, (tuple, list)) else 0
-                if tid != 0:
-                    img = get_texture(tid, rot)
-                    if img: screen.blit(img, (draw_x, draw_y))
-
-                # (2) 벽 (Wall)
-                tile_data = walls[r][c]
-                tid = tile_data[0] if isinstance(tile_data, (tuple, list)) else tile_data
-                rot = tile_data[1] if isinstance(tile_data, (tuple, list)) else 0
-                if tid != 0:
-                    img = get_texture(tid, rot)
-                    if img: screen.blit(img, (draw_x, draw_y))
-
-                # (3) 오브젝트 (Object)
-                tile_data = objects[r][c]
-                tid = tile_data[0] if isinstance(tile_data, (tuple, list)) else tile_data
-                rot = tile_data[1] if isinstance(tile_data, (tuple, list)) else 0
-                if tid != 0:
-                    img = get_texture(tid, rot)
-                    if img: screen.blit(img, (draw_x, draw_y))
+        chunks = self.chunks
+        blit = screen.blit
+
+        # 3. 보이는 청크만 blit (없으면 굽기)
+        for cy in range(start_cy, end_cy):
+            for cx in range(start_cx, end_cx):
+                key = (cx, cy)
+                surf = chunks.get(key)
+                if surf is None:
+                    surf = chunks[key] = self._bake_chunk(cx, cy)
+                else:
+                    chunks.move_to_end(key)
+                blit(surf, (cx * chunk_px - cam_x, cy * chunk_px - cam_y))
+
+        # 4. 메모리 제한 (화면에 보이는 청크 수의 2배 이상은 LRU로 정리)
+        limit = max(self.MIN_CACHED_CHUNKS, 2 * (end_cx - start_cx) * (end_cy - start_cy))
+        while len(chunks) > limit: chunks.popitem(last=False)
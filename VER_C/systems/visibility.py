@@ -0,0 +1,112 @@
+from settings import TILE_SIZE, VISION_RADIUS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class VisibilityService:
+    """
+    [최적화] AI용 시야 서비스.
+    엔티티별 가시 타일 집합을 FOV 레이 트리로 한 번 계산해 두고,
+    엔티티가 다른 타일로 이동하거나 주변의 시야 차단 타일이 바뀔 때만 다시 계산한다.
+    """
+    def __init__(self, map_manager, fov, radius=VISION_RADIUS['DAY']):
+        self.map_manager = map_manager
+        self.fov = fov
+        self.radius = radius
+        # {entity: (gx, gy, sight_revision, visible_set)}
+        self.cache = {}
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def visible_tiles(self, entity):
+        mm = self.map_manager
+        gx, gy = int(entity.rect.centerx // TILE_SIZE), int(entity.rect.centery // TILE_SIZE)
+        rev = mm.sight_revision
+
+        entry = self.cache.get(entity)
+        if entry is not None and entry[0] == gx and entry[1] == gy:
+            if entry[2] == rev or not mm.sight_changed_near(entry[2], gx, gy, self.radius + 1):
+                # 변경이 시야 밖이면 집합은 그대로, 기준 리비전만 갱신
+                if entry[2] != rev: self.cache[entity] = (gx, gy, rev, entry[3])
+                self.stats['hits'] += 1
+                return entry[3]
+
+        visible = self.fov.cast_tile_rays(gx, gy, self.radius)
+        self.cache[entity] = (gx, gy, rev, visible)
+        self.stats['misses'] += 1
+        return visible
+
+    def can_see(self, viewer, target):
+        tx, ty = int(target.rect.centerx // TILE_SIZE), int(target.rect.centery // TILE_SIZE)
+        return ty * self.map_manager.width + tx in self.visible_tiles(viewer)
+
+    def invalidate(self, entity):
+        self.cache.pop(entity, None)
+
+    def clear(self):
+        self.cache.clear()
+
+class TileFade:
+    """
+    [최적화] 플레이어 시야 타일의 페이드 인/아웃 알파 (0~255).
+    numpy가 있으면 맵 크기 uint8 배열을 가시 마스크로 한 번에 +/- speed 하고,
+    없으면 기존처럼 {(x, y): alpha} 딕셔너리로 처리한다.
+    """
+    def __init__(self, speed=15):
+        self.speed = speed
+        self.width = self.height = 0
+        self.alpha = None if np is None else np.zeros((0, 0), dtype=np.uint8)  # (h, w)
+        self.fading = {}  # numpy 없을 때만 사용
+
+    def _resize(self, width, height):
+        self.width, self.height = width, height
+        if np is not None: self.alpha = np.zeros((height, width), dtype=np.uint8)
+        else: self.fading.clear()
+
+    def update(self, visible_tiles, width, height):
+        """visible_tiles: {(x, y)} 이번 프레임 가시 타일"""
+        if (width, height) != (self.width, self.height): self._resize(width, height)
+        speed = self.speed
+        if np is None:
+            fading = self.fading
+            for tile in visible_tiles:
+                a = fading.get(tile, 0)
+                if a < 255: fading[tile] = min(255, a + speed)
+            for tile in [t for t in fading if t not in visible_tiles]:
+                fading[tile] -= speed
+                if fading[tile] <= 0: del fading[tile]
+            return
+
+        mask = np.zeros((height, width), dtype=bool)
+        if visible_tiles:
+            xy = np.array(list(visible_tiles), dtype=np.intp)
+            ok = (xy[:, 0] >= 0) & (xy[:, 0] < width) & (xy[:, 1] >= 0) & (xy[:, 1] < height)
+            mask[xy[ok, 1], xy[ok, 0]] = True
+        a = self.alpha.astype(np.int16)
+        a += np.where(mask, speed, -speed).astype(np.int16)
+        np.clip(a, 0, 255, out=a)
+        self.alpha = a.astype(np.uint8)
+
+    def get(self, x, y):
+        if np is None: return self.fading.get((x, y), 0)
+        if 0 <= x < self.width and 0 <= y < self.height: return int(self.alpha[y, x])
+        return 0
+
+    def window(self, x0, y0, w, h):
+        """타일 (x0, y0)부터 w x h 영역의 알파 (h, w) 배열, 맵 밖은 0 (numpy 전용)"""
+        out = np.zeros((h, w), dtype=np.uint8)
+        sx0, sy0 = max(x0, 0), max(y0, 0)
+        sx1, sy1 = min(x0 + w, self.width), min(y0 + h, self.height)
+        if sx0 < sx1 and sy0 < sy1:
+            out[sy0 - y0:sy1 - y0, sx0 - x0:sx1 - x0] = self.alpha[sy0:sy1, sx0:sx1]
+        return out
+
+    def items(self):
+        """0이 아닌 ((x, y), alpha) 목록"""
+        if np is None: return list(self.fading.items())
+        ys, xs = np.nonzero(self.alpha)
+        return [((int(x), int(y)), int(a)) for x, y, a in zip(xs, ys, self.alpha[ys, xs])]
+
+    def __len__(self):
+        return len(self.fading) if np is None else int(np.count_nonzero(self.alpha))
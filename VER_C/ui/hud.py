@@ -1,4 +1,5 @@
 import pygame
+from ui.widgets.base import CachedWidget
 from ui.widgets.status import PlayerStatusWidget
 from ui.widgets.environment import EnvironmentWidget
 from ui.widgets.controls import ControlsWidget
@@ -8,6 +9,11 @@ from ui.widgets.panels import EmotionPanelWidget
 from ui.widgets.tools import SpecialToolsWidget
 
 class HUD:
+    """
+    [최적화] 상태 기반 위젯(CachedWidget)은 바뀔 때만 다시 그려 화면 크기 레이어 한 장에 합성하고,
+    레이어는 바뀐 위젯 영역(dirty rect)만 지워 다시 합성한다. 매 프레임은 레이어의 위젯 영역만 blit.
+    월드 좌표를 따라가거나 매 프레임 움직이는 위젯(막대/미니맵/탐지기)은 그 위에 직접 그린다.
+    """
     def __init__(self, game):
         self.game = game
         self.widgets = [
@@ -19,9 +25,44 @@ class HUD:
             EmotionPanelWidget(game),
             SpecialToolsWidget(game)
         ]
+        self.cached = [w for w in self.widgets if isinstance(w, CachedWidget)]
+        self.live = [w for w in self.widgets if not isinstance(w, CachedWidget)]
+        self.layer = None
+        self.rects = {}  # {widget: 레이어 위 Rect} (숨김이면 없음)
+        self.stats = {'composites': 0}
+
+    def _compose(self, size):
+        layer = self.layer
+        if layer is None or layer.get_size() != size:
+            layer = self.layer = pygame.Surface(size, pygame.SRCALPHA)
+            self.rects.clear()
+            dirty = [layer.get_rect()]
+        else: dirty = []
+
+        for w in self.cached:
+            changed = w.refresh()
+            old = self.rects.get(w)
+            new = pygame.Rect(w.position(*size), w.size) if w.surface is not None else None
+            if changed or old != new:
+                if old is not None: dirty.append(old)
+                if new is not None: dirty.append(new); self.rects[w] = new
+                else: self.rects.pop(w, None)
+        if not dirty: return
+
+        # 바뀐 영역만 비우고 그 영역에 걸친 위젯을 다시 합성 (위젯 순서 유지)
+        for area in dirty:
+            layer.set_clip(area)
+            layer.fill((0, 0, 0, 0))
+            for w in self.cached:
+                r = self.rects.get(w)
+                if r is not None and r.colliderect(area): layer.blit(w.surface, r)
+        layer.set_clip(None)
+        self.stats['composites'] += 1
 
     def draw(self, screen):
         # 플레이어가 관전자일 경우 일부 위젯만 그리거나 스킵하는 로직은 각 위젯 내부에서 처리하도록 함
-        # 여기서는 순서대로 그리기만 함
-        for widget in self.widgets:
+        self._compose(screen.get_size())
+        layer = self.layer
+        for r in self.rects.values(): screen.blit(layer, r, r)
+        for widget in self.live:
             widget.draw(screen)
@@ -1,6 +1,15 @@
 import pygame
 from colors import COLORS
 from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.resource_manager import ResourceManager
+
+# 위젯 글꼴 (이름, 크기, bold)
+FONT_SPECS = {
+    'main': ("malgungothic", 20, False),
+    'small': ("malgungothic", 14, False),
+    'big': ("malgungothic", 30, True),
+    'digit': ("consolas", 18, True),
+}
 
 class UIWidget:
     def __init__(self, game):
@@ -12,18 +21,13 @@ class UIWidget:
         self._load_fonts()
 
     def _load_fonts(self):
-        # 폰트 로딩 (전역 캐싱을 고려할 수도 있으나, 여기서는 개별 로드 후 인스턴스 변수로 보유)
-        # 실제로는 ResourceManager를 쓰는 것이 더 좋지만, 기존 ui.py 로직을 따름
-        try:
-            self.font_main = pygame.font.SysFont("malgungothic", 20)
-            self.font_small = pygame.font.SysFont("malgungothic", 14)
-            self.font_big = pygame.font.SysFont("malgungothic", 30, bold=True)
-            self.font_digit = pygame.font.SysFont("consolas", 18, bold=True)
-        except:
-            self.font_main = pygame.font.Font(None, 24)
-            self.font_small = pygame.font.Font(None, 18)
-            self.font_big = pygame.font.Font(None, 40)
-            self.font_digit = pygame.font.Font(None, 20)
+        # 폰트 객체는 ResourceManager가 (이름, 크기, bold)별로 한 번만 만들어 위젯끼리 공유
+        res = self.resources = ResourceManager.get_instance()
+        self.font_main, self.font_small, self.font_big, self.font_digit = (res.get_sysfont(*FONT_SPECS[k]) for k in ('main', 'small', 'big', 'digit'))
+
+    def render_text(self, text, color, font='main'):
+        """매 프레임 그리는 글자용: ResourceManager 텍스트 캐시에서 Surface 재사용"""
+        return self.resources.render_text(text, color, *FONT_SPECS[font])
 
     def draw(self, screen):
         raise NotImplementedError
@@ -33,3 +37,39 @@ class UIWidget:
         pygame.draw.rect(s, (20, 20, 25, 200), (0, 0, w, h), border_radius=10)
         pygame.draw.rect(s, (80, 80, 90, 255), (0, 0, w, h), 2, border_radius=10)
         return s
+
+class CachedWidget(UIWidget):
+    """
+    [최적화] 상태가 바뀔 때만 자기 Surface에 다시 그리는 HUD 위젯.
+    - state(): 그림이 의존하는 상태를 해시 가능한 값으로 반환 (None이면 숨김)
+    - render(surf, state): size 크기 Surface에 로컬 좌표로 그리기
+    - position(w, h): 화면 크기 기준 좌상단 위치
+    HUD가 refresh() 결과를 한 장의 레이어에 합성한다. draw()는 단독 사용용.
+    """
+    size = (0, 0)
+    _UNSET = object()
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.surface = None
+        self.cached_state = self._UNSET
+        self.renders = 0
+
+    def state(self): raise NotImplementedError
+    def render(self, surf, state): raise NotImplementedError
+    def position(self, screen_w, screen_h): return (0, 0)
+
+    def refresh(self):
+        """상태가 바뀌었으면 다시 그리고 True"""
+        st = self.state()
+        if st == self.cached_state: return False
+        self.cached_state = st
+        if st is None: self.surface = None; return True
+        surf = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.render(surf, st)
+        self.surface = surf; self.renders += 1
+        return True
+
+    def draw(self, screen):
+        self.refresh()
+        if self.surface is not None: screen.blit(self.surface, self.position(*screen.get_size()))
@@ -1,32 +1,32 @@
 import pygame
-from ui.widgets.base import UIWidget
+from ui.widgets.base import CachedWidget
 
-class ControlsWidget(UIWidget):
-    def draw(self, screen):
-        w, h = screen.get_size()
-        icon_size = 50
-        gap = 10
-        start_x = 20
-        start_y = h - (icon_size * 2 + gap) - 20 
-        
-        def get_pos(col, row):
-            return start_x + col * (icon_size + gap), start_y + row * (icon_size + gap)
+ICON_SIZE = 50
+GAP = 10
 
-        self._draw_key_icon(screen, *get_pos(0, 0), "I", "인벤토리")
-        self._draw_key_icon(screen, *get_pos(1, 0), "Z", "투표")
-        self._draw_key_icon(screen, *get_pos(2, 0), "E", "상호작용")
-        
+class ControlsWidget(CachedWidget):
+    size = (ICON_SIZE * 3 + GAP * 2, ICON_SIZE * 2 + GAP)
+
+    def position(self, screen_w, screen_h): return (20, screen_h - self.size[1] - 20)
+
+    def state(self):
         role = self.game.player.role
         if role in ["CITIZEN", "DOCTOR"]:
-            q_label = "동체탐지"
+            return "동체탐지"
         elif role == "POLICE":
-            q_label = "사이렌"
-        else:
-            q_label = "특수스킬"
-        
-        self._draw_key_icon(screen, *get_pos(0, 1), "Q", q_label)
-        self._draw_key_icon(screen, *get_pos(1, 1), "R", "재장전")
-        self._draw_key_icon(screen, *get_pos(2, 1), "V", "행동")
+            return "사이렌"
+        return "특수스킬"
+
+    def render(self, surf, q_label):
+        def get_pos(col, row):
+            return col * (ICON_SIZE + GAP), row * (ICON_SIZE + GAP)
+
+        self._draw_key_icon(surf, *get_pos(0, 0), "I", "인벤토리")
+        self._draw_key_icon(surf, *get_pos(1, 0), "Z", "투표")
+        self._draw_key_icon(surf, *get_pos(2, 0), "E", "상호작용")
+        self._draw_key_icon(surf, *get_pos(0, 1), "Q", q_label)
+        self._draw_key_icon(surf, *get_pos(1, 1), "R", "재장전")
+        self._draw_key_icon(surf, *get_pos(2, 1), "V", "행동")
 
     def _draw_key_icon(self, screen, x, y, key, label):
         rect = pygame.Rect(x, y, 50, 50)
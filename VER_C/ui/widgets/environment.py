@@ -1,34 +1,39 @@
 import pygame
-from ui.widgets.base import UIWidget
+from ui.widgets.base import CachedWidget
 from settings import DEFAULT_PHASE_DURATIONS
 
-class EnvironmentWidget(UIWidget):
+DAY_PHASES = ("MORNING", "DAY", "NOON", "AFTERNOON")
+
+class EnvironmentWidget(CachedWidget):
+    size = (160, 80)
+
     def __init__(self, game):
         super().__init__(game)
-        self.width = 160
-        self.height = 80
+        self.width, self.height = self.size
         self.panel_bg = self.create_panel_bg(self.width, self.height)
 
-    def draw(self, screen):
-        w, h = screen.get_size()
-        x = w - self.width - 20
-        y = 20
+    def position(self, screen_w, screen_h): return (screen_w - self.width - 20, 20)
+
+    def state(self):
+        # 시계 문자열은 게임 내 1분마다 바뀜 -> 그때만 다시 렌더링
+        return (self._calculate_game_time(), self.game.current_phase in DAY_PHASES,
+                self.game.day_count, getattr(self.game, 'weather', 'CLEAR'))
+
+    def render(self, surf, state):
+        time_str, is_day, day_count, weather_str = state
         
         # 배경
-        screen.blit(self.panel_bg, (x, y))
+        surf.blit(self.panel_bg, (0, 0))
 
         # 시간 표시
-        time_str = self._calculate_game_time()
-        time_col = (100, 255, 100) if self.game.current_phase in ["MORNING", "DAY", "NOON", "AFTERNOON"] else (255, 100, 100)
-        
+        time_col = (100, 255, 100) if is_day else (255, 100, 100)
         time_surf = self.font_big.render(time_str, True, time_col)
-        screen.blit(time_surf, (x + self.width//2 - time_surf.get_width()//2, y + 10))
+        surf.blit(time_surf, (self.width//2 - time_surf.get_width()//2, 10))
         
         # 날씨 및 날짜
-        weather_str = getattr(self.game, 'weather', 'CLEAR')
-        info_str = f"Day {self.game.day_count} | {weather_str}"
+        info_str = f"Day {day_count} | {weather_str}"
         info_surf = self.font_small.render(info_str, True, (200, 200, 200))
-        screen.blit(info_surf, (x + self.width//2 - info_surf.get_width()//2, y + 50))
+        surf.blit(info_surf, (self.width//2 - info_surf.get_width()//2, 50))
 
     def _calculate_game_time(self):
         phase = self.game.current_phase
@@ -1,84 +1,103 @@
+import math
 import pygame
 from ui.widgets.base import UIWidget
 from settings import TILE_SIZE
 from world.tiles import TILE_DATA
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # 기본 색상 (TILE_DATA에 없는 경우 대비)
 DEFAULT_COLORS = {'floor': (40, 40, 40), 'wall': (100, 100, 100), 'object': (200, 200, 100)}
+BG_COLOR = (20, 20, 25)   # 색이 없는 칸
+MM_W, MM_H = 200, 150
 
 class MinimapWidget(UIWidget):
+    """
+    [최적화] 미니맵은 tid -> 색 테이블로 만든 1칸=1px 지도를 캐시하고,
+    map_manager.revision이 바뀌면 바뀐 칸만 다시 칠한다 (문 열림/파괴 반영). 기록이 밀리면 전체 재생성.
+    배경 패널+테두리+지도는 하나의 Surface로 합쳐 두고, 2초마다 갱신되는 레이더 점은 작은 오버레이에 그린다.
+    """
     def __init__(self, game):
         super().__init__(game)
-        self.minimap_surface = None
-        self.cached_minimap = None
+        self.minimap_surface = None  # 1칸 = 1px 지도
+        self.framed = None           # 패널 배경 + 테두리 + 축소 지도
+        self.seen_revision = -1
+        self.colors = {}             # {tid: (r, g, b)} 색이 있는 타일만
         self.radar_timer = 0
-        self.radar_blips = []
+        self.radar_overlay = None    # 마피아 정전 레이더 점 (mm 크기 SRCALPHA)
+        self.stats = {'full': 0, 'patched': 0}
+
+    def _build_colors(self):
+        self.colors = {tid: tuple(d['color'][:3]) for tid, d in TILE_DATA.items() if tid != 0 and d.get('color')}
+
+    def _cell_color(self, mm, x, y):
+        # 우선순위: Object > Wall > Floor
+        colors = self.colors
+        for ln in ('object', 'wall', 'floor'):
+            c = colors.get(mm.map_data[ln][y][x][0])
+            if c is not None: return c
+        return BG_COLOR
 
     def _generate_surface(self):
-        w, h = self.game.map_manager.width, self.game.map_manager.height
+        mm = self.game.map_manager
+        w, h = mm.width, mm.height
+        self._build_colors()
         surf = pygame.Surface((w, h))
-        surf.fill((20, 20, 25))
-        pixels = pygame.PixelArray(surf)
-        
-        floors = self.game.map_manager.map_data['floor']
-        walls = self.game.map_manager.map_data['wall']
-        objects = self.game.map_manager.map_data['object']
+        if np is None:
+            surf.fill(BG_COLOR)
+            for y in range(h):
+                for x in range(w):
+                    c = self._cell_color(mm, x, y)
+                    if c is not BG_COLOR: surf.set_at((x, y), c)
+            return surf
 
-        for y in range(h):
-            for x in range(w):
-                # 우선순위: Object > Wall > Floor
-                color = None
-                
-                # 1. Object
-                o_val = objects[y][x]
-                o_tid = o_val[0] if isinstance(o_val, (tuple, list)) else o_val
-                if o_tid != 0 and o_tid in TILE_DATA:
-                    color = TILE_DATA[o_tid].get('color')
-                
-                # 2. Wall (If no object or object has no color)
-                if color is None:
-                    w_val = walls[y][x]
-                    w_tid = w_val[0] if isinstance(w_val, (tuple, list)) else w_val
-                    if w_tid != 0 and w_tid in TILE_DATA:
-                        color = TILE_DATA[w_tid].get('color')
-                
-                # 3. Floor (If no wall/object)
-                if color is None:
-                    f_val = floors[y][x]
-                    f_tid = f_val[0] if isinstance(f_val, (tuple, list)) else f_val
-                    if f_tid != 0 and f_tid in TILE_DATA:
-                        color = TILE_DATA[f_tid].get('color')
-                
-                # Apply Color
-                if color:
-                    pixels[x, y] = color
-                else:
-                    # Fallback for empty/unknown
-                    pass 
-
-        pixels.close()
+        # [최적화] 레이어별 tid 배열 -> 고유 tid 색 조회 -> 아래 레이어부터 덮어 칠하고 surfarray로 한 번에 기록
+        rgb = np.empty((h, w, 3), dtype=np.uint8); rgb[:] = BG_COLOR
+        for ln in ('floor', 'wall', 'object'):
+            tids = np.array([[t[0] for t in row] for row in mm.map_data[ln]], dtype=np.int64).reshape(h, w)
+            uniq, inv = np.unique(tids, return_inverse=True)
+            lut = np.array([self.colors.get(t, (0, 0, 0)) for t in uniq.tolist()], dtype=np.uint8).reshape(-1, 3)
+            has = np.array([t in self.colors for t in uniq.tolist()], dtype=bool)
+            inv = inv.reshape(h, w)
+            mask = has[inv]
+            rgb[mask] = lut[inv[mask]]
+        pygame.surfarray.blit_array(surf, rgb.transpose(1, 0, 2))
         return surf
 
+    def _sync(self):
+        """맵 변경 반영. 지도가 바뀌었으면 True"""
+        mm = self.game.map_manager
+        if self.minimap_surface is not None and mm.revision == self.seen_revision: return False
+        changed = mm.tiles_changed_since(self.seen_revision) if self.minimap_surface is not None else None
+        if changed is None or self.minimap_surface.get_size() != (mm.width, mm.height):
+            self.minimap_surface = self._generate_surface(); self.stats['full'] += 1
+        else:
+            for x, y in set(changed): self.minimap_surface.set_at((x, y), self._cell_color(mm, x, y))
+            self.stats['patched'] += len(changed)
+        self.seen_revision = mm.revision
+        return True
+
+    def _build_framed(self):
+        s = pygame.Surface((MM_W, MM_H), pygame.SRCALPHA)
+        s.fill((0, 0, 0, 180))
+        pygame.draw.rect(s, (100, 100, 120), s.get_rect(), 2)
+        s.blit(pygame.transform.scale(self.minimap_surface, (MM_W - 4, MM_H - 4)), (2, 2))
+        self.framed = s
+
     def draw(self, screen):
         if self.game.player.role == "SPECTATOR": return
 
         w, h = screen.get_size()
-        mm_w, mm_h = 200, 150
+        mm_w, mm_h = MM_W, MM_H
         x = w - mm_w - 20
         y = h - 140 - 20 - mm_h - 10 # Emotion panel height assumed ~140
         
         mm_rect = pygame.Rect(x, y, mm_w, mm_h)
-        
-        s = pygame.Surface((mm_rect.width, mm_rect.height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 180))
-        screen.blit(s, mm_rect.topleft)
-        pygame.draw.rect(screen, (100, 100, 120), mm_rect, 2)
-        
-        if not self.minimap_surface:
-            self.minimap_surface = self._generate_surface()
-            self.cached_minimap = pygame.transform.scale(self.minimap_surface, (mm_w - 4, mm_h - 4))
-            
-        screen.blit(self.cached_minimap, (mm_rect.x + 2, mm_rect.y + 2))
+        if self._sync() or self.framed is None: self._build_framed()
+        screen.blit(self.framed, mm_rect.topleft)
         
         # Player Dot
         map_w_px = self.game.map_manager.width * TILE_SIZE
@@ -88,39 +107,44 @@ class MinimapWidget(UIWidget):
             dot_y = mm_rect.y + 2 + (self.game.player.rect.centery / map_h_px) * (mm_h - 4)
             pygame.draw.circle(screen, (0, 255, 0), (int(dot_x), int(dot_y)), 3)
 
-        # Radar / Special Detection
-        self._draw_radar(screen, mm_rect, map_w_px, map_h_px, mm_w, mm_h)
+            # Radar / Special Detection
+            self._draw_radar(screen, mm_rect, map_w_px, map_h_px, mm_w, mm_h)
 
     def _draw_radar(self, screen, mm_rect, map_w, map_h, mm_w, mm_h):
         is_blackout = getattr(self.game, 'is_blackout', False)
         
         if self.game.player.role == "MAFIA" and is_blackout:
             now = pygame.time.get_ticks()
-            if now > self.radar_timer:
+            if now > self.radar_timer or self.radar_overlay is None:
                 self.radar_timer = now + 2000
-                self.radar_blips = []
+                # 2초마다 오버레이에 한 번 그려 두고 매 프레임은 blit만
+                overlay = pygame.Surface((mm_w, mm_h), pygame.SRCALPHA)
                 for n in self.game.npcs:
                     if not n.alive: continue
                     color = (0, 255, 0)
                     if n.role == "POLICE": color = (0, 100, 255)
                     elif n.role == "MAFIA": color = (255, 0, 0)
-                    nx = mm_rect.x + 2 + (n.rect.centerx / map_w) * (mm_w - 4)
-                    ny = mm_rect.y + 2 + (n.rect.centery / map_h) * (mm_h - 4)
-                    self.radar_blips.append(((int(nx), int(ny)), color))
-            for pos, col in self.radar_blips: pygame.draw.circle(screen, col, pos, 4)
+                    nx = 2 + (n.rect.centerx / map_w) * (mm_w - 4)
+                    ny = 2 + (n.rect.centery / map_h) * (mm_h - 4)
+                    pygame.draw.circle(overlay, color, (int(nx), int(ny)), 4)
+                self.radar_overlay = overlay
+            screen.blit(self.radar_overlay, mm_rect.topleft)
+            return
+        self.radar_overlay = None
         
-        elif self.game.player.device_on:
+        if self.game.player.device_on:
             if self.game.player.role == "POLICE" and getattr(self.game, 'mafia_detected_by_cctv', False):
+                if (pygame.time.get_ticks() // 200) % 2 != 0: return
                 for n in self.game.npcs:
                     if n.role == "MAFIA" and n.alive:
                         nx = mm_rect.x + 2 + (n.rect.centerx / map_w) * (mm_w - 4)
                         ny = mm_rect.y + 2 + (n.rect.centery / map_h) * (mm_h - 4)
-                        if (pygame.time.get_ticks() // 200) % 2 == 0: pygame.draw.circle(screen, (255, 0, 0), (int(nx), int(ny)), 5)
+                        pygame.draw.circle(screen, (255, 0, 0), (int(nx), int(ny)), 5)
             elif self.game.player.role in ["CITIZEN", "DOCTOR"]:
-                 for n in self.game.npcs:
-                    if not n.alive: continue
-                    import math
-                    if math.sqrt((self.game.player.rect.centerx - n.rect.centerx)**2 + (self.game.player.rect.centery - n.rect.centery)**2) < 400 and getattr(n, 'is_moving', False):
-                         nx = mm_rect.x + 2 + (n.rect.centerx / map_w) * (mm_w - 4)
-                         ny = mm_rect.y + 2 + (n.rect.centery / map_h) * (mm_h - 4)
-                         pygame.draw.circle(screen, (0, 255, 0), (int(nx), int(ny)), 3)
\ No newline at end of file
+                px, py = self.game.player.rect.center
+                for n in self.game.npcs:
+                    if not n.alive or not getattr(n, 'is_moving', False): continue
+                    if math.hypot(px - n.rect.centerx, py - n.rect.centery) < 400:
+                        nx = mm_rect.x + 2 + (n.rect.centerx / map_w) * (mm_w - 4)
+                        ny = mm_rect.y + 2 + (n.rect.centery / map_h) * (mm_h - 4)
+                        pygame.draw.circle(screen, (0, 255, 0), (int(nx), int(ny)), 3)
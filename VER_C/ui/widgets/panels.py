@@ -1,38 +1,27 @@
 import pygame
-from ui.widgets.base import UIWidget
+from ui.widgets.base import CachedWidget
 from settings import FPS
 
-class EmotionPanelWidget(UIWidget):
+class EmotionPanelWidget(CachedWidget):
+    size = (220, 140)
+
     def __init__(self, game):
         super().__init__(game)
-        self.width = 220
-        self.height = 140
+        self.width, self.height = self.size
         self.panel_bg = self.create_panel_bg(self.width, self.height)
 
-    def draw(self, screen):
-        if self.game.player.role == "SPECTATOR": return
-
-        w, h = screen.get_size()
-        x = w - self.width - 20
-        y = h - self.height - 20
-        
-        screen.blit(self.panel_bg, (x, y))
+    def position(self, screen_w, screen_h): return (screen_w - self.width - 20, screen_h - self.height - 20)
 
+    def state(self):
         p = self.game.player
+        if p.role == "SPECTATOR": return None
+
         current_speed_frame = p.get_current_speed(getattr(p, 'weather', 'CLEAR'))
         current_speed_px = current_speed_frame * FPS 
         base_speed = 192 
         ratio = (current_speed_px / base_speed) * 100
-        
-        speed_col = (200, 255, 200) if ratio >= 100 else (255, 100, 100)
-        speed_text = self.font_main.render(f"SPEED: {int(current_speed_px)} px/s ({int(ratio)}%)", True, speed_col)
-        screen.blit(speed_text, (x + 15, y + 15))
-
-        pygame.draw.line(screen, (80, 80, 90), (x+15, y+40), (x+self.width-15, y+40), 1)
 
-        y_offset = 50
         active_statuses = []
-        
         for emo, val in p.emotions.items():
             if val:
                 if emo == 'FEAR': active_statuses.append(('FEAR', 'Speed -30%', (100, 100, 255)))
@@ -43,12 +32,26 @@ class EmotionPanelWidget(UIWidget):
             
         if p.status_effects.get('FATIGUE'): active_statuses.append(('FATIGUE', 'Speed -30%', (150, 150, 150)))
         if p.status_effects.get('DOPAMINE'): active_statuses.append(('DOPA', 'Speed +20%', (255, 0, 255)))
+        return (int(current_speed_px), int(ratio), ratio >= 100, tuple(active_statuses[:4]))
+
+    def render(self, surf, state):
+        speed_px, ratio, at_base, active_statuses = state
+        x, y = 0, 0
         
+        surf.blit(self.panel_bg, (x, y))
+
+        speed_col = (200, 255, 200) if at_base else (255, 100, 100)
+        speed_text = self.font_main.render(f"SPEED: {speed_px} px/s ({ratio}%)", True, speed_col)
+        surf.blit(speed_text, (x + 15, y + 15))
+
+        pygame.draw.line(surf, (80, 80, 90), (x+15, y+40), (x+self.width-15, y+40), 1)
+
+        y_offset = 50
         if not active_statuses:
             text = self.font_small.render("- Normal State -", True, (150, 150, 150))
-            screen.blit(text, (x + 15, y + y_offset))
+            surf.blit(text, (x + 15, y + y_offset))
         else:
-            for title, desc, color in active_statuses[:4]:
+            for title, desc, color in active_statuses:
                 text = self.font_small.render(f"■ {title}: {desc}", True, color)
-                screen.blit(text, (x + 15, y + y_offset))
+                surf.blit(text, (x + 15, y + y_offset))
                 y_offset += 20
@@ -66,17 +66,17 @@ class SpecialToolsWidget(UIWidget):
             screen.blit(s, (tx-10, ty-10))
 
         dist_val = f"{int(detect_range/32)}m"
-        lbl = self.font_digit.render(f"RNG: {dist_val}", True, (50, 180, 50))
+        lbl = self.render_text(f"RNG: {dist_val}", (50, 180, 50), 'digit')
         screen.blit(lbl, (cx - 30, cy + 90))
-        title = self.font_small.render("MOTION TRACKER", True, (150, 150, 150))
+        title = self.render_text("MOTION TRACKER", (150, 150, 150), 'small')
         screen.blit(title, (cx - title.get_width()//2, frame_rect.top + 10))
 
     def _draw_police_hud(self, screen, w, h):
         x, y = 240, h - 200
         screen.blit(self.police_bg, (x, y))
         
-        t = self.font_main.render("POLICE TERMINAL", True, (100, 200, 255))
+        t = self.render_text("POLICE TERMINAL", (100, 200, 255))
         screen.blit(t, (x + 100 - t.get_width()//2, y + 10))
         bullets = getattr(self.game.player, 'bullets_fired_today', 0)
-        t2 = self.font_small.render(f"Shots Fired: {bullets}/1", True, (200, 200, 200))
+        t2 = self.render_text(f"Shots Fired: {bullets}/1", (200, 200, 200), 'small')
         screen.blit(t2, (x + 20, y + 50))
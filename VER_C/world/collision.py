@@ -0,0 +1,82 @@
+from settings import TILE_SIZE
+
+class CollisionGrid:
+    """
+    [최적화] 비트 패킹 충돌 맵: 행마다 정수 하나(비트 x = 칸 (x, y) 막힘).
+    축 이동 한 번의 충돌 판정을 '겹친 행들의 비트 OR -> 열 마스크 -> 최하위/최상위 비트' 몇 번의 정수 연산으로 처리.
+    MapManager가 collision_cache와 함께 갱신한다.
+    """
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+        self.rows = [0] * height
+
+    def set(self, x, y, blocked):
+        if blocked: self.rows[y] |= 1 << x
+        else: self.rows[y] &= ~(1 << x)
+
+    def is_blocked(self, x, y):
+        if not (0 <= x < self.width and 0 <= y < self.height): return True
+        return (self.rows[y] >> x) & 1 == 1
+
+    def first_blocking(self, left, top, right, bottom, dx, dy):
+        """
+        이동 후 사각형(px, right/bottom 미포함)이 겹친 막힌 칸 중 이동 방향으로 가장 먼저 닿는 열(dx) 또는 행(dy).
+        없으면 None. dx > 0이면 가장 왼쪽 열, dx < 0이면 가장 오른쪽 열 (dy도 같은 규칙).
+        """
+        x0 = left // TILE_SIZE if left > 0 else 0
+        x1 = min(self.width - 1, (right - 1) // TILE_SIZE)
+        y0 = top // TILE_SIZE if top > 0 else 0
+        y1 = min(self.height - 1, (bottom - 1) // TILE_SIZE)
+        if x0 > x1 or y0 > y1: return None
+        mask = ((2 << (x1 - x0)) - 1) << x0
+        rows = self.rows
+        if dx:
+            bits = 0
+            for y in range(y0, y1 + 1): bits |= rows[y]
+            bits &= mask
+            if not bits: return None
+            return (bits & -bits).bit_length() - 1 if dx > 0 else bits.bit_length() - 1
+        if dy > 0:
+            for y in range(y0, y1 + 1):
+                if rows[y] & mask: return y
+        elif dy < 0:
+            for y in range(y1, y0 - 1, -1):
+                if rows[y] & mask: return y
+        return None
+
+    def move_axis(self, ent, dx, dy):
+        """엔티티를 한 축으로 이동하고 막힌 칸/맵 경계에 맞춰 밀어냄 (Entity.move_single_axis의 충돌 처리)"""
+        ent.pos_x += dx; ent.pos_y += dy
+        r = ent.rect
+        w, h = r.size
+        x, y = round(ent.pos_x), round(ent.pos_y)
+        hit = self.first_blocking(x, y, x + w, y + h, dx, dy)
+        if hit is not None:
+            if dx > 0: x = hit * TILE_SIZE - w
+            elif dx < 0: x = (hit + 1) * TILE_SIZE
+            if dy > 0: y = hit * TILE_SIZE - h
+            elif dy < 0: y = (hit + 1) * TILE_SIZE
+        # 맵 경계
+        if x < 0: x = 0
+        elif x + w > self.width * TILE_SIZE: x = self.width * TILE_SIZE - w
+        if y < 0: y = 0
+        elif y + h > self.height * TILE_SIZE: y = self.height * TILE_SIZE - h
+        r.topleft = (x, y)
+        ent.pos_x, ent.pos_y = x, y
+        return hit is not None
+
+    def move_batch(self, moves):
+        """
+        [최적화] 한 프레임의 NPC 이동 [(entity, dx, dy)]을 한 번에 처리 (x축 -> y축, 기존 두 번 호출과 같은 순서).
+        숨은 채 고체 타일 안에 있는 엔티티는 충돌 처리가 없는 기존 경로로 보냄.
+        """
+        move_axis = self.move_axis
+        for ent, dx, dy in moves:
+            if ent.hidden_in_solid:
+                ent.move_single_axis(dx, 0); ent.move_single_axis(0, dy)
+                continue
+            if dx > 0: ent.facing_right = True; ent.facing_dir = (1, 0)
+            elif dx < 0: ent.facing_right = False; ent.facing_dir = (-1, 0)
+            if dy > 0: ent.facing_dir = (0, 1)
+            elif dy < 0: ent.facing_dir = (0, -1)
+            move_axis(ent, dx, 0); move_axis(ent, 0, dy)
@@ -1,8 +1,15 @@
 import json
 import os
 import pygame
-from settings import TILE_SIZE
-from world.tiles import check_collision, NEW_ID_MAP, TILE_DATA, BED_TILES, HIDEABLE_TILES
+from collections import deque
+from settings import TILE_SIZE, INDOOR_ZONES
+from world.tiles import check_collision, get_tile_category, get_tile_function, NEW_ID_MAP, TILE_DATA, BED_TILES, HIDEABLE_TILES
+from world.tile_index import TileIndex, CellSet
+from world.collision import CollisionGrid
+from systems.logger import GameLogger
+
+DOOR_AUTO_CLOSE_MS = 5000  # 열린 문이 자동으로 닫히기까지
+DOOR_RETRY_MS = 250        # 문 앞에 누가 있으면 다시 확인할 간격
 
 class MapManager:
     def __init__(self):
@@ -13,15 +20,31 @@ class MapManager:
         }
         self.zone_map = []
         self.collision_cache = []  # [최적화] 충돌 맵 캐시 추가
+        self.collision_grid = None # [최적화] 비트 패킹 충돌 맵 (이동 충돌 판정용, collision_cache와 함께 갱신)
+        self.sight_cache = []      # [최적화] 시야 차단 맵 캐시 (FOV/AI 시야 공용)
+        self.revision = 0          # 타일이 바뀔 때마다 증가
+        self.sight_revision = 0    # 시야 차단 여부가 바뀔 때만 증가
+        self.sight_log = deque(maxlen=64)  # (sight_revision, gx, gy) 최근 변경 기록
+        self.tile_log = deque(maxlen=256)  # (revision, gx, gy) 최근 타일 변경 기록 (렌더 청크 무효화용)
         self.width = 0
         self.height = 0
         self.spawn_x = 100
         self.spawn_y = 100
-        self.tile_cache = {}
+        self.tile_index = TileIndex()  # [최적화] tid/카테고리 -> 칸 색인 (set_tile이 즉시 갱신)
+        # [최적화] 충돌 캐시와 함께 갱신되는 칸 색인 (전체 맵 스캔 없이 O(1) 무작위 선택)
+        self.spawn_cells = {}          # {zone_id: CellSet} 구역별 이동 가능 칸
+        self.floor_cells = CellSet()   # 이동 가능한 바닥 칸 (카테고리 1: 외부, 2: 내부)
+        self.home_cells = CellSet()    # 실내 구역의 문/침대 칸 (오브젝트 기능 2, 3)
         self.tile_cooldowns = {}
         self.open_doors = {}
+        # [최적화] GameWorld가 연결하는 타이머 스케줄러(core.scheduler.TimerQueue)와 점유 판정 함수(rect -> bool).
+        # 스케줄러가 없으면(맵 에디터 등) 열린 문은 자동으로 닫히지 않음
+        self.timers = None
+        self.occupied = None
         
         self.name_to_tid = {data['name']: tid for tid, data in TILE_DATA.items()}
+        self.door_table = {}   # {(tid, 'open'/'close'/'lock'/'unlock'): tid}
+        self._build_door_table()
 
     def get_tile(self, gx, gy, layer='floor'):
         # [최적화] 범위 검사 후 직접 접근 (isinstance 제거)
@@ -35,20 +58,34 @@ class MapManager:
             return self.map_data[layer][gy][gx]
         return (0, 0)
 
+    @staticmethod
+    def layer_for(tid):
+        # 간단한 ID 범위 체크 (tiles.py의 get_tile_type 로직 인라인화 가능하면 더 좋음)
+        if 1000000 <= tid < 3000000: return 'floor'
+        if 3000000 <= tid < 5000000: return 'wall'
+        return 'object'
+
     def set_tile(self, gx, gy, tid, rotation=0, layer=None):
         if not (0 <= gx < self.width and 0 <= gy < self.height): return
         
-        if layer is None:
-            # 간단한 ID 범위 체크 (tiles.py의 get_tile_type 로직 인라인화 가능하면 더 좋음)
-            if 1000000 <= tid < 3000000: layer = 'floor'
-            elif 3000000 <= tid < 5000000: layer = 'wall'
-            else: layer = 'object'
-            
+        if layer is None: layer = self.layer_for(tid)
+
+        # [최적화] 위치 색인 갱신: 이전 타일이 다른 레이어에도 없을 때만 제거
+        old = self.map_data[layer][gy][gx][0]
+        if old != tid:
+            others = [self.map_data[ln][gy][gx][0] for ln in ('floor', 'wall', 'object') if ln != layer]
+            if old not in others:
+                cat = get_tile_category(old)
+                self.tile_index.remove(old, gx, gy, keep_category=any(o and get_tile_category(o) == cat for o in others))
+            self.tile_index.add(tid, gx, gy)
+
         # [최적화] 항상 튜플로 저장
         self.map_data[layer][gy][gx] = (tid, rotation)
+        self.revision += 1
+        self.tile_log.append((self.revision, gx, gy))
         
         # [최적화] 타일 변경 시 해당 위치의 충돌 캐시만 즉시 갱신
-        self._update_collision_at(gx, gy)
+        if self.collision_cache: self._update_collision_at(gx, gy)
 
     # [최적화] 단일 타일 충돌 갱신 헬퍼
     def _update_collision_at(self, x, y):
@@ -66,22 +103,74 @@ class MapManager:
                     break
             
         self.collision_cache[y][x] = is_blocked
+        self.collision_grid.set(x, y, is_blocked)
+        self._update_spots_at(x, y, is_blocked)
+
+        # 시야 차단: 벽/오브젝트의 충돌 속성 (FOV와 동일한 규칙, 예외 타일 없음)
+        w_tid = self.map_data['wall'][y][x][0]
+        o_tid = self.map_data['object'][y][x][0]
+        blocks_sight = (w_tid != 0 and check_collision(w_tid)) or (o_tid != 0 and check_collision(o_tid))
+        if self.sight_cache[y][x] != blocks_sight:
+            self.sight_cache[y][x] = blocks_sight
+            self.sight_revision += 1
+            self.sight_log.append((self.sight_revision, x, y))
+
+    def _update_spots_at(self, x, y, is_blocked):
+        """스폰/바닥/집 칸 색인 갱신 (충돌 캐시 갱신 직후 호출)"""
+        row = self.zone_map[y] if y < len(self.zone_map) else None
+        zone = row[x] if row is not None and x < len(row) else 0
+        cell = (x, y)
+        # 구역은 게임 중 바뀌지 않음 (맵 로드 때만 설정) -> 해당 구역 집합만 갱신
+        if zone:
+            cells = self.spawn_cells.get(zone)
+            if cells is None: cells = self.spawn_cells[zone] = CellSet()
+            if is_blocked: cells.discard(cell)
+            else: cells.add(cell)
+
+        if not is_blocked and get_tile_category(self.map_data['floor'][y][x][0]) in (1, 2): self.floor_cells.add(cell)
+        else: self.floor_cells.discard(cell)
+
+        if zone in INDOOR_ZONES and get_tile_function(self.map_data['object'][y][x][0]) in (2, 3): self.home_cells.add(cell)
+        else: self.home_cells.discard(cell)
 
     # [최적화] 전체 맵 로드 시 충돌 맵 전체 빌드
     def build_collision_cache(self):
+        self.spawn_cells = {}; self.floor_cells = CellSet(); self.home_cells = CellSet()
         self.collision_cache = [[False for _ in range(self.width)] for _ in range(self.height)]
+        self.collision_grid = CollisionGrid(self.width, self.height)
+        self.sight_cache = [[False for _ in range(self.width)] for _ in range(self.height)]
         for y in range(self.height):
             for x in range(self.width):
                 self._update_collision_at(x, y)
+        self.sight_revision += 1
+        self.sight_log.clear()
+
+    def sight_changed_near(self, since_revision, gx, gy, radius):
+        """since_revision 이후 (gx, gy) 반경 radius 타일 안에서 시야 차단이 바뀌었는지 여부"""
+        if since_revision == self.sight_revision: return False
+        pending = self.sight_revision - since_revision
+        if pending > len(self.sight_log): return True
+        for i in range(len(self.sight_log) - pending, len(self.sight_log)):
+            _, x, y = self.sight_log[i]
+            if abs(x - gx) <= radius and abs(y - gy) <= radius: return True
+        return False
+
+    def tiles_changed_since(self, since_revision):
+        """since_revision 이후 바뀐 (gx, gy) 목록. 기록이 밀려 알 수 없으면 None"""
+        pending = self.revision - since_revision
+        if pending <= 0: return []
+        if pending > len(self.tile_log): return None
+        return [(x, y) for _, x, y in list(self.tile_log)[-pending:]]
 
     def get_spawn_points(self, zone_id=1):
-        points = []
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.zone_map[y][x] == zone_id:
-                    if not self.check_any_collision(x, y):
-                        points.append((x * TILE_SIZE, y * TILE_SIZE))
-        return points
+        cells = self.spawn_cells.get(zone_id)
+        return [(x * TILE_SIZE, y * TILE_SIZE) for x, y in cells] if cells else []
+
+    def sample_spawn_point(self, zone_id=1):
+        """구역 안 이동 가능 칸 하나의 픽셀 좌표 (없으면 None)"""
+        cells = self.spawn_cells.get(zone_id)
+        cell = cells.sample() if cells else None
+        return (cell[0] * TILE_SIZE, cell[1] * TILE_SIZE) if cell else None
 
     def check_any_collision(self, gx, gy):
         # [최적화] 캐시된 2차원 배열 조회로 대체 (O(1))
@@ -91,28 +180,21 @@ class MapManager:
         
         return self.collision_cache[gy][gx]
 
-    def update_doors(self, dt, entities):
-        now = pygame.time.get_ticks()
-        to_close = []
-        
-        # [최적화] 살아있는 엔티티의 Rect만 미리 계산 (배치 처리)
-        # collidelist 사용을 위해 Rect 리스트 생성
-        active_rects = [ent.rect.inflate(-15, -15) for ent in entities if ent.alive]
-        
-        for (gx, gy), open_time in list(self.open_doors.items()):
-            if now < open_time + 5000: continue 
+    def _auto_close(self, gx, gy):
+        """열린 지 DOOR_AUTO_CLOSE_MS가 지난 문 닫기 (타이머 콜백). 누가 서 있으면 재시도 간격(ms) 반환"""
+        if (gx, gy) not in self.open_doors: return None
+        door_rect = pygame.Rect(gx * TILE_SIZE, gy * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        if self.occupied and self.occupied(door_rect): return DOOR_RETRY_MS
+        if not self.close_door(gx, gy): self.open_doors.pop((gx, gy), None)
+        return None
 
-            door_rect = pygame.Rect(gx * TILE_SIZE, gy * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            
-            # [최적화] 파이썬 루프 대신 C로 구현된 collidelist 사용
-            # 충돌하는 엔티티가 하나라도 있으면 닫지 않음
-            if door_rect.collidelist(active_rects) != -1:
-                continue
-            
-            to_close.append((gx, gy))
-        
-        for (gx, gy) in to_close:
-            self.close_door(gx, gy)
+    # 문 상태 전이: 동작 -> [(찾을 상태, 바꿀 상태)] (앞의 규칙부터 시도)
+    DOOR_ACTIONS = {
+        'open': [("Closed", "Open")],
+        'close': [("Open", "Closed")],
+        'lock': [("Closed", "Locked")],
+        'unlock': [("Locked", "Closed")],
+    }
 
     def _find_state_tile(self, current_tid, find_str, replace_str):
         if current_tid not in TILE_DATA: return None
@@ -134,41 +216,51 @@ class MapManager:
                 
         return None
 
-    def open_door(self, gx, gy, layer='object'):
-        tid, rot = self.get_tile_full(gx, gy, layer)
-        target_tid = self._find_state_tile(tid, "Closed", "Open")
-        if not target_tid:
-            target_tid = self._find_state_tile(tid, "Locked", "Open")
-            
-        if target_tid:
-            self.set_tile(gx, gy, target_tid, rotation=rot, layer=layer)
-            self.open_doors[(gx, gy)] = pygame.time.get_ticks()
+    def _build_door_table(self):
+        """
+        [최적화] 이름 치환(_find_state_tile)은 시작 시 한 번만 수행해 {(tid, 동작): tid} 전이표로 컴파일.
+        문 상호작용마다 문자열 치환/역조회를 하지 않음.
+        """
+        table = {}
+        for tid in TILE_DATA:
+            for action, rules in self.DOOR_ACTIONS.items():
+                for find_str, replace_str in rules:
+                    target = self._find_state_tile(tid, find_str, replace_str)
+                    if target and target != tid: table[(tid, action)] = target; break
+        self.door_table = table
 
-    def close_door(self, gx, gy, layer='object'):
-        tid, rot = self.get_tile_full(gx, gy, layer)
-        target_tid = self._find_state_tile(tid, "Open", "Closed")
-        
-        if target_tid:
-            self.set_tile(gx, gy, target_tid, rotation=rot, layer=layer)
-            if (gx, gy) in self.open_doors: del self.open_doors[(gx, gy)]
+        # 검증: 열기/닫기, 잠금/해제가 서로 되돌아오는지 확인 (데이터 오류는 로그만 남김)
+        inverse = {'open': 'close', 'close': 'open', 'lock': 'unlock', 'unlock': 'lock'}
+        broken = []
+        for (tid, action), target in table.items():
+            if table.get((target, inverse[action])) != tid: broken.append(f"{tid}:{action}->{target}")
+        if broken:
+            GameLogger.get_instance().error("MAP", f"Door transition table has {len(broken)} one-way entries: {', '.join(broken[:8])}")
+        return table
 
-    def lock_door(self, gx, gy, layer='object'):
-        tid, rot = self.get_tile_full(gx, gy, layer)
-        target_tid = self._find_state_tile(tid, "Closed", "Locked")
-        
-        if target_tid:
-            self.set_tile(gx, gy, target_tid, rotation=rot, layer=layer)
-            return True
-        return False
+    def door_target(self, tid, action):
+        """tid 문에 action('open'/'close'/'lock'/'unlock')을 적용한 결과 tid (불가능하면 None)"""
+        return self.door_table.get((tid, action))
 
-    def unlock_door(self, gx, gy, layer='object'):
+    def apply_door_action(self, gx, gy, action, layer='object'):
         tid, rot = self.get_tile_full(gx, gy, layer)
-        target_tid = self._find_state_tile(tid, "Locked", "Closed")
-        
-        if target_tid:
-            self.set_tile(gx, gy, target_tid, rotation=rot, layer=layer)
-            return True
-        return False
+        target_tid = self.door_table.get((tid, action))
+        if not target_tid: return False
+        self.set_tile(gx, gy, target_tid, rotation=rot, layer=layer)
+        if action == 'open':
+            now = pygame.time.get_ticks()
+            self.open_doors[(gx, gy)] = now
+            if self.timers is not None:
+                self.timers.schedule(now + DOOR_AUTO_CLOSE_MS, lambda t, gx=gx, gy=gy: self._auto_close(gx, gy), key=('door', gx, gy))
+        elif action == 'close':
+            self.open_doors.pop((gx, gy), None)
+            if self.timers is not None: self.timers.cancel(('door', gx, gy))
+        return True
+
+    def open_door(self, gx, gy, layer='object'): return self.apply_door_action(gx, gy, 'open', layer)
+    def close_door(self, gx, gy, layer='object'): return self.apply_door_action(gx, gy, 'close', layer)
+    def lock_door(self, gx, gy, layer='object'): return self.apply_door_action(gx, gy, 'lock', layer)
+    def unlock_door(self, gx, gy, layer='object'): return self.apply_door_action(gx, gy, 'unlock', layer)
 
     def load_map(self, filename="map.json"):
         if not os.path.exists(filename): self.create_default_map(); return True
@@ -200,7 +292,7 @@ class MapManager:
             self.zone_map = data.get('zones', [[0 for _ in range(self.width)] for _ in range(self.height)])
             # [최적화] 맵 로드 후 캐시 생성
             self.build_collision_cache()
-            self.build_tile_cache()
+            self.build_tile_index()
             
             for y in range(self.height):
                 for x in range(self.width):
@@ -211,17 +303,17 @@ class MapManager:
         except Exception as e:
             import traceback; traceback.print_exc(); self.create_default_map(); return True
 
-    def build_tile_cache(self):
-        self.tile_cache = {}
+    def build_tile_index(self):
+        # 맵 전체가 바뀜 -> 변경 기록으로 추적 불가 (렌더 청크 전체 무효화)
+        self.revision += 1; self.tile_log.clear()
+        self.tile_index.clear()
         for ln in ['floor', 'wall', 'object']:
             grid = self.map_data[ln]
             for y in range(len(grid)):
                 for x in range(len(grid[y])):
                     tid = grid[y][x][0]
-                    if tid == 0: continue
-                    if tid not in self.tile_cache: self.tile_cache[tid] = []
-                    self.tile_cache[tid].append((x * TILE_SIZE, y * TILE_SIZE))
-        return self.tile_cache
+                    if tid: self.tile_index.add(tid, x, y)
+        return self.tile_index
 
     def create_default_map(self):
         self.width, self.height = 40, 30
@@ -237,7 +329,7 @@ class MapManager:
         for y in range(2, 5):
             for x in range(2, 5): self.zone_map[y][x] = 1
         self.open_doors = {}
-        self.build_tile_cache()
+        self.build_tile_index()
         self.build_collision_cache() # [최적화]
 
     def is_tile_on_cooldown(self, gx, gy):
@@ -248,4 +340,10 @@ class MapManager:
         return False
 
     def set_tile_cooldown(self, gx, gy, duration_ms=3000):
-        self.tile_cooldowns[(gx, gy)] = pygame.time.get_ticks() + duration_ms
\ No newline at end of file
+        due = self.tile_cooldowns[(gx, gy)] = pygame.time.get_ticks() + duration_ms
+        # 조회되지 않은 쿨다운도 만료 시 정리
+        if self.timers is not None:
+            self.timers.schedule(due, lambda t, gx=gx, gy=gy: self._expire_cooldown(gx, gy), key=('cooldown', gx, gy))
+
+    def _expire_cooldown(self, gx, gy):
+        self.tile_cooldowns.pop((gx, gy), None)
\ No newline at end of file
@@ -0,0 +1,118 @@
+import pygame
+import os
+import glob
+import hashlib
+from world import tiles
+from world.tiles import TILE_DATA, NOISE_BACKEND, asset_cache, bake_textures, surface_from_bytes
+
+ROTATIONS = (0, 90, 180, 270)
+ATLAS_COLS = 32
+TEX_SIZE = 32
+
+class TextureAtlas:
+    """
+    [최적화] 모든 타일(TILE_DATA x 4방향)을 한 장의 Surface로 묶은 텍스처 아틀라스.
+    - 타일 생성 코드(world/tiles.py)와 타일 데이터의 해시로 파일명을 정해 디스크에 한 파일로 저장
+    - 시작 시 한 번 로드하고, 각 (tid, rotation)은 아틀라스의 subsurface로 제공 (게임 중 디스크 I/O 없음)
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = TextureAtlas()
+        return cls._instance
+
+    def __init__(self):
+        if TextureAtlas._instance is not None:
+            raise Exception("This class is a singleton!")
+        TextureAtlas._instance = self
+
+        self.keys = [(tid, rot) for tid in sorted(TILE_DATA) for rot in ROTATIONS]
+        self.uv = {}        # {(tid, rot): pygame.Rect} 아틀라스 내 위치
+        self.textures = {}  # {(tid, rot): subsurface}
+        self.surface = None
+        self.version = self._compute_version()
+        self.name = f"atlas_{self.version}.png"
+        self.cache = asset_cache()
+        self.path = self.cache.path(self.name)
+        self.load()
+
+    def _compute_version(self):
+        """생성 코드 + 타일 목록/색상이 바뀌면 다른 해시 -> 아틀라스 재생성"""
+        h = hashlib.sha1()
+        with open(tiles.__file__, 'rb') as f: h.update(f.read())
+        h.update(repr(sorted((tid, d.get('color')) for tid, d in TILE_DATA.items())).encode())
+        h.update(repr((ATLAS_COLS, TEX_SIZE, ROTATIONS, NOISE_BACKEND)).encode())
+        return h.hexdigest()[:12]
+
+    def _layout(self):
+        self.uv = {}
+        for i, key in enumerate(self.keys):
+            self.uv[key] = pygame.Rect((i % ATLAS_COLS) * TEX_SIZE, (i // ATLAS_COLS) * TEX_SIZE, TEX_SIZE, TEX_SIZE)
+        rows = (len(self.keys) + ATLAS_COLS - 1) // ATLAS_COLS
+        return ATLAS_COLS * TEX_SIZE, max(1, rows) * TEX_SIZE
+
+    def load(self):
+        size = self._layout()
+        surf = None
+        if self.cache.lookup(self.name, self.version):
+            try:
+                surf = pygame.image.load(self.path)
+                if surf.get_size() != size: surf = None
+            except Exception as e:
+                print(f"[Atlas] Failed to load {self.path}: {e}")
+                surf = None
+
+        if surf is None:
+            surf = self.build(size)
+            self.save(surf)
+
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        self.surface = surf
+        self.textures = {key: surf.subsurface(r) for key, r in self.uv.items()}
+
+    def build(self, size, workers=None):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        baked = bake_textures(sorted(TILE_DATA), workers)
+        for tid in sorted(TILE_DATA):
+            base = surface_from_bytes(baked[tid], (TEX_SIZE, TEX_SIZE))
+            for rot in ROTATIONS:
+                img = pygame.transform.rotate(base, rot) if rot else base
+                surf.blit(img, self.uv[(tid, rot)])
+        return surf
+
+    def rebuild(self, workers=None):
+        """캐시를 무시하고 아틀라스를 다시 구워 저장"""
+        surf = self.build(self._layout(), workers)
+        self.save(surf)
+        self.load()
+
+    def save(self, surf):
+        try:
+            pygame.image.save(surf, self.path)
+            # 아틀라스는 용량 정리 대상에서 제외, 이전 버전은 삭제 (인덱스에 없는 옛 파일도 디렉터리에서 찾아서)
+            self.cache.record(self.name, self.version, pinned=True)
+            stale = set(self.cache.names("atlas_"))
+            stale.update(os.path.basename(p) for p in glob.glob(self.cache.path("atlas_*.png")))
+            for name in stale:
+                if name == self.name: continue
+                self.cache.forget(name)
+        except Exception as e:
+            print(f"[Atlas] Failed to save {self.path}: {e}")
+
+    def get(self, tid, rotation=0):
+        """아틀라스 텍스처 (없는 tid/비표준 회전이면 None)"""
+        return self.textures.get((tid, rotation % 360))
+
+if __name__ == "__main__":
+    # bake_textures 명령: python -m world.texture_atlas [workers]
+    import sys, time
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    t0 = time.perf_counter()
+    atlas = TextureAtlas.get_instance()
+    t1 = time.perf_counter()
+    atlas.rebuild(workers)
+    t2 = time.perf_counter()
+    print(f"[Atlas] {len(atlas.keys)} textures -> {atlas.path} (load {(t1-t0)*1000:.1f} ms, bake x{workers} {(t2-t1)*1000:.1f} ms)")
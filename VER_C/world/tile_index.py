@@ -0,0 +1,133 @@
+import random
+import heapq
+from settings import TILE_SIZE
+from world.tiles import get_tile_category
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_MIN_CELLS = 64  # nearest()에서 numpy를 쓰는 최소 후보 칸 수
+
+class CellSet:
+    """(gx, gy) 집합. 리스트 + 위치 dict로 추가/삭제/무작위 선택 모두 O(1)"""
+    __slots__ = ('cells', 'pos', '_arr')
+
+    def __init__(self):
+        self.cells = []   # [(gx, gy)]
+        self.pos = {}     # {(gx, gy): cells 내 인덱스}
+        self._arr = None  # numpy (n, 2) 좌표 (최근접 질의용, 변경 시 무효화)
+
+    def add(self, cell):
+        if cell in self.pos: return
+        self.pos[cell] = len(self.cells); self.cells.append(cell)
+        self._arr = None
+
+    def discard(self, cell):
+        i = self.pos.pop(cell, None)
+        if i is None: return
+        # 마지막 원소를 빈 자리로 옮겨 O(1) 삭제
+        last = self.cells.pop()
+        if i < len(self.cells): self.cells[i] = last; self.pos[last] = i
+        self._arr = None
+
+    def sample(self):
+        return random.choice(self.cells) if self.cells else None
+
+    def array(self):
+        if self._arr is None: self._arr = np.array(self.cells, dtype=np.int32).reshape(-1, 2)
+        return self._arr
+
+    def __contains__(self, cell): return cell in self.pos
+    def __len__(self): return len(self.cells)
+    def __iter__(self): return iter(self.cells)
+
+class TileIndex:
+    """
+    [최적화] 타일 위치 색인: tid -> 칸 집합, 카테고리(tid // 1000000) -> 칸 집합.
+    MapManager.set_tile이 바뀐 칸만 O(1)로 갱신하므로 문 열림/파손, 농사 타일 변경 후에도 항상 최신 상태.
+    """
+    def __init__(self):
+        self.by_tid = {}       # {tid: CellSet}
+        self.by_category = {}  # {category: CellSet}
+
+    def clear(self):
+        self.by_tid = {}; self.by_category = {}
+
+    def add(self, tid, gx, gy):
+        if tid == 0: return
+        cells = self.by_tid.get(tid)
+        if cells is None: cells = self.by_tid[tid] = CellSet()
+        cells.add((gx, gy))
+        cat = get_tile_category(tid)
+        cells = self.by_category.get(cat)
+        if cells is None: cells = self.by_category[cat] = CellSet()
+        cells.add((gx, gy))
+
+    def remove(self, tid, gx, gy, keep_category=False):
+        """keep_category: 같은 칸에 같은 카테고리 타일이 남아 있으면 카테고리 색인은 유지"""
+        if tid == 0: return
+        cells = self.by_tid.get(tid)
+        if cells is not None:
+            cells.discard((gx, gy))
+            if not cells: del self.by_tid[tid]
+        if keep_category: return
+        cat = get_tile_category(tid)
+        cells = self.by_category.get(cat)
+        if cells is not None:
+            cells.discard((gx, gy))
+            if not cells: del self.by_category[cat]
+
+    def cells(self, tid):
+        """tid가 놓인 칸 목록 (읽기 전용)"""
+        cells = self.by_tid.get(tid)
+        return cells.cells if cells is not None else []
+
+    def count(self, tid):
+        cells = self.by_tid.get(tid)
+        return len(cells) if cells is not None else 0
+
+    def sample(self, tids):
+        """tids(단일 tid 또는 목록) 중 한 칸을 칸 수에 비례해 무작위 선택. 없으면 None"""
+        if isinstance(tids, int): tids = (tids,)
+        return self._sample([self.by_tid.get(t) for t in tids])
+
+    def sample_category(self, categories):
+        return self._sample([self.by_category.get(c) for c in categories])
+
+    def _sample(self, sets):
+        sets = [s for s in sets if s]
+        if not sets: return None
+        if len(sets) == 1: return sets[0].sample()
+        r = random.randrange(sum(len(s) for s in sets))
+        for s in sets:
+            if r < len(s): return s.cells[r]
+            r -= len(s)
+        return None
+
+    def nearest(self, tids, px, py, k=None, max_dist=None):
+        """
+        월드 픽셀 (px, py)에서 가까운 순으로 tids 칸 목록 [(gx, gy)].
+        거리는 타일 좌상단 픽셀 기준 (기존 tile_cache 거리 계산과 동일), max_dist(픽셀) 밖은 제외.
+        """
+        if isinstance(tids, int): tids = (tids,)
+        sets = [s for s in (self.by_tid.get(t) for t in tids) if s]
+        if not sets: return []
+        limit = max_dist * max_dist if max_dist is not None else None
+        # 후보가 적으면 배열 변환 비용이 더 커서 파이썬 루프 사용
+        if np is not None and sum(len(s) for s in sets) >= NUMPY_MIN_CELLS:
+            arr = sets[0].array() if len(sets) == 1 else np.concatenate([s.array() for s in sets])
+            dx = arr[:, 0] * TILE_SIZE - px; dy = arr[:, 1] * TILE_SIZE - py
+            d2 = dx * dx + dy * dy
+            idx = np.flatnonzero(d2 <= limit) if limit is not None else np.arange(len(d2))
+            if k is not None and k < len(idx): idx = idx[np.argpartition(d2[idx], k)[:k]]
+            idx = idx[np.argsort(d2[idx], kind='stable')]
+            return list(map(tuple, arr[idx].tolist()))
+        cand = []
+        for s in sets:
+            for gx, gy in s.cells:
+                d2 = (gx * TILE_SIZE - px) ** 2 + (gy * TILE_SIZE - py) ** 2
+                if limit is None or d2 <= limit: cand.append((d2, gx, gy))
+        cand = heapq.nsmallest(k, cand) if k is not None else sorted(cand)
+        return [(gx, gy) for _, gx, gy in cand]
@@ -2,8 +2,15 @@ import pygame
 import random
 import math
 import os
-import glob
 import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from managers.asset_cache import AssetCache, LRUCache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 P = {
     'VOID': (5, 5, 8),
@@ -22,66 +29,66 @@ P = {
     'METAL_BASE': (90, 90, 95), 'METAL_LIGHT': (140, 140, 150), 'METAL_RUST': (110, 60, 50),
 }
 
+# --- 텍스처 생성 난수 ---
+# 타일마다 tid로 시드를 고정해 어느 머신에서든 같은 텍스처가 나오도록 함 (게임 로직의 random과 분리)
+_rng = random.Random()
+NOISE_BACKEND = "numpy" if np is not None else "python"
+
 # --- 캐시 설정 ---
-TEXTURE_CACHE = {}
 CACHE_DIR = "cache_tiles"
 MAX_CACHE_SIZE_MB = 50  # 최대 디스크 캐시 용량 (MB)
-
-if not os.path.exists(CACHE_DIR):
-    os.makedirs(CACHE_DIR)
-
-def cleanup_disk_cache():
-    """디스크 캐시 용량이 한계를 초과하면 오래된 파일부터 삭제"""
-    try:
-        files = glob.glob(os.path.join(CACHE_DIR, "*.png"))
-        total_size = sum(os.path.getsize(f) for f in files)
-        limit_size = MAX_CACHE_SIZE_MB * 1024 * 1024
-
-        if total_size > limit_size:
-            # 수정 시간(mtime) 기준 오름차순 정렬 (오래된 순)
-            files.sort(key=os.path.getmtime)
-            
-            deleted_size = 0
-            for f in files:
-                sz = os.path.getsize(f)
-                try:
-                    os.remove(f)
-                    deleted_size += sz
-                    # 용량이 충분히 확보되면 중단 (여유분 10% 확보)
-                    if total_size - deleted_size < limit_size * 0.9:
-                        break
-                except OSError:
-                    pass
-            print(f"[System] Cache Cleanup: Freed {deleted_size / (1024*1024):.2f} MB")
-    except Exception as e:
-        print(f"[System] Cache Cleanup Error: {e}")
+MAX_MEMORY_TEXTURES = 2048  # 메모리 캐시 최대 텍스처 수 (LRU)
+
+# [최적화] 디스크 전체 스캔(glob/stat/sort) 대신 인덱스 기반 캐시 관리자 사용
+# import 시에는 만들지 않고(로그 파일/정리 쓰레드 비용) 첫 텍스처 조회 때 생성. 용량 초과 정리는 백그라운드 쓰레드에서 지연 수행
+TEXTURE_CACHE = LRUCache(MAX_MEMORY_TEXTURES)
+STARTUP_METRICS = {}  # 디스크 캐시 생성 시 채움 (index_load_ms, entries, ..., init_ms)
+_generator_version = None
+
+def asset_cache():
+    """디스크 텍스처 캐시 (처음 호출할 때 생성)"""
+    if AssetCache._instance is None:
+        t0 = time.perf_counter()
+        cache = AssetCache.get_instance(CACHE_DIR, MAX_CACHE_SIZE_MB)
+        STARTUP_METRICS.update(cache.metrics, init_ms=(time.perf_counter() - t0) * 1000)
+        return cache
+    return AssetCache._instance
+
+def get_generator_version():
+    """텍스처 생성 코드 버전 (이 파일 내용 + 노이즈 백엔드 해시) - 디스크 캐시 유효성 판단용"""
+    global _generator_version
+    if _generator_version is None:
+        h = hashlib.sha1()
+        with open(__file__, 'rb') as f: h.update(f.read())
+        h.update(NOISE_BACKEND.encode())
+        _generator_version = h.hexdigest()[:12]
+    return _generator_version
 
 def clear_memory_cache():
     """메모리(RAM) 캐시 비우기 - 맵 변경 시 호출 권장"""
     TEXTURE_CACHE.clear()
 
-# 모듈 로드 시 한 번 실행하여 디스크 용량 관리
-cleanup_disk_cache()
-
 def get_texture(tid, rotation=0):
     """캐시된 텍스처를 반환하거나 생성하여 저장 (Disk Cache 적용)"""
     key = (tid, rotation)
 
-    # 1. 메모리 캐시 확인
-    if key in TEXTURE_CACHE:
-        return TEXTURE_CACHE[key]
+    # 1. 메모리 캐시 확인 (LRU)
+    surf = TEXTURE_CACHE.lookup(key)
+    if surf is not None:
+        return surf
 
-    # 2. 디스크 캐시 확인
-    filename = os.path.join(CACHE_DIR, f"tile_{tid}_{rotation}.png")
-    if os.path.exists(filename):
+    # 2. 디스크 캐시 확인 (인덱스 조회, 버전이 다르면 미스)
+    name = f"tile_{tid}_{rotation}.png"
+    cache = asset_cache()
+    filename = cache.lookup(name, get_generator_version())
+    if filename:
         try:
             surf = pygame.image.load(filename).convert_alpha()
             TEXTURE_CACHE[key] = surf
             return surf
         except Exception as e:
             # 파일 손상 시 삭제 후 재생성
-            try: os.remove(filename)
-            except: pass
+            cache.forget(name)
 
     # 3. 텍스처 신규 생성
     surf = create_texture(tid)
@@ -91,7 +98,8 @@ def get_texture(tid, rotation=0):
 
     # 생성된 텍스처를 디스크에 저장
     try:
-        pygame.image.save(surf, filename)
+        pygame.image.save(surf, cache.path(name))
+        cache.record(name, get_generator_version())
     except Exception as e:
         print(f"Error saving cache for {tid}: {e}")
 
@@ -117,13 +125,24 @@ def blend(c1, c2, r):
     return (int(c1[0]*(1-r)+c2[0]*r), int(c1[1]*(1-r)+c2[1]*r), int(c1[2]*(1-r)+c2[2]*r))
 
 def noise_color(color, intensity=15):
-    var = random.randint(-intensity, intensity)
+    var = _rng.randint(-intensity, intensity)
     return (max(0, min(255, color[0]+var)), max(0, min(255, color[1]+var)), max(0, min(255, color[2]+var)))
 
 def draw_pro_noise(surf, color, intensity=20):
     surf.fill(color)
+    if np is not None:
+        # [최적화] 노이즈 점 150개를 set_at 루프 대신 surfarray로 한 번에 기록
+        g = np.random.default_rng(_rng.getrandbits(32))
+        xs, ys = g.integers(0, 32, 150), g.integers(0, 32, 150)
+        var = g.integers(-intensity, intensity + 1, 150)
+        rgb = pygame.surfarray.pixels3d(surf)
+        rgb[xs, ys] = np.clip(np.array(color[:3], dtype=np.int32)[None, :] + var[:, None], 0, 255)
+        del rgb
+        if surf.get_flags() & pygame.SRCALPHA:
+            alpha = pygame.surfarray.pixels_alpha(surf); alpha[xs, ys] = 255; del alpha
+        return
     for _ in range(150):
-        x, y = random.randint(0, 31), random.randint(0, 31)
+        x, y = _rng.randint(0, 31), _rng.randint(0, 31)
         pixel(surf, noise_color(color, intensity), (x, y))
 
 def draw_pixel_bevel(surf, rect_obj, base_col, light_col, dark_col, thickness=1):
@@ -155,7 +174,7 @@ def draw_grass_detailed(surf, base_col):
     fill(surf, base_col)
     light, shadow = P['GRASS_LIGHT'], P['GRASS_SHADOW']
     for _ in range(15):
-        cx, cy = random.randint(2, 28), random.randint(2, 28)
+        cx, cy = _rng.randint(2, 28), _rng.randint(2, 28)
         line(surf, shadow, (cx, cy), (cx, cy+3), 1)
         pixel(surf, light, (cx-1, cy-1))
         pixel(surf, light, (cx+1, cy-1))
@@ -167,14 +186,14 @@ def draw_10001(s):
 def draw_10002(s):
     fill(s, P['GRASS_BASE'])
     for _ in range(15):
-        cx, cy = random.randint(2, 28), random.randint(2, 28)
+        cx, cy = _rng.randint(2, 28), _rng.randint(2, 28)
         line(s, P['GRASS_SHADOW'], (cx, cy), (cx, cy+3))
         pixel(s, P['GRASS_LIGHT'], (cx-1, cy-1))
 
 def draw_10003(s):
     draw_pro_noise(s, P['GREY_M'], 10)
     for _ in range(15):
-        circle(s, P['GREY_D'], (random.randint(4,27), random.randint(4,27)), 2)
+        circle(s, P['GREY_D'], (_rng.randint(4,27), _rng.randint(4,27)), 2)
 
 def draw_10004(s):
     draw_pro_noise(s, P['SAND_BASE'], 10)
@@ -190,12 +209,12 @@ def draw_10005(s):
 def draw_10006(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 40)
     for _ in range(3):
-        circle(s, P['BLACK'], (random.randint(5,25), random.randint(5,25)), 4)
+        circle(s, P['BLACK'], (_rng.randint(5,25), _rng.randint(5,25)), 4)
 
 def draw_10007(s):
     draw_pro_noise(s, P['STONE_BASE'], 20)
     for _ in range(6):
-        circle(s, P['GREEN'], (random.randint(4,27), random.randint(4,27)), random.randint(3,6))
+        circle(s, P['GREEN'], (_rng.randint(4,27), _rng.randint(4,27)), _rng.randint(3,6))
 
 def draw_10008(s):
     draw_pro_noise(s, P['WOOD_LIGHT'], 15)
@@ -210,7 +229,7 @@ def draw_10009(s):
 def draw_10010(s):
     draw_pro_noise(s, P['WHITE'], 5)
     for _ in range(3):
-        line(s, P['GREY_L'], (random.randint(0,31), 0), (random.randint(0,31), 31))
+        line(s, P['GREY_L'], (_rng.randint(0,31), 0), (_rng.randint(0,31), 31))
 
 def draw_10011(s):
     for y in range(0, 32, 16):
@@ -237,7 +256,7 @@ def draw_10014(s):
 def draw_10015(s):
     draw_pro_noise(s, P['ASPHALT'], 30)
     for _ in range(20):
-        pixel(s, P['GREY_L'], (random.randint(0,31), random.randint(0,31)))
+        pixel(s, P['GREY_L'], (_rng.randint(0,31), _rng.randint(0,31)))
 
 def draw_10016(s):
     draw_pro_noise(s, P['ASPHALT'], 20)
@@ -272,9 +291,9 @@ def draw_11001(s):
 def draw_11002(s):
     fill(s, P['RED'])
     for _ in range(5):
-        circle(s, P['ORANGE'], (random.randint(4, 27), random.randint(4, 27)), 5)
+        circle(s, P['ORANGE'], (_rng.randint(4, 27), _rng.randint(4, 27)), 5)
     for _ in range(3):
-        pixel(s, P['BLACK'], (random.randint(0, 31), random.randint(0, 31)))
+        pixel(s, P['BLACK'], (_rng.randint(0, 31), _rng.randint(0, 31)))
 
 def draw_11003(s):
     fill(s, P['BROWN_D'])
@@ -301,7 +320,7 @@ def draw_21003(s):
             r_obj = pygame.Rect(x + 1, y + 1, 14, 6)
             draw_pixel_bevel(s, r_obj, P['STONE_BASE'], P['STONE_LIGHT'], P['STONE_SHADOW'])
     for _ in range(4):
-        circle(s, blend(P['GREEN'], P['BLACK'], 0.2), (random.randint(5, 25), random.randint(5, 25)), random.randint(4, 7))
+        circle(s, blend(P['GREEN'], P['BLACK'], 0.2), (_rng.randint(5, 25), _rng.randint(5, 25)), _rng.randint(4, 7))
 
 def draw_21004(s):
     dark = blend(P['WOOD_BASE'], P['BLACK'], 0.3)
@@ -339,7 +358,7 @@ def draw_21009(s):
 def draw_21010(s):
     draw_pro_noise(s, P['METAL_BASE'], 10)
     for _ in range(12):
-        circle(s, P['METAL_RUST'], (random.randint(0, 31), random.randint(0, 31)), random.randint(2, 4))
+        circle(s, P['METAL_RUST'], (_rng.randint(0, 31), _rng.randint(0, 31)), _rng.randint(2, 4))
 
 def draw_21011(s):
     fill(s, (150, 200, 255, 100))
@@ -358,8 +377,8 @@ def draw_21013(s):
     for y in [6, 16, 26]:
         rect(s, P['BLACK'], (2, y, 28, 2))
         for x in range(4, 28, 4):
-            if random.random() > 0.3:
-                rect(s, random.choice([P['RED'], P['BLUE'], P['WHITE']]), (x, y-4, 3, 4))
+            if _rng.random() > 0.3:
+                rect(s, _rng.choice([P['RED'], P['BLUE'], P['WHITE']]), (x, y-4, 3, 4))
 
 def draw_21014(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 40)
@@ -425,7 +444,7 @@ def draw_40102(s):
 def draw_40103(s):
     fill(s, (200, 200, 200, 80))
     for _ in range(3):
-        circle(s, (255, 255, 255, 40), (random.randint(8, 24), random.randint(8, 24)), 8)
+        circle(s, (255, 255, 255, 40), (_rng.randint(8, 24), _rng.randint(8, 24)), 8)
 
 def draw_40104(s):
     fill(s, (0, 0, 0, 0))
@@ -448,7 +467,7 @@ def draw_40002(s): draw_flower(s, P['YELLOW'])
 def draw_40003(s):
     fill(s, (0, 0, 0, 0))
     for _ in range(3):
-        line(s, P['GREEN'], (16, 31), (random.randint(10, 22), 10), 2)
+        line(s, P['GREEN'], (16, 31), (_rng.randint(10, 22), 10), 2)
 
 def draw_40004(s):
     fill(s, (0, 0, 0, 0))
@@ -571,12 +590,12 @@ def draw_51008(s):
 def draw_51301(s):
     draw_pro_noise(s, P['STONE_SHADOW'], 20)
     for _ in range(4):
-        circle(s, P['METAL_LIGHT'], (random.randint(8, 24), random.randint(8, 24)), 4)
+        circle(s, P['METAL_LIGHT'], (_rng.randint(8, 24), _rng.randint(8, 24)), 4)
 
 def draw_51302(s):
     fill(s, (0, 0, 0, 0))
     for _ in range(6):
-        pts_list = [(random.randint(0, 31), random.randint(0, 31)) for _ in range(3)]
+        pts_list = [(_rng.randint(0, 31), _rng.randint(0, 31)) for _ in range(3)]
         poly(s, P['GREY_M'], pts_list)
 
 def draw_51303(s):
@@ -641,7 +660,7 @@ def draw_61005(s):
 def draw_60001(s):
     fill(s, (0, 0, 0, 0))
     for _ in range(5):
-        circle(s, (100, 50, 200, 100), (16, 16), random.randint(5, 15))
+        circle(s, (100, 50, 200, 100), (16, 16), _rng.randint(5, 15))
 
 def draw_60002(s):
     fill(s, (0, 0, 0, 0))
@@ -653,6 +672,7 @@ def draw_60003(s):
         poly(s, P['GREY_L'], [(x, 31), (x-4, 16), (x+4, 16)])
 
 def create_texture(tid):
+    _rng.seed(tid) # 결정적 생성
     s = pygame.Surface((32, 32), pygame.SRCALPHA)
     if tid not in TILE_DATA:
         fill(s, (255, 0, 255)); return s
@@ -758,6 +778,27 @@ def create_texture(tid):
         draw_pro_noise(s, col, 20)
     return s
 
+# pygame 2.1.3 미만 호환
+_to_bytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+_from_bytes = getattr(pygame.image, 'frombytes', None) or pygame.image.fromstring
+
+def _bake_worker(tid):
+    return tid, _to_bytes(create_texture(tid), 'RGBA')
+
+def bake_textures(tids=None, workers=None):
+    """
+    타일 텍스처를 일괄 생성하여 {tid: RGBA 바이트} 반환.
+    workers > 1이면 프로세스 풀에서 병렬 생성 (생성이 결정적이므로 결과는 직렬과 동일)
+    """
+    tids = sorted(TILE_DATA) if tids is None else list(tids)
+    if workers is None or workers <= 1:
+        return dict(_bake_worker(tid) for tid in tids)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return dict(ex.map(_bake_worker, tids, chunksize=max(1, len(tids) // (workers * 4))))
+
+def surface_from_bytes(buf, size=(32, 32)):
+    return _from_bytes(buf, size, 'RGBA')
+
 TILE_DATA = {
     1110000: {'name': 'Dirt Floor (흙 바닥)', 'color': P['DIRT_BASE']},
     1110001: {'name': 'Grass Floor (풀 바닥)', 'color': P['GRASS_BASE']},